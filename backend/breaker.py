@@ -0,0 +1,133 @@
+"""
+Circuit Breaker for ADUmedia Website
+
+Stops calling a dependency (Supabase) that keeps failing or timing out,
+so requests fail fast instead of each waiting for a timeout while the
+worker fills up.
+
+    closed      calls go through; consecutive failures are counted
+    open        calls fail immediately with CircuitOpenError
+    half-open   after reset_seconds, one trial call is let through;
+                success closes the circuit, failure opens it again
+
+Routes turn DependencyUnavailable into the last good cached payload
+(http_cache.get_last_good) or a fast 503.
+"""
+
+import os
+import time
+from typing import Any, Dict
+
+
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "15"))
+
+
+class DependencyUnavailable(Exception):
+    """A dependency failed, timed out, or its circuit is open."""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(DependencyUnavailable):
+    """The call was rejected without trying because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Callers use before_call() and then exactly one of record_success(),
+    record_failure() or abandon() around each call to the dependency.
+
+    Args:
+        name: Dependency name used in log lines, errors and stats
+        failure_threshold: Consecutive failures that open the circuit
+        reset_seconds: Time the circuit stays open before a trial call
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+        self.rejected = 0
+        self.total_failures = 0
+        self.times_opened = 0
+
+    def retry_after(self) -> float:
+        """Seconds until the next trial call is allowed (0 if not open)."""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - time.monotonic())
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go ahead.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or half-open with a
+                trial call already running)
+        """
+        if self.state == "open" and self.retry_after() == 0.0:
+            self.state = "half-open"
+
+        if self.state == "open" or (self.state == "half-open" and self._trial_running):
+            self.rejected += 1
+            raise CircuitOpenError(
+                f"{self.name} unavailable (circuit open)",
+                retry_after=max(1.0, self.retry_after()),
+            )
+
+        if self.state == "half-open":
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        """Record a successful call (closes a half-open circuit)."""
+        if self.state != "closed":
+            print(f"[BREAKER] {self.name}: recovered, circuit closed")
+        self.state = "closed"
+        self._failures = 0
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Record a failed call (may open the circuit)."""
+        self.total_failures += 1
+        self._failures += 1
+        self._trial_running = False
+
+        if self.state == "half-open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+                print(f"[BREAKER] {self.name}: {self._failures} consecutive failures, "
+                      f"circuit open for {self.reset_seconds:.0f}s")
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def abandon(self) -> None:
+        """Record a call that ended without a verdict (e.g. cancelled)."""
+        self._trial_running = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state and counters."""
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 1),
+            "times_opened": self.times_opened,
+            "total_failures": self.total_failures,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,148 @@
+"""
+In-Process Cache for ADUmedia Website
+
+Bounded TTL + LRU cache used to keep hot Supabase rows in memory.
+Entries can carry tags so that a single row change (an edition or an
+article) invalidates exactly the entries that were built from it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+# Sentinel returned on a cache miss (None is a valid cached value)
+MISS = object()
+
+# Every cache created, for /metrics
+_caches: List["TTLCache"] = []
+
+
+def all_caches() -> List["TTLCache"]:
+    """Every TTLCache instance in the process."""
+    return list(_caches)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry expiry and tag invalidation.
+
+    Args:
+        name: Name used in log lines and stats
+        max_entries: Maximum number of entries before LRU eviction
+        ttl_seconds: Default time-to-live for new entries
+    """
+
+    def __init__(self, name: str, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        _caches.append(self)
+
+    def get(self, key: Hashable, default: Any = MISS) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store (None is allowed)
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+            tags: Tags used for invalidation (e.g. "article:<uuid>")
+        """
+        tags = tuple(tags)
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl is None else ttl)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (expires_at, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove a single key. Returns True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove every entry carrying tag. Returns the number removed."""
+        with self._lock:
+            keys = self._tags.pop(tag, set())
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove key and its tag references. Caller must hold the lock."""
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,40 +3,535 @@
 Supabase Database Client for ADUmedia Website
 
 Handles all database operations for the website API.
+
+All query functions are async and share one pooled async Supabase client,
+so they never block the event loop. The synchronous client (get_client)
+is kept for scripts and worker threads.
 """
 
+import asyncio
+import functools
 import os
-from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, Any
-from supabase import create_client, Client
+import time
+from contextvars import ContextVar
+from datetime import date
+from typing import Optional, List, Dict, Any, Callable, Tuple, Union
+
+import httpx
+from supabase import create_client, Client, acreate_client, AsyncClient, AsyncClientOptions
+
+from breaker import CircuitBreaker, CircuitOpenError, DependencyUnavailable
+from cache import TTLCache, MISS
+from edition_index import EditionIndex
+from metrics import Counter, Histogram
+from records import ArticleRecord, article_records, edition_record, edition_records
 
 
-# Global client instance
+# Global client instances
 _client: Optional[Client] = None
+_async_client: Optional[AsyncClient] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+_async_client_lock: Optional[asyncio.Lock] = None
+
+# Connection pool for the async client (shared by every request)
+DB_POOL_MAX_CONNECTIONS = int(os.getenv("DB_POOL_MAX_CONNECTIONS", "50"))
+DB_POOL_MAX_KEEPALIVE = int(os.getenv("DB_POOL_MAX_KEEPALIVE", "20"))
+DB_TIMEOUT_SECONDS = float(os.getenv("DB_TIMEOUT_SECONDS", "5"))
+DB_CONNECT_TIMEOUT_SECONDS = float(os.getenv("DB_CONNECT_TIMEOUT_SECONDS", "2"))
+
+# Every async Supabase call goes through this breaker (see _BreakerTransport)
+supabase_breaker = CircuitBreaker("supabase")
+
+# Gateway responses that mean Supabase itself is down or overloaded
+_OUTAGE_STATUS_CODES = frozenset({502, 503, 504, 520, 521, 522, 523, 524})
+
+# Supabase calls per database.py function (set by @_metered)
+SUPABASE_CALLS = Counter(
+    "adu_supabase_calls_total", "Supabase HTTP calls by database function and outcome", ("function", "outcome")
+)
+SUPABASE_CALL_SECONDS = Histogram(
+    "adu_supabase_call_seconds", "Supabase HTTP call latency by database function", ("function",)
+)
+_current_function: ContextVar[str] = ContextVar("supabase_function", default="other")
+
+
+def _metered(fn: Callable) -> Callable:
+    """Label the Supabase calls made while fn runs with its name (for /metrics)."""
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        token = _current_function.set(name)
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            _current_function.reset(token)
+
+    return wrapper
+
+
+def _get_credentials() -> tuple:
+    """Read Supabase URL and key from the environment."""
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_ANON_KEY")
+    
+    if not url or not key:
+        raise ValueError("Supabase credentials not configured")
+    
+    return url, key
 
 
 def get_client() -> Client:
-    """Get or create Supabase client."""
+    """
+    Get or create the synchronous Supabase client.
+
+    Only for scripts and worker threads (e.g. typesense_sync.full_reindex).
+    Request handlers must use get_async_client().
+    """
     global _client
     
     if _client is None:
-        url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_ANON_KEY")
-        
-        if not url or not key:
-            raise ValueError("Supabase credentials not configured")
-        
+        url, key = _get_credentials()
         _client = create_client(url, key)
         print("[DB] Connected to Supabase")
     
     return _client
 
 
+class _BreakerTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that sends Supabase calls through supabase_breaker.
+
+    Connection errors, timeouts and gateway errors count as failures and
+    raise DependencyUnavailable; while the circuit is open calls fail
+    immediately. Other responses (including 4xx) are passed through.
+
+    Also records the call count and latency metrics.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        function = _current_function.get()
+        try:
+            supabase_breaker.before_call()
+        except CircuitOpenError:
+            SUPABASE_CALLS.inc(function, "rejected")
+            raise
+
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                supabase_breaker.record_failure()
+                raise DependencyUnavailable(f"Supabase request failed: {e!r}") from e
+            except BaseException:
+                # Cancelled (client went away) or a bug: no verdict on Supabase
+                supabase_breaker.abandon()
+                raise
+
+            outcome = f"{response.status_code // 100}xx"
+            if response.status_code in _OUTAGE_STATUS_CODES:
+                await response.aclose()
+                supabase_breaker.record_failure()
+                raise DependencyUnavailable(f"Supabase returned {response.status_code}")
+
+            supabase_breaker.record_success()
+            return response
+        finally:
+            SUPABASE_CALLS.inc(function, outcome)
+            SUPABASE_CALL_SECONDS.observe(time.perf_counter() - started, function)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+async def get_async_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client.
+
+    Backed by a single pooled keep-alive httpx client, so concurrent
+    requests reuse open connections to Supabase, and guarded by
+    supabase_breaker (calls raise DependencyUnavailable during an outage).
+    """
+    global _async_client, _async_http_client, _async_client_lock
+    
+    if _async_client is not None:
+        return _async_client
+    
+    if _async_client_lock is None:
+        _async_client_lock = asyncio.Lock()
+    
+    async with _async_client_lock:
+        if _async_client is None:
+            url, key = _get_credentials()
+            _async_http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(DB_TIMEOUT_SECONDS, connect=DB_CONNECT_TIMEOUT_SECONDS),
+                transport=_BreakerTransport(httpx.AsyncHTTPTransport(
+                    limits=httpx.Limits(
+                        max_connections=DB_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=DB_POOL_MAX_KEEPALIVE,
+                    ),
+                )),
+                follow_redirects=True,
+            )
+            _async_client = await acreate_client(
+                url,
+                key,
+                options=AsyncClientOptions(httpx_client=_async_http_client),
+            )
+            print("[DB] Connected to Supabase (async)")
+    
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the async client's connection pool (on shutdown)."""
+    global _async_client, _async_http_client
+    
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+    _async_client = None
+    _async_http_client = None
+
+
+# =============================================================================
+# Article Projections
+# =============================================================================
+
+# Columns each consumer reads from all_articles. Only columns the code uses
+# are listed, so the rest of the row (raw content, etc.) stays in Postgres.
+_TITLE_COLUMNS = ("id", "slug", "headline_line_1", "headline", "original_title")
+
+_CARD_COLUMNS = _TITLE_COLUMNS + (
+    "headline_line_2",
+    "source_id",
+    "source_name",
+    "article_url",
+    "ai_summary",
+    "r2_image_path",
+    "image_key",
+    "r2_thumbnail_path",
+    "tags",
+    "selection_category",
+    "is_studio",
+    "headline_translations",
+    "headline_line_1_translations",
+    "headline_line_2_translations",
+    "ai_summary_translations",
+    "original_publish_date",
+)
+
+ARTICLE_PROJECTIONS: Dict[str, Tuple[str, ...]] = {
+    # Slugs and sitemaps
+    "title": _TITLE_COLUMNS,
+    # Digest and list views
+    "card": _CARD_COLUMNS,
+    # Article page
+    "detail": _CARD_COLUMNS,
+    # Typesense documents
+    "index": _CARD_COLUMNS + ("fetch_date", "created_at"),
+    # Admin article editor
+    "admin": _CARD_COLUMNS + ("status", "fetch_date", "project_id", "editor_notes"),
+}
+
+_PROJECTION_SELECT = {name: ", ".join(cols) for name, cols in ARTICLE_PROJECTIONS.items()}
+_PROJECTION_SETS = {name: frozenset(cols) for name, cols in ARTICLE_PROJECTIONS.items()}
+
+# Same lists without all_articles.slug, for databases without sql/article_slugs.sql
+_PROJECTION_SELECT_NO_SLUG = {
+    name: ", ".join(c for c in cols if c != "slug") for name, cols in ARTICLE_PROJECTIONS.items()
+}
+
+# Set to False once we learn the slug column is not deployed
+_slug_column_available = True
+
+
+def article_columns(projection: str) -> str:
+    """
+    Get the select() column list for an article projection.
+
+    Raises:
+        ValueError: If the projection is unknown
+    """
+    selects = _PROJECTION_SELECT if _slug_column_available else _PROJECTION_SELECT_NO_SLUG
+    try:
+        return selects[projection]
+    except KeyError:
+        raise ValueError(f"Unknown article projection: {projection}") from None
+
+
+def _covers(have: str, want: str) -> bool:
+    """True if rows fetched with projection have can serve projection want."""
+    return _PROJECTION_SETS[want] <= _PROJECTION_SETS[have]
+
+
+def _is_missing_slug_column(error: Exception) -> bool:
+    """True if a PostgREST error says all_articles.slug does not exist."""
+    message = str(error)
+    return "42703" in message and "slug" in message
+
+
+def _retry_without_slug(error: Exception) -> bool:
+    """
+    Stop selecting all_articles.slug if error says the column is missing.
+
+    Returns:
+        True if the select should be retried (without the slug column)
+    """
+    global _slug_column_available
+
+    if not (_slug_column_available and _is_missing_slug_column(error)):
+        return False
+    # Migration not applied yet - generate slugs until restart
+    _slug_column_available = False
+    print("[DB] all_articles.slug missing (apply sql/article_slugs.sql); using generated slugs")
+    return True
+
+
+async def _select_articles(
+    projection: str,
+    build: Callable[[Any], Any],
+) -> List[ArticleRecord]:
+    """
+    Run a select on all_articles with a projection's columns.
+
+    Args:
+        projection: Column set to fetch (see ARTICLE_PROJECTIONS)
+        build: Adds filters to the select query, e.g. lambda q: q.eq("id", x)
+
+    Returns:
+        Matching rows as records (see records.py)
+    """
+    client = await get_async_client()
+
+    try:
+        result = await build(client.table("all_articles").select(article_columns(projection))).execute()
+    except Exception as e:
+        if not _retry_without_slug(e):
+            raise
+        result = await build(client.table("all_articles").select(article_columns(projection))).execute()
+
+    return article_records(result.data or [], projection)
+
+
+def select_article_rows(
+    projection: str,
+    build: Callable[[Any], Any],
+) -> List[Dict[str, Any]]:
+    """
+    Synchronous _select_articles for scripts and worker threads.
+
+    Args:
+        projection: Column set to fetch (see ARTICLE_PROJECTIONS)
+        build: Adds filters to the select query, e.g. lambda q: q.eq("id", x)
+
+    Returns:
+        Matching rows as dicts
+    """
+    client = get_client()
+
+    try:
+        result = build(client.table("all_articles").select(article_columns(projection))).execute()
+    except Exception as e:
+        if not _retry_without_slug(e):
+            raise
+        result = build(client.table("all_articles").select(article_columns(projection))).execute()
+
+    return result.data or []
+
+
+# =============================================================================
+# Read-Through Cache
+# =============================================================================
+
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("CACHE_NEGATIVE_TTL_SECONDS", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "2048"))
+
+# Edition records keyed by ("date", iso) / ("latest",), adjacency keyed by ("adjacent", iso)
+_edition_cache = TTLCache("editions", max_entries=CACHE_MAX_ENTRIES, ttl_seconds=CACHE_TTL_SECONDS)
+
+# Article records (which know their projection) keyed by article UUID string
+_article_cache = TTLCache("articles", max_entries=CACHE_MAX_ENTRIES * 8, ttl_seconds=CACHE_TTL_SECONDS)
+
+
+def _edition_tags(edition: Optional[Dict[str, Any]], edition_date: str) -> List[str]:
+    """Build invalidation tags for a cached edition row."""
+    tags = [f"date:{edition_date}"]
+    if edition and edition.get("id"):
+        tags.append(f"edition:{edition['id']}")
+    return tags
+
+
+# Callbacks notified when an edition/article row changes (derived caches)
+_edition_listeners: List[Callable[[Optional[str], Optional[str]], None]] = []
+_article_listeners: List[Callable[[str], None]] = []
+
+
+def on_edition_change(callback: Callable[[Optional[str], Optional[str]], None]) -> None:
+    """Register callback(edition_id, edition_date) for edition invalidations."""
+    _edition_listeners.append(callback)
+
+
+def on_article_change(callback: Callable[[str], None]) -> None:
+    """Register callback(article_id) for article invalidations."""
+    _article_listeners.append(callback)
+
+
+def _notify(listeners: List[Callable], *args) -> None:
+    """Call listeners, logging (not raising) their errors."""
+    for callback in listeners:
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"[DB] Invalidation listener {callback.__name__} failed: {e}")
+
+
+def invalidate_edition(
+    edition_id: Optional[str] = None,
+    edition_date: Optional[str] = None,
+) -> None:
+    """
+    Drop cached entries for an edition.
+
+    Also drops the cached latest edition and all adjacency lookups, since
+    inserting or moving an edition can change both.
+
+    Args:
+        edition_id: UUID of the edition
+        edition_date: ISO date of the edition
+    """
+    if edition_id:
+        _edition_cache.invalidate_tag(f"edition:{edition_id}")
+    if edition_date:
+        _edition_cache.invalidate_tag(f"date:{edition_date}")
+    _edition_cache.invalidate_tag("latest")
+    _edition_cache.invalidate_tag("adjacent")
+    _notify(_edition_listeners, edition_id, edition_date)
+
+
+def invalidate_article(article_id: str) -> None:
+    """Drop the cached row for an article."""
+    if article_id:
+        _article_cache.invalidate(str(article_id))
+        _notify(_article_listeners, str(article_id))
+
+
+def _get_cached_article(article_id: str, projection: str) -> Any:
+    """Cached article record if it was fetched with a covering projection, else MISS."""
+    article = _article_cache.get(article_id)
+    if article is MISS or not _covers(article.projection, projection):
+        return MISS
+    return article
+
+
+def _set_cached_article(article: ArticleRecord) -> None:
+    """Cache an article record."""
+    _article_cache.set(article.id, article)
+
+
+def clear_cache() -> None:
+    """Drop every cached edition and article."""
+    _edition_cache.clear()
+    _article_cache.clear()
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """Return stats for each data-layer cache."""
+    return [_edition_cache.stats(), _article_cache.stats()]
+
+
+# =============================================================================
+# Edition Index
+# =============================================================================
+
+EDITION_INDEX_REFRESH_SECONDS = float(os.getenv("EDITION_INDEX_REFRESH_SECONDS", "900"))
+
+# Sorted (edition_date, edition_type, id) for every edition; unused until loaded
+_edition_index = EditionIndex()
+
+
+def get_edition_index() -> EditionIndex:
+    """Get the in-memory edition index."""
+    return _edition_index
+
+
+@_metered
+async def load_edition_index() -> int:
+    """
+    Load (or reload) the edition index from Supabase.
+
+    Returns:
+        Number of editions indexed
+    """
+    client = await get_async_client()
+    
+    rows = []
+    batch_size = 1000
+    offset = 0
+    
+    while True:
+        result = await client.table("editions")\
+            .select("id, edition_date, edition_type")\
+            .order("edition_date", desc=False)\
+            .range(offset, offset + batch_size - 1)\
+            .execute()
+        
+        batch = result.data or []
+        rows.extend(batch)
+        
+        if len(batch) < batch_size:
+            break
+        offset += batch_size
+    
+    _edition_index.load(rows)
+    print(f"[DB] Edition index loaded: {len(_edition_index)} editions")
+    return len(_edition_index)
+
+
+async def edition_index_refresher(interval: float = EDITION_INDEX_REFRESH_SECONDS) -> None:
+    """Periodically reload the edition index (catches missed webhooks)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_edition_index()
+        except Exception as e:
+            print(f"[DB] Edition index refresh failed: {e}")
+
+
+def apply_edition_change(
+    event_type: str,
+    record: Optional[Dict[str, Any]],
+    old_record: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Apply an INSERT/UPDATE/DELETE on the editions table to caches and index.
+
+    Args:
+        event_type: INSERT, UPDATE or DELETE
+        record: New row (None for DELETE)
+        old_record: Previous row (UPDATE/DELETE)
+    """
+    for row in (record, old_record):
+        if row:
+            invalidate_edition(str(row.get("id") or ""), row.get("edition_date"))
+    
+    if old_record and old_record.get("edition_date"):
+        _edition_index.remove(old_record["edition_date"])
+    if record and event_type != "DELETE":
+        _edition_index.add(record)
+
+
 # =============================================================================
 # Editions
 # =============================================================================
 
-def get_editions(
+@_metered
+async def get_editions(
     limit: int = 20,
     offset: int = 0,
     edition_type: Optional[str] = None,
@@ -52,7 +547,11 @@ def get_editions(
     Returns:
         List of edition records
     """
-    client = get_client()
+    if _edition_index.loaded:
+        entries = _edition_index.page(limit, offset, edition_type)
+        return await get_editions_by_dates([e[0] for e in entries])
+
+    client = await get_async_client()
     
     query = client.table("editions")\
         .select("*")\
@@ -62,11 +561,98 @@ def get_editions(
     if edition_type:
         query = query.eq("edition_type", edition_type)
     
-    result = query.execute()
-    return result.data or []
+    result = await query.execute()
+    return edition_records(result.data or [])
 
 
-def get_edition_by_date(edition_date: date) -> Optional[Dict[str, Any]]:
+@_metered
+async def get_editions_by_dates(edition_dates: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get editions for a list of ISO dates, preserving order.
+
+    Cached rows are reused; the rest are fetched in one query.
+    """
+    editions_map = {}
+    missing = []
+    for iso_date in edition_dates:
+        cached = _edition_cache.get(("date", iso_date))
+        if cached is MISS:
+            missing.append(iso_date)
+        elif cached is not None:
+            editions_map[iso_date] = cached
+
+    if missing:
+        client = await get_async_client()
+        
+        result = await client.table("editions")\
+            .select("*")\
+            .in_("edition_date", missing)\
+            .execute()
+        
+        for edition in edition_records(result.data or []):
+            iso_date = edition["edition_date"]
+            editions_map[iso_date] = edition
+            _edition_cache.set(("date", iso_date), edition, tags=_edition_tags(edition, iso_date))
+
+    return [editions_map[d] for d in edition_dates if d in editions_map]
+
+
+@_metered
+async def get_editions_between(start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    """
+    Get all editions with start_date <= edition_date < end_date, oldest first.
+    """
+    if _edition_index.loaded:
+        dates = [
+            d for d in _edition_index.dates()
+            if start_date.isoformat() <= d < end_date.isoformat()
+        ]
+        return await get_editions_by_dates(dates)
+
+    client = await get_async_client()
+    
+    result = await client.table("editions")\
+        .select("*")\
+        .gte("edition_date", start_date.isoformat())\
+        .lt("edition_date", end_date.isoformat())\
+        .order("edition_date", desc=False)\
+        .execute()
+    
+    return edition_records(result.data or [])
+
+
+@_metered
+async def get_all_edition_article_ids() -> List[Dict[str, Any]]:
+    """
+    Get edition_date and article_ids for every edition, oldest first.
+
+    Used to build indexes over all published articles.
+    """
+    client = await get_async_client()
+    
+    rows = []
+    batch_size = 1000
+    offset = 0
+    
+    while True:
+        result = await client.table("editions")\
+            .select("edition_date, article_ids")\
+            .order("edition_date", desc=False)\
+            .range(offset, offset + batch_size - 1)\
+            .execute()
+        
+        batch = result.data or []
+        rows.extend(batch)
+        
+        if len(batch) < batch_size:
+            break
+        offset += batch_size
+    
+    return rows
+
+
+@_metered
+async def get_edition_by_date(edition_date: date) -> Optional[Dict[str, Any]]:
     """
     Get edition for a specific date.
     
@@ -76,63 +662,291 @@ def get_edition_by_date(edition_date: date) -> Optional[Dict[str, Any]]:
     Returns:
         Edition record or None
     """
-    client = get_client()
+    iso_date = edition_date.isoformat()
+    key = ("date", iso_date)
+
+    cached = _edition_cache.get(key)
+    if cached is not MISS:
+        return cached
+
+    # The index knows every edition date, so misses need no query
+    if _edition_index.loaded and iso_date not in _edition_index:
+        return None
+
+    client = await get_async_client()
     
-    result = client.table("editions")\
+    result = await client.table("editions")\
         .select("*")\
-        .eq("edition_date", edition_date.isoformat())\
+        .eq("edition_date", iso_date)\
         .limit(1)\
         .execute()
     
-    return result.data[0] if result.data else None
+    edition = edition_record(result.data[0]) if result.data else None
 
+    # Missing dates (e.g. today before publish) are cached briefly
+    ttl = None if edition else CACHE_NEGATIVE_TTL_SECONDS
+    _edition_cache.set(key, edition, ttl=ttl, tags=_edition_tags(edition, iso_date))
+    return edition
 
-def get_today_edition() -> Optional[Dict[str, Any]]:
+
+async def get_today_edition() -> Optional[Dict[str, Any]]:
     """Get today's edition."""
-    return get_edition_by_date(date.today())
+    return await get_edition_by_date(date.today())
 
 
-def get_latest_edition() -> Optional[Dict[str, Any]]:
+async def get_latest_edition() -> Optional[Dict[str, Any]]:
     """Get the most recent edition."""
-    editions = get_editions(limit=1)
-    return editions[0] if editions else None
+    if _edition_index.loaded:
+        latest = _edition_index.latest()
+        return await get_edition_by_date(date.fromisoformat(latest[0])) if latest else None
+
+    cached = _edition_cache.get(("latest",))
+    if cached is not MISS:
+        return cached
+
+    editions = await get_editions(limit=1)
+    edition = editions[0] if editions else None
 
-def get_adjacent_edition_dates(edition_date: date) -> Dict[str, Any]:
+    ttl = None if edition else CACHE_NEGATIVE_TTL_SECONDS
+    tags = ["latest"] + (_edition_tags(edition, edition["edition_date"]) if edition else [])
+    _edition_cache.set(("latest",), edition, ttl=ttl, tags=tags)
+    return edition
+
+@_metered
+async def get_adjacent_edition_dates(edition_date: date) -> Dict[str, Any]:
     """
     Get the previous and next edition dates relative to a given date.
 
     Returns:
         Dict with prev_edition_date and next_edition_date (ISO strings or None)
     """
-    client = get_client()
+    cached = _cached_adjacent(edition_date.isoformat())
+    if cached is not MISS:
+        return cached
+
+    key = ("adjacent", edition_date.isoformat())
+
+    client = await get_async_client()
 
     # Previous edition: closest date BEFORE this one
-    prev_result = client.table("editions")\
+    prev_query = client.table("editions")\
         .select("edition_date")\
         .lt("edition_date", edition_date.isoformat())\
         .order("edition_date", desc=True)\
-        .limit(1)\
-        .execute()
+        .limit(1)
 
     # Next edition: closest date AFTER this one
-    next_result = client.table("editions")\
+    next_query = client.table("editions")\
         .select("edition_date")\
         .gt("edition_date", edition_date.isoformat())\
         .order("edition_date", desc=False)\
-        .limit(1)\
-        .execute()
+        .limit(1)
 
-    return {
+    prev_result, next_result = await asyncio.gather(
+        prev_query.execute(),
+        next_query.execute(),
+    )
+
+    adjacent = {
         "prev_edition_date": prev_result.data[0]["edition_date"] if prev_result.data else None,
         "next_edition_date": next_result.data[0]["edition_date"] if next_result.data else None,
     }
 
+    _edition_cache.set(key, adjacent, tags=["adjacent"])
+    return adjacent
+
+
+# Set to False once we learn the get_edition_bundle RPC is not deployed
+_bundle_rpc_available = True
+
+
+def _cached_adjacent(iso_date: str) -> Any:
+    """Adjacent dates from the index (if loaded) or cache, else MISS."""
+    if _edition_index.loaded:
+        prev_date, next_date = _edition_index.adjacent(iso_date)
+        return {"prev_edition_date": prev_date, "next_edition_date": next_date}
+    return _edition_cache.get(("adjacent", iso_date))
+
+
+def _resolve_target(target: Union[date, str]) -> Union[date, str, None]:
+    """
+    Resolve "today"/"latest" to a concrete date using the edition index.
+
+    Returns None if the index shows no matching edition, and the target
+    unchanged if the index is not loaded.
+    """
+    if not _edition_index.loaded:
+        return target
+
+    if target == "today" and date.today().isoformat() in _edition_index:
+        return date.today()
+    if target in ("today", "latest"):
+        latest = _edition_index.latest()
+        return date.fromisoformat(latest[0]) if latest else None
+
+    return target if target.isoformat() in _edition_index else None
+
+
+def _cached_edition_for(target: Union[date, str]) -> Any:
+    """Resolve a bundle target to a cached edition row, None, or MISS."""
+    if target == "latest":
+        return _edition_cache.get(("latest",))
+
+    if target == "today":
+        edition = _edition_cache.get(("date", date.today().isoformat()))
+        if edition is None:
+            # Known: no edition today yet, so "today" means latest
+            return _edition_cache.get(("latest",))
+        return edition
+
+    return _edition_cache.get(("date", target.isoformat()))
+
+
+def _bundle_from_cache(edition: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Assemble a bundle from cached rows, or None if anything is missing."""
+    adjacent = _cached_adjacent(edition["edition_date"])
+    if adjacent is MISS:
+        return None
+
+    articles = []
+    for aid in edition.get("article_ids") or []:
+        article = _get_cached_article(str(aid), "card")
+        if article is MISS:
+            return None
+        articles.append(article)
+
+    return {"edition": edition, "articles": articles, **adjacent}
+
+
+def _store_bundle(target: Union[date, str], bundle: Optional[Dict[str, Any]]) -> None:
+    """Populate the row caches from an RPC bundle."""
+    if bundle is None:
+        if isinstance(target, date):
+            iso_date = target.isoformat()
+            _edition_cache.set(("date", iso_date), None, ttl=CACHE_NEGATIVE_TTL_SECONDS, tags=[f"date:{iso_date}"])
+        return
+
+    edition = bundle["edition"]
+    iso_date = edition["edition_date"]
+    tags = _edition_tags(edition, iso_date)
+
+    _edition_cache.set(("date", iso_date), edition, tags=tags)
+    if target == "latest":
+        _edition_cache.set(("latest",), edition, tags=["latest"] + tags)
+    elif target == "today" and iso_date != date.today().isoformat():
+        # RPC fell back to latest because today has no edition
+        today_iso = date.today().isoformat()
+        _edition_cache.set(("date", today_iso), None, ttl=CACHE_NEGATIVE_TTL_SECONDS, tags=[f"date:{today_iso}"])
+        _edition_cache.set(("latest",), edition, tags=["latest"] + tags)
+
+    _edition_cache.set(
+        ("adjacent", iso_date),
+        {
+            "prev_edition_date": bundle.get("prev_edition_date"),
+            "next_edition_date": bundle.get("next_edition_date"),
+        },
+        tags=["adjacent"],
+    )
+
+    for article in bundle.get("articles") or []:
+        _set_cached_article(article)
+
+
+async def _get_edition_bundle_fallback(target: Union[date, str]) -> Optional[Dict[str, Any]]:
+    """Build a bundle with individual queries (used when the RPC is unavailable)."""
+    if isinstance(target, date):
+        # Edition and adjacent dates only depend on the date: fetch together
+        edition, adjacent = await asyncio.gather(
+            get_edition_by_date(target),
+            get_adjacent_edition_dates(target),
+        )
+        if not edition:
+            return None
+        article_ids = [str(aid) for aid in (edition.get("article_ids") or [])]
+        articles = await get_articles_by_ids(article_ids)
+        return {"edition": edition, "articles": articles, **adjacent}
+
+    if target == "today":
+        edition = await get_edition_by_date(date.today()) or await get_latest_edition()
+    else:
+        edition = await get_latest_edition()
+
+    if not edition:
+        return None
+
+    article_ids = [str(aid) for aid in (edition.get("article_ids") or [])]
+    articles, adjacent = await asyncio.gather(
+        get_articles_by_ids(article_ids),
+        get_adjacent_edition_dates(date.fromisoformat(edition["edition_date"])),
+    )
+
+    return {"edition": edition, "articles": articles, **adjacent}
+
+
+@_metered
+async def get_edition_bundle(target: Union[date, str]) -> Optional[Dict[str, Any]]:
+    """
+    Get an edition with its ordered articles and adjacent edition dates.
+
+    Served from cache when possible, otherwise fetched in a single call to
+    the get_edition_bundle Postgres function (see sql/get_edition_bundle.sql).
+
+    Args:
+        target: Edition date, or "today" (falls back to latest) / "latest"
 
-def get_edition_by_id(edition_id: str) -> Optional[Dict[str, Any]]:
+    Returns:
+        Dict with edition, articles ("card" projection), prev_edition_date
+        and next_edition_date, or None if no edition matches
+    """
+    global _bundle_rpc_available
+
+    target = _resolve_target(target)
+    if target is None:
+        return None
+
+    edition = _cached_edition_for(target)
+    if edition is None:
+        return None
+    if edition is not MISS:
+        bundle = _bundle_from_cache(edition)
+        if bundle is not None:
+            return bundle
+
+    if not _bundle_rpc_available:
+        return await _get_edition_bundle_fallback(target)
+
+    client = await get_async_client()
+    target_param = target.isoformat() if isinstance(target, date) else target
+
+    try:
+        result = await client.rpc("get_edition_bundle", {
+            "p_target": target_param,
+            "p_today": date.today().isoformat(),
+        }).execute()
+    except DependencyUnavailable:
+        # Supabase is down: the individual queries would fail the same way
+        raise
+    except Exception as e:
+        if "PGRST202" in str(e):
+            # Function not deployed - stop trying until restart
+            _bundle_rpc_available = False
+        print(f"[DB] get_edition_bundle RPC failed, using individual queries: {e}")
+        return await _get_edition_bundle_fallback(target)
+
+    bundle = result.data or None
+    if bundle:
+        bundle["edition"] = edition_record(bundle["edition"])
+        bundle["articles"] = article_records(bundle.get("articles") or [], "card")
+    _store_bundle(target, bundle)
+    return bundle
+
+
+@_metered
+async def get_edition_by_id(edition_id: str) -> Optional[Dict[str, Any]]:
     """Get edition by UUID."""
-    client = get_client()
+    client = await get_async_client()
     
-    result = client.table("editions")\
+    result = await client.table("editions")\
         .select("*")\
         .eq("id", edition_id)\
         .limit(1)\
@@ -141,7 +955,8 @@ def get_edition_by_id(edition_id: str) -> Optional[Dict[str, Any]]:
     return result.data[0] if result.data else None
 
 
-def update_edition(edition_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+@_metered
+async def update_edition(edition_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Update an edition record.
     
@@ -152,66 +967,146 @@ def update_edition(edition_id: str, updates: Dict[str, Any]) -> Optional[Dict[st
     Returns:
         Updated edition or None
     """
-    client = get_client()
+    client = await get_async_client()
     
     # Don't allow updating certain fields
     protected = ["id", "created_at"]
     updates = {k: v for k, v in updates.items() if k not in protected}
     
-    result = client.table("editions")\
+    # A moved edition also has to leave its old date (index, cache, neighbours)
+    old_edition = await get_edition_by_id(edition_id) if "edition_date" in updates else None
+    
+    result = await client.table("editions")\
         .update(updates)\
         .eq("id", edition_id)\
         .execute()
     
-    return result.data[0] if result.data else None
+    edition = result.data[0] if result.data else None
+    if edition or old_edition:
+        apply_edition_change("UPDATE", edition, old_edition)
+    else:
+        invalidate_edition(edition_id)
+    return edition
 
 
 # =============================================================================
 # Articles
 # =============================================================================
 
-def get_articles_by_ids(article_ids: List[str]) -> List[Dict[str, Any]]:
+@_metered
+async def get_articles_by_ids(
+    article_ids: List[str],
+    projection: str = "card",
+) -> List[Dict[str, Any]]:
     """
     Get multiple articles by their UUIDs.
     
     Args:
         article_ids: List of article UUIDs
+        projection: Column set to fetch (see ARTICLE_PROJECTIONS)
     
     Returns:
         List of article records
     """
+    article_columns(projection)  # Validate before touching the cache
     if not article_ids:
         return []
     
-    client = get_client()
-    
-    result = client.table("all_articles")\
-        .select("*")\
-        .in_("id", article_ids)\
-        .execute()
+    article_ids = [str(aid) for aid in article_ids]
+
+    # Serve what we can from cache, fetch the rest in one query
+    articles_map = {}
+    missing = []
+    for aid in article_ids:
+        cached = _get_cached_article(aid, projection)
+        if cached is MISS:
+            missing.append(aid)
+        else:
+            articles_map[aid] = cached
+
+    if missing:
+        rows = await _select_articles(projection, lambda q: q.in_("id", missing))
+
+        for article in rows:
+            articles_map[str(article["id"])] = article
+            _set_cached_article(article)
     
     # Preserve order from article_ids
-    articles_map = {str(a["id"]): a for a in (result.data or [])}
     return [articles_map[aid] for aid in article_ids if aid in articles_map]
 
 
-def get_article_by_id(article_id: str) -> Optional[Dict[str, Any]]:
-    """Get single article by UUID."""
-    client = get_client()
-    
-    result = client.table("all_articles")\
-        .select("*")\
-        .eq("id", article_id)\
-        .limit(1)\
-        .execute()
+@_metered
+async def get_article_titles(article_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get title fields for many articles (for sitemaps and indexes).
+
+    Uses cached rows where available and fetches the rest with a narrow
+    select, in concurrent chunks to keep URLs short.
+
+    Args:
+        article_ids: List of article UUIDs
+
+    Returns:
+        Dict of article UUID -> {id, slug, headline_line_1, headline, original_title}
+    """
+    titles = {}
+    missing = []
+    for aid in dict.fromkeys(str(a) for a in article_ids):
+        cached = _get_cached_article(aid, "title")
+        if cached is MISS:
+            missing.append(aid)
+        else:
+            titles[aid] = cached
+
+    if not missing:
+        return titles
+
+    chunk_size = 150
+
+    queries = [
+        _select_articles("title", lambda q, ids=missing[i:i + chunk_size]: q.in_("id", ids))
+        for i in range(0, len(missing), chunk_size)
+    ]
+
+    for rows in await asyncio.gather(*queries):
+        for article in rows:
+            titles[str(article["id"])] = article
+
+    return titles
+
+
+@_metered
+async def get_article_by_id(
+    article_id: str,
+    projection: str = "detail",
+) -> Optional[Dict[str, Any]]:
+    """
+    Get single article by UUID.
+
+    Args:
+        article_id: UUID of article
+        projection: Column set to fetch (see ARTICLE_PROJECTIONS)
+    """
+    article_columns(projection)  # Validate before touching the cache
+
+    cached = _get_cached_article(str(article_id), projection)
+    if cached is not MISS:
+        return cached
+
+    rows = await _select_articles(projection, lambda q: q.eq("id", article_id).limit(1))
     
-    return result.data[0] if result.data else None
+    article = rows[0] if rows else None
+    if article:
+        _set_cached_article(article)
+    return article
 
 
-def search_articles(
+@_metered
+async def search_articles(
     query: str,
     limit: int = 20,
     offset: int = 0,
+    projection: str = "card",
 ) -> List[Dict[str, Any]]:
     """
     Search articles by title.
@@ -220,23 +1115,21 @@ def search_articles(
         query: Search query
         limit: Max results
         offset: Pagination offset
+        projection: Column set to fetch (see ARTICLE_PROJECTIONS)
     
     Returns:
         List of matching articles
     """
-    client = get_client()
-    
-    result = client.table("all_articles")\
-        .select("*")\
-        .ilike("original_title", f"%{query}%")\
-        .order("fetch_date", desc=True)\
-        .range(offset, offset + limit - 1)\
-        .execute()
-    
-    return result.data or []
+    return await _select_articles(
+        projection,
+        lambda q: q.ilike("original_title", f"%{query}%")
+            .order("fetch_date", desc=True)
+            .range(offset, offset + limit - 1),
+    )
 
 
-def update_article(article_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+@_metered
+async def update_article(article_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """
     Update an article record.
     
@@ -247,21 +1140,71 @@ def update_article(article_id: str, updates: Dict[str, Any]) -> Optional[Dict[st
     Returns:
         Updated article or None
     """
-    client = get_client()
+    client = await get_async_client()
     
     # Don't allow updating certain fields
     protected = ["id", "created_at", "article_url"]
     updates = {k: v for k, v in updates.items() if k not in protected}
     
-    result = client.table("all_articles")\
+    result = await client.table("all_articles")\
         .update(updates)\
         .eq("id", article_id)\
         .execute()
     
+    invalidate_article(article_id)
     return result.data[0] if result.data else None
 
 
-def delete_article(article_id: str) -> bool:
+@_metered
+async def set_article_slugs(slugs: Dict[str, str]) -> int:
+    """
+    Store slugs for articles that do not have one yet.
+
+    Existing slugs are never overwritten, so published URLs stay stable.
+
+    Args:
+        slugs: Article UUID -> slug
+
+    Returns:
+        Number of slugs stored
+    """
+    global _slug_column_available
+
+    if not slugs or not _slug_column_available:
+        return 0
+
+    client = await get_async_client()
+    items = list(slugs.items())
+    batch_size = 20
+    stored = 0
+
+    for i in range(0, len(items), batch_size):
+        batch = items[i:i + batch_size]
+        results = await asyncio.gather(*[
+            client.table("all_articles")
+                .update({"slug": slug})
+                .eq("id", aid)
+                .is_("slug", "null")
+                .execute()
+            for aid, slug in batch
+        ], return_exceptions=True)
+
+        for (aid, slug), result in zip(batch, results):
+            if isinstance(result, Exception):
+                if _is_missing_slug_column(result):
+                    _slug_column_available = False
+                    print("[DB] all_articles.slug missing (apply sql/article_slugs.sql); slugs not stored")
+                    return stored
+                print(f"[DB] Could not store slug for article {aid}: {result}")
+            elif result.data:
+                stored += 1
+                invalidate_article(aid)
+
+    return stored
+
+
+@_metered
+async def delete_article(article_id: str) -> bool:
     """
     Soft-delete an article (mark as archived).
     
@@ -271,11 +1214,12 @@ def delete_article(article_id: str) -> bool:
     Returns:
         True if successful
     """
-    result = update_article(article_id, {"status": "archived"})
+    result = await update_article(article_id, {"status": "archived"})
     return result is not None
 
 
-def remove_article_from_edition(edition_id: str, article_id: str) -> bool:
+@_metered
+async def remove_article_from_edition(edition_id: str, article_id: str) -> bool:
     """
     Remove an article from an edition's article_ids array.
     
@@ -286,18 +1230,18 @@ def remove_article_from_edition(edition_id: str, article_id: str) -> bool:
     Returns:
         True if successful
     """
-    edition = get_edition_by_id(edition_id)
+    edition = await get_edition_by_id(edition_id)
     if not edition:
         return False
     
-    article_ids = edition.get("article_ids", [])
+    article_ids = list(edition.get("article_ids") or [])
     if article_id not in article_ids:
         return False
     
     article_ids.remove(article_id)
     
-    client = get_client()
-    result = client.table("editions")\
+    client = await get_async_client()
+    result = await client.table("editions")\
         .update({
             "article_ids": article_ids,
             "articles_selected": len(article_ids),
@@ -305,6 +1249,7 @@ def remove_article_from_edition(edition_id: str, article_id: str) -> bool:
         .eq("id", edition_id)\
         .execute()
     
+    invalidate_edition(edition_id, edition.get("edition_date"))
     return bool(result.data)
 
 
@@ -312,11 +1257,12 @@ def remove_article_from_edition(edition_id: str, article_id: str) -> bool:
 # Projects
 # =============================================================================
 
-def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
+@_metered
+async def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
     """Get project by UUID."""
-    client = get_client()
+    client = await get_async_client()
     
-    result = client.table("projects")\
+    result = await client.table("projects")\
         .select("*")\
         .eq("id", project_id)\
         .limit(1)\
@@ -329,28 +1275,30 @@ def get_project_by_id(project_id: str) -> Optional[Dict[str, Any]]:
 # Statistics
 # =============================================================================
 
-def get_stats() -> Dict[str, Any]:
+@_metered
+async def get_stats() -> Dict[str, Any]:
     """Get overall statistics for admin dashboard."""
-    client = get_client()
+    client = await get_async_client()
     
     # Count editions
-    editions_result = client.table("editions")\
-        .select("id", count="exact")\
-        .execute()
+    editions_query = client.table("editions")\
+        .select("id", count="exact")
     
     # Count published articles
-    articles_result = client.table("all_articles")\
+    articles_query = client.table("all_articles")\
         .select("id", count="exact")\
-        .eq("status", "published")\
-        .execute()
+        .eq("status", "published")
     
     # Count projects
-    projects_result = client.table("projects")\
-        .select("id", count="exact")\
-        .execute()
+    projects_query = client.table("projects")\
+        .select("id", count="exact")
     
-    # Recent editions
-    recent_editions = get_editions(limit=5)
+    editions_result, articles_result, projects_result, recent_editions = await asyncio.gather(
+        editions_query.execute(),
+        articles_query.execute(),
+        projects_query.execute(),
+        get_editions(limit=5),  # Recent editions
+    )
     
     return {
         "total_editions": editions_result.count or 0,
@@ -364,11 +1312,12 @@ def get_stats() -> Dict[str, Any]:
 # Health Check
 # =============================================================================
 
-def test_connection() -> bool:
+@_metered
+async def test_connection() -> bool:
     """Test database connection."""
     try:
-        client = get_client()
-        client.table("editions").select("id").limit(1).execute()
+        client = await get_async_client()
+        await client.table("editions").select("id").limit(1).execute()
         return True
     except Exception as e:
         print(f"[DB] Connection test failed: {e}")
@@ -0,0 +1,145 @@
+"""
+Edition Date Index for ADUmedia Website
+
+Sorted in-memory index of (edition_date, edition_type, id) for every
+edition. Answers prev/next navigation, latest edition and date existence
+checks with a binary search instead of a Supabase query.
+"""
+
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# (edition_date ISO string, edition_type, edition UUID)
+IndexEntry = Tuple[str, str, str]
+
+
+class EditionIndex:
+    """
+    Sorted index of editions keyed by ISO date.
+
+    ISO date strings sort chronologically, so they are compared directly.
+    The index is empty and unused until load() has been called.
+    """
+
+    def __init__(self):
+        self._dates: List[str] = []
+        self._entries: List[IndexEntry] = []
+        self.loaded = False
+        self.loaded_at = 0.0
+
+    def load(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace the index contents.
+
+        Args:
+            rows: Edition rows with edition_date, edition_type and id
+        """
+        by_date = {}
+        for row in rows:
+            entry = _entry_from_row(row)
+            if entry:
+                by_date[entry[0]] = entry
+
+        self._entries = sorted(by_date.values())
+        self._dates = [e[0] for e in self._entries]
+        self.loaded = True
+        self.loaded_at = time.time()
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Insert or replace the entry for an edition row."""
+        entry = _entry_from_row(row)
+        if not entry:
+            return
+
+        i = bisect_left(self._dates, entry[0])
+        if i < len(self._dates) and self._dates[i] == entry[0]:
+            self._entries[i] = entry
+        else:
+            self._dates.insert(i, entry[0])
+            self._entries.insert(i, entry)
+
+    def remove(self, edition_date: str) -> bool:
+        """Remove the entry for a date. Returns True if it was present."""
+        i = bisect_left(self._dates, edition_date)
+        if i < len(self._dates) and self._dates[i] == edition_date:
+            del self._dates[i]
+            del self._entries[i]
+            return True
+        return False
+
+    def get(self, edition_date: str) -> Optional[IndexEntry]:
+        """Return the entry for a date, or None."""
+        i = bisect_left(self._dates, edition_date)
+        if i < len(self._dates) and self._dates[i] == edition_date:
+            return self._entries[i]
+        return None
+
+    def adjacent(self, edition_date: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get the closest edition dates before and after a date.
+
+        The date itself does not need to be in the index.
+
+        Returns:
+            (prev_edition_date, next_edition_date), either may be None
+        """
+        i = bisect_left(self._dates, edition_date)
+        j = bisect_right(self._dates, edition_date)
+        prev_date = self._dates[i - 1] if i > 0 else None
+        next_date = self._dates[j] if j < len(self._dates) else None
+        return prev_date, next_date
+
+    def dates(self) -> List[str]:
+        """Return all indexed dates, oldest first."""
+        return list(self._dates)
+
+    def latest(self) -> Optional[IndexEntry]:
+        """Return the most recent entry, or None if empty."""
+        return self._entries[-1] if self._entries else None
+
+    def page(
+        self,
+        limit: int,
+        offset: int = 0,
+        edition_type: Optional[str] = None,
+    ) -> List[IndexEntry]:
+        """
+        Get entries newest first, optionally filtered by type.
+
+        Args:
+            limit: Max results
+            offset: Pagination offset
+            edition_type: Filter by type (daily, weekend, weekly)
+        """
+        entries = reversed(self._entries)
+        if edition_type:
+            entries = (e for e in entries if e[1] == edition_type)
+
+        result = []
+        for i, entry in enumerate(entries):
+            if i < offset:
+                continue
+            if len(result) >= limit:
+                break
+            result.append(entry)
+        return result
+
+    def __contains__(self, edition_date: str) -> bool:
+        return self.get(edition_date) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _entry_from_row(row: Dict[str, Any]) -> Optional[IndexEntry]:
+    """Build an index entry from an edition row."""
+    edition_date = row.get("edition_date")
+    if not edition_date:
+        return None
+    return (
+        str(edition_date),
+        row.get("edition_type") or "daily",
+        str(row.get("id") or ""),
+    )
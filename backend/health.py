@@ -0,0 +1,159 @@
+"""
+Health Probes for ADUmedia Website
+
+A background task checks Supabase and Typesense on an interval and keeps
+a rolling window of results (latency, errors) per dependency.
+/api/health and /api/ready answer from that state, so load balancer and
+container probes never cause database queries themselves.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from database import test_connection
+from typesense_sync import check_connection as check_typesense_connection
+
+
+HEALTH_PROBE_INTERVAL_SECONDS = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", "15"))
+HEALTH_PROBE_TIMEOUT_SECONDS = float(os.getenv("HEALTH_PROBE_TIMEOUT_SECONDS", "5"))
+
+# Probe results kept per dependency (error rate and latency are over these)
+HEALTH_WINDOW = int(os.getenv("HEALTH_WINDOW", "20"))
+
+
+class NotConfigured(Exception):
+    """The dependency is not configured in this environment."""
+
+
+class DependencyHealth:
+    """
+    Rolling probe results for one dependency.
+
+    Args:
+        name: Dependency name
+        probe: Coroutine function that raises (or returns False) when the
+            dependency is unhealthy
+        critical: Whether the app is degraded when this dependency is down
+    """
+
+    def __init__(self, name: str, probe: Callable[[], Awaitable[Any]], critical: bool = True):
+        self.name = name
+        self.probe = probe
+        self.critical = critical
+
+        # (ok, latency in seconds, wall clock time)
+        self._results: Deque[Tuple[bool, float, float]] = deque(maxlen=HEALTH_WINDOW)
+        self.configured = True
+        self.last_error: Optional[str] = None
+
+    async def check(self) -> bool:
+        """Run the probe once and record the result."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(self.probe(), HEALTH_PROBE_TIMEOUT_SECONDS)
+            ok = result is not False
+            error = None if ok else "probe failed"
+        except NotConfigured:
+            self.configured = False
+            return True
+        except asyncio.TimeoutError:
+            ok, error = False, f"timed out after {HEALTH_PROBE_TIMEOUT_SECONDS:.0f}s"
+        except Exception as e:
+            ok, error = False, str(e) or type(e).__name__
+
+        self.configured = True
+        self._results.append((ok, time.perf_counter() - started, time.time()))
+        if not ok:
+            self.last_error = error
+        return ok
+
+    def status(self) -> str:
+        """'up', 'down', 'unknown' (not probed yet) or 'not_configured'."""
+        if not self.configured:
+            return "not_configured"
+        if not self._results:
+            return "unknown"
+        return "up" if self._results[-1][0] else "down"
+
+    def stats(self) -> Dict[str, Any]:
+        """Current status with latency and error rate over the window."""
+        results = list(self._results)
+        latencies = sorted(r[1] for r in results)
+
+        def ms(seconds: Optional[float]) -> Optional[float]:
+            return None if seconds is None else round(seconds * 1000, 1)
+
+        return {
+            "status": self.status(),
+            "critical": self.critical,
+            "checked_ago": round(time.time() - results[-1][2], 1) if results else None,
+            "latency_ms": ms(results[-1][1]) if results else None,
+            "latency_p50_ms": ms(latencies[len(latencies) // 2]) if latencies else None,
+            "latency_max_ms": ms(latencies[-1]) if latencies else None,
+            "error_rate": round(sum(not r[0] for r in results) / len(results), 3) if results else None,
+            "samples": len(results),
+            "last_error": self.last_error,
+        }
+
+
+# =============================================================================
+# Probes
+# =============================================================================
+
+async def _probe_supabase() -> bool:
+    return await test_connection()
+
+
+async def _probe_typesense() -> None:
+    try:
+        await asyncio.to_thread(check_typesense_connection)
+    except ValueError:
+        raise NotConfigured()
+
+
+# Search is served browser -> Typesense, so it does not make the API unhealthy
+dependencies = [
+    DependencyHealth("supabase", _probe_supabase),
+    DependencyHealth("typesense", _probe_typesense, critical=False),
+]
+
+_last_round: Optional[float] = None
+
+
+async def probe_all() -> None:
+    """Probe every dependency once, concurrently."""
+    global _last_round
+
+    await asyncio.gather(*[d.check() for d in dependencies])
+    _last_round = time.time()
+
+
+async def health_prober() -> None:
+    """Background task: probe every HEALTH_PROBE_INTERVAL_SECONDS."""
+    while True:
+        try:
+            await probe_all()
+        except Exception as e:
+            print(f"[HEALTH] Probe round failed: {e}")
+        await asyncio.sleep(HEALTH_PROBE_INTERVAL_SECONDS)
+
+
+def is_healthy() -> bool:
+    """False if a critical dependency's last probe failed."""
+    return all(d.status() != "down" for d in dependencies if d.critical)
+
+
+def prober_running() -> bool:
+    """True once probes have run and the last round is recent."""
+    return _last_round is not None and time.time() - _last_round < 3 * HEALTH_PROBE_INTERVAL_SECONDS + HEALTH_PROBE_TIMEOUT_SECONDS
+
+
+def get_health() -> Dict[str, Any]:
+    """Per-dependency probe state."""
+    return {
+        "checked_ago": round(time.time() - _last_round, 1) if _last_round else None,
+        "dependencies": {d.name: d.stats() for d in dependencies},
+    }
@@ -0,0 +1,356 @@
+"""
+HTTP Caching for ADUmedia Website
+
+Serialized API payloads with strong validators (ETag / Last-Modified),
+conditional GET handling, Accept-Encoding negotiation and per-route
+Cache-Control policies.
+
+Payloads are serialized once and kept in a tagged cache, so a request
+whose If-None-Match matches gets a 304 without rebuilding or
+re-serializing anything. Brotli/gzip variants are compressed on first use
+and stored on the payload, so later requests skip compression too.
+Entries are invalidated through the database change hooks.
+
+Every stored payload is also kept as the key's last good copy, which is
+not invalidated and is served (marked stale) while Supabase is down.
+"""
+
+import gzip
+import hashlib
+import os
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip is offered
+    brotli = None
+
+from cache import TTLCache, MISS
+from json_response import dumps
+from database import get_edition_index, on_edition_change, on_article_change
+
+
+# =============================================================================
+# Cache-Control Policies
+# =============================================================================
+
+# Past editions that already have a newer edition: content is final
+CACHE_CONTROL_IMMUTABLE = os.getenv(
+    "CACHE_CONTROL_IMMUTABLE", "public, max-age=604800, immutable"
+)
+
+# today / latest / newest edition: changes when the next edition publishes
+CACHE_CONTROL_SHORT = os.getenv(
+    "CACHE_CONTROL_SHORT", "public, max-age=60, stale-while-revalidate=300"
+)
+
+# Edition lists and single articles
+CACHE_CONTROL_MEDIUM = os.getenv(
+    "CACHE_CONTROL_MEDIUM", "public, max-age=300, stale-while-revalidate=3600"
+)
+
+# Sitemaps and robots.txt
+CACHE_CONTROL_SEO = os.getenv(
+    "CACHE_CONTROL_SEO", "public, max-age=3600, stale-while-revalidate=86400"
+)
+
+
+# =============================================================================
+# Compression
+# =============================================================================
+
+# Bodies smaller than this are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))
+
+# Each payload is compressed once, so favour ratio over speed
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "9"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "9"))
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress body with "br" or "gzip"."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick "br", "gzip" or None from an Accept-Encoding header.
+
+    Highest q-value wins; brotli is preferred on ties.
+    """
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    wildcard = weights.get("*", 0.0)
+    candidates = []
+    if brotli is not None:
+        candidates.append(("br", weights.get("br", wildcard)))
+    candidates.append(("gzip", weights.get("gzip", wildcard)))
+
+    encoding, q = max(candidates, key=lambda c: c[1])
+    return encoding if q > 0 else None
+
+
+# =============================================================================
+# Payloads
+# =============================================================================
+
+class CachedPayload:
+    """A serialized response body with its validators and compressed variants."""
+
+    __slots__ = ("body", "etag", "last_modified", "media_type", "cache_control", "compressible", "_encoded")
+
+    def __init__(
+        self,
+        body: bytes,
+        media_type: str = "application/json",
+        cache_control: Optional[str] = None,
+        compressible: bool = True,
+    ):
+        self.body = body
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.last_modified = time.time()
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.compressible = compressible
+        self._encoded: Dict[str, bytes] = {}
+
+    def encoded(self, encoding: str) -> bytes:
+        """Get the body compressed with encoding (computed once)."""
+        body = self._encoded.get(encoding)
+        if body is None:
+            body = compress(self.body, encoding)
+            self._encoded[encoding] = body
+        return body
+
+    def add_encoded(self, encoding: str, body: bytes) -> None:
+        """Use an already compressed variant (e.g. a build's .br file)."""
+        self._encoded[encoding] = body
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """ETag for one representation (each encoding gets its own)."""
+        return self.etag if not encoding else f'{self.etag[:-1]}-{encoding}"'
+
+
+def serialize(content: Any) -> bytes:
+    """Serialize content the same way the app's default response class does."""
+    return dumps(content)
+
+
+def make_payload(content: Any, cache_control: Optional[str] = None) -> CachedPayload:
+    """Serialize a JSON response body once."""
+    return CachedPayload(serialize(content), cache_control=cache_control)
+
+
+PAYLOAD_CACHE_TTL_SECONDS = float(os.getenv("PAYLOAD_CACHE_TTL_SECONDS", "3600"))
+
+payload_cache = TTLCache("payloads", max_entries=2048, ttl_seconds=PAYLOAD_CACHE_TTL_SECONDS)
+
+
+# How long a payload stays available as a fallback during outages
+LAST_GOOD_TTL_SECONDS = float(os.getenv("LAST_GOOD_TTL_SECONDS", "86400"))
+
+# Response header marking a last-good payload, with its age in whole seconds
+STALE_AGE_HEADER = "X-Stale-Age"
+
+# Untagged: change hooks do not drop the fallback copy
+last_good_cache = TTLCache("last-good", max_entries=2048, ttl_seconds=LAST_GOOD_TTL_SECONDS)
+
+
+def get_payload(key: Any) -> Any:
+    """Get a cached payload, or MISS."""
+    return payload_cache.get(key)
+
+
+def store_payload(key: Any, payload: CachedPayload, tags: Iterable[str] = ()) -> CachedPayload:
+    """
+    Cache a payload under key with invalidation tags (and as its last good copy).
+
+    A rebuild after a TTL expiry or invalidation often produces the same
+    body. It then keeps the previous Last-Modified, so If-Modified-Since
+    revalidations still get a 304.
+    """
+    previous = last_good_cache.get(key)
+    if previous is not MISS and previous.etag == payload.etag:
+        payload.last_modified = previous.last_modified
+
+    payload_cache.set(key, payload, tags=tags)
+    last_good_cache.set(key, payload)
+    return payload
+
+
+def get_last_good(key: Any) -> Optional[CachedPayload]:
+    """Get the last payload stored under key, even if since invalidated."""
+    payload = last_good_cache.get(key)
+    return None if payload is MISS else payload
+
+
+def stale_headers(payload: CachedPayload) -> Dict[str, str]:
+    """Response headers marking a last-good payload served during an outage."""
+    return {STALE_AGE_HEADER: str(max(0, int(time.time() - payload.last_modified)))}
+
+
+def edition_payload_tags(edition: Dict[str, Any], article_ids: Iterable[str]) -> list:
+    """Tags for a payload built from an edition and its articles."""
+    tags = [f"date:{edition['edition_date']}", f"edition:{edition.get('id')}"]
+    tags.extend(f"article:{aid}" for aid in article_ids)
+    return tags
+
+
+def _on_edition_change(edition_id: Optional[str], edition_date: Optional[str]) -> None:
+    """
+    Drop payloads affected by an edition change.
+
+    That is the edition itself, its neighbours (their prev/next dates may
+    change), today/latest and edition lists.
+    """
+    if edition_id:
+        payload_cache.invalidate_tag(f"edition:{edition_id}")
+    if edition_date:
+        payload_cache.invalidate_tag(f"date:{edition_date}")
+        for neighbour in get_edition_index().adjacent(edition_date):
+            if neighbour:
+                payload_cache.invalidate_tag(f"date:{neighbour}")
+    payload_cache.invalidate_tag("latest")
+    payload_cache.invalidate_tag("edition-list")
+
+
+def _on_article_change(article_id: str) -> None:
+    """Drop payloads that include an article."""
+    payload_cache.invalidate_tag(f"article:{article_id}")
+
+
+on_edition_change(_on_edition_change)
+on_article_change(_on_article_change)
+
+
+# =============================================================================
+# Conditional GET
+# =============================================================================
+
+def _base_etag(tag: str) -> str:
+    """Strip the weak prefix and encoding suffix from an ETag."""
+    tag = tag.strip().removeprefix("W/")
+    for suffix in ('-br"', '-gzip"'):
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)] + '"'
+    return tag
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against an ETag.
+
+    Any representation of the same payload counts as a match, since they
+    all decode to the same body.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(_base_etag(c) == etag for c in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, last_modified: float) -> bool:
+    """True if last_modified is not newer than the If-Modified-Since date."""
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates have 1 second resolution
+    return int(last_modified) <= since
+
+
+def conditional_response(
+    request: Request,
+    payload: CachedPayload,
+    cache_control: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Build a 200 or 304 response for a cached payload.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request
+        payload: Serialized payload with validators
+        cache_control: Cache-Control header (defaults to payload's)
+        headers: Extra response headers
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, payload.etag)
+    elif if_modified_since is not None:
+        not_modified = _not_modified_since(if_modified_since, payload.last_modified)
+    else:
+        not_modified = False
+
+    encoding = None
+    if payload.compressible and len(payload.body) >= COMPRESSION_MIN_SIZE:
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+
+    response_headers = {
+        "ETag": payload.etag_for(encoding),
+        "Last-Modified": formatdate(payload.last_modified, usegmt=True),
+        "Vary": "Accept-Encoding",
+    }
+    policy = cache_control or payload.cache_control
+    if policy:
+        response_headers["Cache-Control"] = policy
+    if headers:
+        response_headers.update(headers)
+
+    if not_modified:
+        return Response(status_code=304, headers=response_headers)
+
+    if encoding:
+        response_headers["Content-Encoding"] = encoding
+        return Response(
+            content=payload.encoded(encoding),
+            media_type=payload.media_type,
+            headers=response_headers,
+        )
+
+    return Response(content=payload.body, media_type=payload.media_type, headers=response_headers)
+
+
+def cache_stream(
+    key: Any,
+    chunks: Iterator[str],
+    media_type: str,
+    cache_control: Optional[str] = None,
+    tags: Iterable[str] = (),
+) -> Iterator[bytes]:
+    """
+    Stream chunks to the client and cache the complete body as a payload.
+
+    The first request streams; later ones get the cached (and compressed)
+    payload through conditional_response().
+    """
+    parts = []
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        parts.append(data)
+        yield data
+
+    store_payload(key, CachedPayload(b"".join(parts), media_type, cache_control), tags)
@@ -0,0 +1,78 @@
+"""
+JSON Serialization for ADUmedia Website
+
+orjson-backed dumps() and the app's default response class.
+
+orjson encodes dates, datetimes and UUIDs natively and writes UTF-8 bytes
+directly, which is several times faster than the stdlib json path on the
+nested article/translation dicts built by the public API. Without orjson
+installed, both fall back to the stdlib encoder with the same output types.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used without it
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Encode types neither encoder handles natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    # Pydantic models, enums, paths, ...
+    return jsonable_encoder(obj)
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """Stdlib counterpart of orjson's native date/UUID support."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    return _default(obj)
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(content: Any) -> bytes:
+        """Serialize content to compact UTF-8 JSON bytes."""
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+else:
+    def dumps(content: Any) -> bytes:
+        """Serialize content to compact UTF-8 JSON bytes."""
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_stdlib_default,
+        ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with dumps().
+
+    Bytes are treated as already-serialized JSON and sent as-is, so cached
+    payloads can be returned without a second encoding pass:
+
+        return FastJSONResponse(payload.body)
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return bytes(content)
+        return dumps(content)
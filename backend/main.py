@@ -24,8 +24,11 @@ Environment Variables:
     DEBUG               - Enable debug mode (true/false)
 """
 
+import asyncio
+import math
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -33,23 +36,68 @@ sys.path.insert(0, str(Path(__file__).parent))
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 
+from json_response import FastJSONResponse
 from routes import public_router, admin_router, webhook_router
-from database import test_connection
+from routes.public import edition_snapshots, flights
+from breaker import DependencyUnavailable
+from cache import all_caches
+from database import close_async_client, edition_index_refresher, supabase_breaker
+from metrics import Counter, Gauge, MetricsMiddleware, render as render_metrics
+from profiling import ProfilingMiddleware
+from health import health_prober, is_healthy, prober_running, get_health
+from http_cache import conditional_response
+from prerender import LANGUAGE_COOKIE, get_home_page, get_page, home_language
+from slug_index import save_missing_slugs
+from static_files import static_site
+from warmup import warm_up_until_ready, is_ready, get_warmup_status
 
 
 # =============================================================================
 # Application Setup
 # =============================================================================
 
+async def startup_tasks():
+    """
+    Warm the caches (loading the edition and slug indexes), then store
+    any missing article slugs.
+
+    Runs in the background: the server accepts requests meanwhile and
+    /api/ready reports 503 until warm-up has loaded the edition index
+    (retried until it does). Without the indexes every lookup falls back
+    to Supabase queries.
+    """
+    await warm_up_until_ready()
+    await save_missing_slugs()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Startup/shutdown hook."""
+    startup = asyncio.create_task(startup_tasks())
+    index_refresher = asyncio.create_task(edition_index_refresher())
+    snapshot_refresher = asyncio.create_task(edition_snapshots.refresher())
+    prober = asyncio.create_task(health_prober())
+
+    yield
+
+    startup.cancel()
+    index_refresher.cancel()
+    snapshot_refresher.cancel()
+    prober.cancel()
+    await close_async_client()
+
+
 app = FastAPI(
     title="ADUmedia API",
     description="Architecture news digest website API",
     version="1.0.0",
     docs_url="/api/docs" if os.getenv("DEBUG", "").lower() == "true" else None,
     redoc_url="/api/redoc" if os.getenv("DEBUG", "").lower() == "true" else None,
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
@@ -80,6 +128,16 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress everything not already precompressed by http_cache
+# (responses that set Content-Encoding are passed through untouched)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Profiles requests selected from /api/admin/profiling (a no-op when off)
+app.add_middleware(ProfilingMiddleware)
+
+# Outermost: per-route request count and latency for /metrics
+app.add_middleware(MetricsMiddleware)
+
 
 # =============================================================================
 # Include Routers
@@ -94,22 +152,118 @@ app.include_router(webhook_router)
 # Health Check
 # =============================================================================
 
+# Probes answer from the background prober's state (health.py) and never
+# query Supabase or Typesense themselves.
+
 @app.get("/api/health")
 async def health_check():
     """
     Health check endpoint.
-    
-    Returns database connection status.
+
+    Returns dependency status with latency and error rate from the
+    background probes. Always 200: the API keeps serving cached
+    responses while Supabase is down.
     """
-    db_ok = test_connection()
-    
+    health = get_health()
+    supabase = health["dependencies"]["supabase"]["status"]
+
     return {
-        "status": "healthy" if db_ok else "unhealthy",
-        "database": "connected" if db_ok else "disconnected",
+        "status": "healthy" if is_healthy() else "unhealthy",
+        "database": {"up": "connected", "down": "disconnected"}.get(supabase, supabase),
         "version": "1.0.0",
+        **health,
     }
 
 
+@app.get("/api/live")
+async def liveness_check():
+    """
+    Liveness check for the container health check.
+
+    Only shows that the event loop is responsive; restarting would not
+    fix a dependency outage.
+    """
+    return {"status": "alive"}
+
+
+@app.get("/api/ready")
+async def readiness_check():
+    """
+    Readiness check for the deploy health check.
+
+    Returns 503 until a startup warm-up has loaded the edition index (so
+    traffic only moves to a new instance once its caches are warm) and
+    while the background prober is not running.
+    """
+    warmup = get_warmup_status()
+    ready = is_ready() and prober_running()
+    if ready:
+        status = "ready"
+    elif not is_ready():
+        status = "warmup failed" if warmup["runs"] else "warming"
+    else:
+        status = "unavailable"
+
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": status,
+            "warmup": warmup,
+            "health": get_health(),
+        },
+    )
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+# Optional bearer token required to scrape /metrics
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+
+def _cache_values(field: str):
+    return lambda: {(c.name,): c.stats()[field] for c in all_caches()}
+
+
+def _cache_hit_ratios():
+    ratios = {}
+    for c in all_caches():
+        stats = c.stats()
+        lookups = stats["hits"] + stats["misses"]
+        ratios[(c.name,)] = stats["hits"] / lookups if lookups else 0.0
+    return ratios
+
+
+# Read from the components' own counters when scraped
+Counter("adu_cache_hits_total", "In-process cache hits", ("cache",), collect=_cache_values("hits"))
+Counter("adu_cache_misses_total", "In-process cache misses", ("cache",), collect=_cache_values("misses"))
+Counter("adu_cache_evictions_total", "In-process cache LRU evictions", ("cache",), collect=_cache_values("evictions"))
+Gauge("adu_cache_entries", "In-process cache entries", ("cache",), collect=_cache_values("size"))
+Gauge("adu_cache_hit_ratio", "In-process cache hit ratio since start", ("cache",), collect=_cache_hit_ratios)
+Counter(
+    "adu_snapshot_requests_total", "today/latest snapshot lookups by result", ("result",),
+    collect=lambda: {(k,): edition_snapshots.stats()[k] for k in ("hits", "misses", "too_stale")},
+)
+Counter(
+    "adu_singleflight_requests_total", "Payload builds started vs. joined by coalesced requests", ("result",),
+    collect=lambda: {("started",): flights.calls, ("coalesced",): flights.coalesced},
+)
+Gauge(
+    "adu_circuit_open", "1 while the Supabase circuit breaker is open or half-open", ("dependency",),
+    collect=lambda: {("supabase",): 0 if supabase_breaker.state == "closed" else 1},
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics (text format)."""
+    if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+        return JSONResponse(status_code=401, content={"detail": "Invalid metrics token"})
+
+    return Response(content=render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # =============================================================================
 # Error Handlers
 # =============================================================================
@@ -129,16 +283,30 @@ async def not_found_handler(request: Request, exc):
         )
     
     # Serve SPA for client-side routing
-    index_path = Path(__file__).parent.parent / "frontend" / "dist" / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
-    
+    if static_site.index is not None:
+        return static_site.response(request, "index.html")
+
     return JSONResponse(
         status_code=404,
         content={"detail": "Not found"},
     )
 
 
+@app.exception_handler(DependencyUnavailable)
+async def dependency_unavailable_handler(request: Request, exc: DependencyUnavailable):
+    """
+    Fail fast while Supabase is down or its circuit is open.
+
+    Public routes with a last good payload serve that instead; this
+    covers everything without one.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Service temporarily unavailable, please retry"},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
 @app.exception_handler(500)
 async def server_error_handler(request: Request, exc):
     """Handle 500 errors."""
@@ -152,30 +320,26 @@ async def server_error_handler(request: Request, exc):
 # Static Files (Frontend)
 # =============================================================================
 
-# Serve static files from the built React app
-frontend_path = Path(__file__).parent.parent / "frontend" / "dist"
+# The built React app, held in memory (see static_files.py)
+static_site.load()
 
-if frontend_path.exists():
-    # Mount static assets first
-    assets_path = frontend_path / "assets"
-    if assets_path.exists():
-        app.mount("/assets", StaticFiles(directory=str(assets_path)), name="assets")
-    
-    # Serve index.html for root
+if static_site.index is not None:
+    # index.html with today's edition inlined, in the visitor's language
     @app.get("/")
-    async def serve_root():
-        return FileResponse(frontend_path / "index.html")
-    
-    # Catch-all for SPA routing (except /api routes)
+    async def serve_root(request: Request):
+        page = await get_home_page(home_language(request.cookies.get(LANGUAGE_COOKIE)))
+        if page is not None:
+            return conditional_response(request, page, headers={"Vary": "Accept-Encoding, Cookie"})
+        return static_site.response(request, "index.html")
+
+    # Prerendered digest/article pages, build files (including /assets),
+    # else index.html for SPA routing
     @app.get("/{path:path}")
-    async def serve_spa(path: str):
-        # Check if it's a static file
-        file_path = frontend_path / path
-        if file_path.exists() and file_path.is_file():
-            return FileResponse(file_path)
-        
-        # Otherwise serve index.html for SPA routing
-        return FileResponse(frontend_path / "index.html")
+    async def serve_spa(request: Request, path: str):
+        page = await get_page(path)
+        if page is not None:
+            return conditional_response(request, page)
+        return static_site.response(request, path)
 
 else:
     # No frontend built yet - serve placeholder
@@ -203,7 +367,7 @@ def main():
     print(f"  ========================")
     print(f"  Port: {port}")
     print(f"  Debug: {debug}")
-    print(f"  Frontend: {'Found' if frontend_path.exists() else 'Not built'}")
+    print(f"  Frontend: {'Found' if static_site.index is not None else 'Not built'}")
     print(f"")
     
     uvicorn.run(
@@ -0,0 +1,202 @@
+"""
+Prometheus Metrics for ADUmedia Website
+
+Counters, gauges and histograms exposed at /metrics in the Prometheus
+text format (version 0.0.4).
+
+Recording is a dict update under a lock, cheap enough for every request
+and every Supabase call, and safe from worker threads (Typesense sync).
+Everything else happens when /metrics is scraped: callback metrics read
+their current values (cache stats) and the text is rendered.
+
+Modules define their own metrics next to the code they measure; each one
+registers itself here on creation.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Latency buckets in seconds (cache hits are sub-millisecond, Supabase ~10-500ms)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry: List["_Metric"] = []
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    """
+    Base class: a named metric family with label names.
+
+    Args:
+        name: Metric name (counters end in _total)
+        help: Help text
+        labels: Label names; values are passed positionally when recording
+        collect: Optional callback returning {label values: value}, read
+            at scrape time instead of recorded values
+    """
+
+    type = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.collect = collect
+        self._values: Dict[LabelValues, Any] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _samples(self) -> Iterable[str]:
+        values = self.collect() if self.collect else dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}"
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Point-in-time value, usually read from a collect callback."""
+
+    type = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values (e.g. latencies in seconds).
+
+    Args:
+        buckets: Upper bounds, ascending (+Inf is added)
+    """
+
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                # [per-bucket counts (last is +Inf), sum]
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = {k: (list(v[0]), v[1]) for k, v in self._values.items()}
+
+        bounds = self.buckets + (float("inf"),)
+        for label_values, (counts, total) in sorted(values.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}"
+            labels = _format_labels(self.labels, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(round(total, 6))}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+def render() -> str:
+    """Render every registered metric in the Prometheus text format."""
+    parts = []
+    for metric in _registry:
+        try:
+            parts.append(metric.render())
+        except Exception as e:
+            print(f"[METRICS] Rendering {metric.name} failed: {e}")
+    return "\n".join(parts) + "\n"
+
+
+# =============================================================================
+# HTTP Requests
+# =============================================================================
+
+HTTP_REQUESTS = Counter(
+    "adu_http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "adu_http_request_seconds", "HTTP request latency until the last body byte", ("method", "route")
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request count and latency per route.
+
+    Requests are labelled with the matched route's path template
+    (e.g. /api/editions/{edition_date}), so label cardinality stays fixed.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, route, str(status))
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, method, route)
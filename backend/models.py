@@ -132,6 +132,15 @@ class StatsResponse(BaseModel):
     recent_editions: List[EditionSummary]
 
 
+class ProfilingRequest(BaseModel):
+    """Turn on request profiling (see profiling.Profiler.configure)."""
+    path_pattern: Optional[str] = Field(None, max_length=200)
+    sample_rate: float = Field(0.0, ge=0, le=1)
+    use_header: bool = False
+    interval_ms: float = Field(5.0, ge=1, le=100)
+    duration_seconds: float = Field(300.0, ge=1, le=3600)
+
+
 # =============================================================================
 # Webhook
 # =============================================================================
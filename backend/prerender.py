@@ -0,0 +1,450 @@
+"""
+Prerendered Pages for ADUmedia Website
+
+/digest/{date} and /article/{date}/{slug} are served as complete HTML
+documents. Each is the SPA shell (index.html from the build) with the
+page's title, description, canonical URL and OpenGraph/Twitter tags, and
+the page content rendered into #root. Visitors see the content before the
+JavaScript has loaded, and crawlers get it without running any. React
+replaces the markup when it mounts.
+
+Content comes from the same data and transforms as the API responses
+(edition_bundle_response, article_slug_response), in English.
+
+The home page (/) is the shell with today's digest response inlined as a
+boot payload (get_home_page), so the frontend renders today's edition
+without first calling /api/editions/today.
+
+Pages are CachedPayloads in the payload cache, tagged like the matching
+API payloads, so the edition/article change hooks drop them. The newest
+editions' pages are rebuilt by the warm-up (at startup and after each
+publish webhook), and an edition's pages by its article-updated webhooks.
+"""
+
+import asyncio
+import html
+import json
+import os
+import re
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from breaker import DependencyUnavailable
+from cache import MISS
+from database import get_edition_bundle
+from http_cache import CachedPayload, get_last_good, get_payload, store_payload, edition_payload_tags
+from routes.public import (
+    DEFAULT_LANGUAGE,
+    SUPPORTED_LANGUAGES,
+    article_slug_response,
+    coalesce,
+    edition_bundle_response,
+    get_edition_payload,
+)
+from static_files import CACHE_CONTROL_HTML, static_site
+
+
+SITE_URL = os.getenv("SITE_URL", "https://adu.media")
+
+SITE_NAME = "a/d/u"
+
+# Same as the shell's (frontend/index.html)
+DEFAULT_DESCRIPTION = "A curated daily digest of essential reads in architecture, design, and urbanism"
+
+# Longest meta description (search engines cut around 160 characters)
+DESCRIPTION_LENGTH = 200
+
+_DIGEST_PATH = re.compile(r"^digest/(\d{4}-\d{2}-\d{2})/?$")
+_ARTICLE_PATH = re.compile(r"^article/(\d{4}-\d{2}-\d{2})/([^/]+)/?$")
+
+# Shell tags replaced by each page's own
+_SHELL_HEAD_TAGS = re.compile(
+    r'\s*(<title>.*?</title>|<meta\s+(name="description"|property="og:[^"]+"|name="twitter:card")[^>]*>)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+_ROOT = '<div id="root"></div>'
+
+# Language preference cookie set by the frontend (lib/cookies.ts)
+LANGUAGE_COOKIE = "adu_language"
+
+# Element holding the home page's boot payload (frontend/src/lib/boot.ts)
+BOOT_ELEMENT_ID = "boot-data"
+
+# frontend/src/lib/translations.ts (English)
+_EDITION_TYPES = {"daily": "Daily", "weekend": "Weekend Catch-Up"}
+
+
+def _esc(value: Any) -> str:
+    return html.escape(str(value or ""), quote=True)
+
+
+def _description(text: str) -> str:
+    """First DESCRIPTION_LENGTH characters of text, cut at a word."""
+    text = " ".join((text or "").split())
+    if len(text) <= DESCRIPTION_LENGTH:
+        return text
+    return text[:DESCRIPTION_LENGTH].rsplit(" ", 1)[0] + "…"
+
+
+def _head(
+    title: str,
+    description: str,
+    path: str,
+    image: Optional[str] = None,
+    og_type: str = "website",
+    structured_data: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Title, description, canonical URL, OpenGraph/Twitter tags and JSON-LD."""
+    url = f"{SITE_URL}{path}"
+    tags = [
+        f"<title>{_esc(title)}</title>",
+        f'<meta name="description" content="{_esc(description)}" />',
+        f'<link rel="canonical" href="{_esc(url)}" />',
+        f'<meta property="og:title" content="{_esc(title)}" />',
+        f'<meta property="og:description" content="{_esc(description)}" />',
+        f'<meta property="og:type" content="{og_type}" />',
+        f'<meta property="og:url" content="{_esc(url)}" />',
+        f'<meta property="og:site_name" content="{SITE_NAME}" />',
+        f'<meta name="twitter:card" content="{"summary_large_image" if image else "summary"}" />',
+    ]
+    if image:
+        tags.append(f'<meta property="og:image" content="{_esc(image)}" />')
+    if structured_data:
+        # "</" would end the script element early
+        data = json.dumps(structured_data, ensure_ascii=False).replace("</", "<\\/")
+        tags.append(f'<script type="application/ld+json">{data}</script>')
+    return "\n    ".join(tags)
+
+
+def render_page(shell: str, head: str, body: str) -> Optional[str]:
+    """
+    Put a page's head tags and content into the SPA shell.
+
+    Returns None if the shell has no empty #root to render into.
+    """
+    if _ROOT not in shell or "</head>" not in shell:
+        return None
+    document = _SHELL_HEAD_TAGS.sub("", shell)
+    document = document.replace("</head>", f"    {head}\n  </head>", 1)
+    return document.replace(_ROOT, f'<div id="root">{body}</div>', 1)
+
+
+# =============================================================================
+# Pages
+# =============================================================================
+
+def _headline(article: Dict[str, Any], tag: str, line_1_class: str, line_2_class: str) -> str:
+    """Two-line headline (or the title), as the frontend renders it."""
+    line_1 = article.get("headline_line_1")
+    line_2 = article.get("headline_line_2")
+    if not (line_1 or line_2):
+        return f'<{tag} class="{line_1_class}">{_esc(article.get("title"))}</{tag}>'
+
+    parts = []
+    if line_1:
+        parts.append(f'<{tag} class="{line_1_class}">{_esc(line_1)}</{tag}>')
+    if line_2:
+        parts.append(f'<p class="{line_2_class}">{_esc(line_2)}</p>')
+    return "".join(parts)
+
+
+def _studio_plaque(article: Dict[str, Any], margin: str) -> str:
+    return f'<div class="studio-plaque {margin}">studio update</div>' if article.get("is_studio") else ""
+
+
+def render_digest(edition: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Head tags and #root content of a digest page.
+
+    Args:
+        edition: Digest API response (edition_bundle_response)
+    """
+    edition_date = edition["edition_date"]
+    heading = f"{edition['day_of_week']}, {edition['date_formatted']}"
+    edition_type = _EDITION_TYPES.get(edition.get("edition_type"), str(edition.get("edition_type", "")).title())
+    articles = edition.get("articles") or []
+
+    cards = []
+    for article in articles:
+        image = article.get("image_url")
+        thumbnail = (
+            f'<img src="{_esc(image)}" alt="" class="w-full h-full object-cover" loading="lazy" />'
+            if image else '<div class="w-full h-full bg-secondary"></div>'
+        )
+        cards.append(
+            f'<a href="/article/{edition_date}/{_esc(article["slug"])}" '
+            f'class="flex items-center gap-4 py-4 border-b border-border -mx-5 px-5">'
+            f'<div class="flex-shrink-0 w-[107px] h-20 overflow-hidden bg-secondary rounded">{thumbnail}</div>'
+            f'<div class="flex-1 min-w-0">'
+            f'{_studio_plaque(article, "mb-1.5")}'
+            f'{_headline(article, "h2", "font-semibold text-lg leading-snug line-clamp-2", "text-sm text-muted-foreground leading-snug mt-0.5 line-clamp-1")}'
+            f'<p class="article-source mt-1">{_esc(article.get("source_name"))}</p>'
+            f'</div></a>'
+        )
+
+    def day_link(target: Optional[str], label: str, arrow: str) -> str:
+        if not target:
+            return '<span class="w-7"></span>'
+        return f'<a href="/digest/{target}" class="text-muted-foreground p-1" aria-label="{label}">{arrow}</a>'
+
+    body = (
+        '<div class="min-h-screen flex flex-col bg-background safe-area-top">'
+        '<div class="px-5 py-4 text-center border-b border-border">'
+        '<div class="flex items-center justify-center gap-3">'
+        f'{day_link(edition.get("prev_edition_date"), "Previous day", "‹")}'
+        f'<h1 class="text-lg font-semibold">{_esc(heading)}</h1>'
+        f'{day_link(edition.get("next_edition_date"), "Next day", "›")}'
+        '</div>'
+        f'<p class="text-muted-foreground mt-1">{_esc(edition_type)}</p>'
+        '</div>'
+        f'<main class="flex-1 px-5">{"".join(cards)}</main>'
+        '</div>'
+    )
+
+    head = _head(
+        title=f"{heading} - {SITE_NAME}",
+        description=_description(edition.get("edition_summary") or DEFAULT_DESCRIPTION),
+        path=f"/digest/{edition_date}",
+        image=next((a["image_url"] for a in articles if a.get("image_url")), None),
+    )
+    return head, body
+
+
+def render_article(page: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Head tags and #root content of an article page.
+
+    Args:
+        page: Article API response (article_slug_response)
+    """
+    article = page["article"]
+    edition = page["edition"]
+    edition_date = edition["edition_date"]
+    title = article.get("title") or " ".join(filter(None, (article.get("headline_line_1"), article.get("headline_line_2"))))
+    summary = article.get("ai_summary") or ""
+    image = article.get("image_url")
+
+    paragraphs = [p for p in summary.split("\n\n") if p.strip()]
+    figure = f'<figure class="mb-6 -mx-5"><img src="{_esc(image)}" alt="{_esc(title)}" class="w-full" /></figure>' if image else ""
+
+    def article_link(neighbour: Optional[Dict[str, Any]], rel: str, label: str) -> str:
+        if not neighbour:
+            return "<span></span>"
+        return (f'<a href="/article/{edition_date}/{_esc(neighbour["slug"])}" rel="{rel}" '
+                f'class="flex items-center gap-1 text-sm text-muted-foreground">{label}</a>')
+
+    body = (
+        '<div class="min-h-screen bg-background safe-area-top">'
+        f'<a href="/digest/{edition_date}" class="flex items-center gap-2 px-5 py-3 w-full border-b border-border">'
+        f'<span class="text-base">{_esc(edition["day_of_week"])}, {_esc(edition["date_formatted"])}</span>'
+        f'<span class="ml-auto text-sm text-muted-foreground">{page["position"] + 1}/{page["total"]}</span>'
+        '</a>'
+        '<article class="px-5 py-6">'
+        '<header class="mb-6">'
+        f'{_studio_plaque(article, "mb-4")}'
+        f'{_headline(article, "h1", "text-2xl font-medium leading-tight", "text-lg text-muted-foreground leading-tight mt-1")}'
+        f'<p class="text-base text-muted-foreground italic mt-2">{_esc(article.get("source_name"))}</p>'
+        '</header>'
+        f'{figure}'
+        f'<div class="article-body space-y-4">{"".join(f"<p>{_esc(p)}</p>" for p in paragraphs)}</div>'
+        '<div class="mt-8 pt-6 border-t border-border">'
+        f'<a href="{_esc(article.get("url"))}" target="_blank" rel="noopener noreferrer" '
+        'class="inline-flex items-center gap-2 text-primary hover:underline">Read original</a>'
+        '</div>'
+        '<nav class="mt-8 pt-6 border-t border-border flex items-center justify-between gap-4">'
+        f'{article_link(page.get("prev_article"), "prev", "‹ Previous")}'
+        f'{article_link(page.get("next_article"), "next", "Next ›")}'
+        '</nav>'
+        '</article>'
+        '</div>'
+    )
+
+    path = f"/article/{edition_date}/{article['slug']}"
+    structured_data = {
+        "@context": "https://schema.org",
+        "@type": "NewsArticle",
+        "headline": title,
+        "description": _description(summary),
+        "url": f"{SITE_URL}{path}",
+        "datePublished": edition_date,
+        "isBasedOn": article.get("url") or None,
+        "image": [image] if image else None,
+        "publisher": {"@type": "Organization", "name": SITE_NAME, "url": SITE_URL},
+    }
+
+    head = _head(
+        title=f"{title} - {SITE_NAME}",
+        description=_description(summary or DEFAULT_DESCRIPTION),
+        path=path,
+        image=image,
+        og_type="article",
+        structured_data={k: v for k, v in structured_data.items() if v is not None},
+    )
+    return head, body
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+def _page_payload(head: str, body: str) -> Optional[CachedPayload]:
+    shell = static_site.index
+    document = render_page(shell.body.decode("utf-8"), head, body) if shell is not None else None
+    if document is None:
+        return None
+    return CachedPayload(document.encode("utf-8"), media_type="text/html", cache_control=CACHE_CONTROL_HTML)
+
+
+async def _build_digest(key: tuple, d: date) -> Optional[CachedPayload]:
+    bundle = await get_edition_bundle(d)
+    if not bundle:
+        return None
+
+    payload = _page_payload(*render_digest(edition_bundle_response(bundle, DEFAULT_LANGUAGE)))
+    if payload is None:
+        return None
+    tags = edition_payload_tags(bundle["edition"], [str(a["id"]) for a in bundle["articles"]])
+    return store_payload(key, payload, tags)
+
+
+async def _build_article(key: tuple, d: date, slug: str) -> Optional[CachedPayload]:
+    try:
+        page, tags = await article_slug_response(d, slug, DEFAULT_LANGUAGE)
+    except HTTPException:
+        return None
+
+    payload = _page_payload(*render_article(page))
+    if payload is None:
+        return None
+    return store_payload(key, payload, tags)
+
+
+async def get_page(path: str) -> Optional[CachedPayload]:
+    """
+    Prerendered page for a request path (without the leading slash).
+
+    Returns None when the path has no prerendered page (the SPA shell is
+    served instead): other routes, unknown editions/articles, no frontend
+    build, or Supabase unavailable and no earlier copy of the page.
+    """
+    if static_site.index is None:
+        return None
+
+    match = _DIGEST_PATH.match(path) or _ARTICLE_PATH.match(path)
+    if not match:
+        return None
+    try:
+        d = date.fromisoformat(match.group(1))
+    except ValueError:
+        return None
+
+    if match.re is _DIGEST_PATH:
+        key = ("page", "digest", d.isoformat())
+        build = lambda: _build_digest(key, d)
+    else:
+        slug = match.group(2)
+        key = ("page", "article", d.isoformat(), slug)
+        build = lambda: _build_article(key, d, slug)
+
+    payload = get_payload(key)
+    if payload is not MISS:
+        return payload
+
+    try:
+        return await coalesce(key, build)
+    except DependencyUnavailable:
+        return get_last_good(key)
+
+
+async def prerender_edition(edition_date: str, articles: bool = True) -> int:
+    """
+    Build the digest page of an edition and, optionally, its article pages.
+
+    Returns the number of pages built or already cached.
+    """
+    digest = await get_page(f"digest/{edition_date}")
+    if digest is None:
+        return 0
+
+    slugs: List[str] = []
+    if articles:
+        bundle = await get_edition_bundle(date.fromisoformat(edition_date))
+        if bundle:
+            slugs = [a["slug"] for a in edition_bundle_response(bundle, DEFAULT_LANGUAGE)["articles"]]
+
+    pages = await asyncio.gather(*[get_page(f"article/{edition_date}/{slug}") for slug in slugs])
+    return 1 + sum(page is not None for page in pages)
+
+
+# =============================================================================
+# Home Page
+# =============================================================================
+
+def render_home(shell: str, today: bytes, lang: str) -> Optional[str]:
+    """
+    Put today's digest response into the SPA shell as a boot payload.
+
+    The payload is the serialized API response as is, in a JSON script
+    element the frontend reads before its first render:
+    {"lang": ..., "today": <GET /api/editions/today?lang=...>}.
+
+    Returns None if the shell has no </body> to insert before.
+    """
+    if "</body>" not in shell:
+        return None
+    # "<" only occurs inside JSON strings, where \u003c is the same character;
+    # a literal "</script>" in an article would end the element early
+    data = today.decode("utf-8").replace("<", "\\u003c")
+    boot = f'{{"lang":{json.dumps(lang)},"today":{data}}}'
+    script = f'<script id="{BOOT_ELEMENT_ID}" type="application/json">{boot}</script>'
+    return shell.replace("</body>", f"  {script}\n  </body>", 1)
+
+
+async def _build_home(key: tuple, lang: str) -> Optional[CachedPayload]:
+    today = await get_edition_payload("today", lang)
+    shell = static_site.index
+    if today is None or shell is None:
+        return None
+
+    document = render_home(shell.body.decode("utf-8"), today.body, lang)
+    if document is None:
+        return None
+    # Same tags as the today payload: rebuilt when an edition publishes or
+    # today's edition or one of its articles changes
+    edition = json.loads(today.body)
+    tags = edition_payload_tags(edition, [str(a["id"]) for a in edition["articles"]])
+    tags.append("latest")
+
+    payload = CachedPayload(document.encode("utf-8"), media_type="text/html", cache_control=CACHE_CONTROL_HTML)
+    return store_payload(key, payload, tags)
+
+
+def home_language(cookie: Optional[str]) -> str:
+    """Language of the boot payload, from the frontend's preference cookie."""
+    lang = (cookie or "").strip().lower()
+    return lang if lang in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
+
+
+async def get_home_page(lang: str) -> Optional[CachedPayload]:
+    """
+    Home page with today's digest inlined, in one language.
+
+    Returns None (the plain shell is served) when there is no frontend
+    build or no edition, or when Supabase is unavailable and there is no
+    earlier copy of the page.
+    """
+    if static_site.index is None:
+        return None
+
+    key = ("page", "home", lang)
+    payload = get_payload(key)
+    if payload is not MISS:
+        return payload
+
+    try:
+        return await coalesce(key, lambda: _build_home(key, lang))
+    except DependencyUnavailable:
+        return get_last_good(key)
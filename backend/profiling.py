@@ -0,0 +1,355 @@
+"""
+Request Profiling for ADUmedia Website
+
+On-demand wall-clock profiling of selected requests, switched on from the
+admin API (/api/admin/profiling) without a redeploy.
+
+Requests are selected by path pattern, by sampling rate, or by carrying
+an X-Profile header with the token returned when profiling is enabled.
+While a selected request runs, a background thread samples its stack
+every few milliseconds. The stack is the request task's chain of awaiting
+coroutines, plus the synchronous frames when the task is on the CPU. Time
+spent waiting on Supabase therefore shows up as well as CPU time.
+
+Finished profiles go to a bounded ring buffer and are downloaded in the
+collapsed-stack format ("frame;frame;frame count") read by flamegraph.pl,
+speedscope and similar tools.
+
+When profiling is off the middleware costs one attribute check per request.
+"""
+
+import asyncio
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter, deque
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional
+
+
+PROFILE_BUFFER_SIZE = int(os.getenv("PROFILE_BUFFER_SIZE", "50"))
+
+# Header carrying the token that selects a request for profiling
+PROFILE_HEADER = "x-profile"
+
+# Stack depth kept per sample
+_MAX_DEPTH = 128
+
+
+class Profile:
+    """Stack samples of one request."""
+
+    def __init__(self, profile_id: int, method: str, path: str, reason: str, task: "asyncio.Task[Any]"):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.reason = reason
+        self.route: Optional[str] = None
+        self.status: Optional[int] = None
+        self.started_at = time.time()
+        self.duration: Optional[float] = None
+        self.samples = 0
+        self.stacks: Counter = Counter()
+
+        self._task = task
+        self._loop_thread = threading.get_ident()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "reason": self.reason,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration * 1000, 1) if self.duration is not None else None,
+            "samples": self.samples,
+        }
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format, one stack per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    """
+    Selection settings, the sampling thread and the profile ring buffer.
+
+    Configured through configure() / disable() from the admin API.
+    """
+
+    def __init__(self, buffer_size: int = PROFILE_BUFFER_SIZE):
+        self.enabled = False
+        self.path_pattern: Optional["re.Pattern[str]"] = None
+        self.sample_rate = 0.0
+        self.token: Optional[str] = None
+        self.interval = 0.005
+        self.expires_at: Optional[float] = None
+
+        self.profiles: Deque[Profile] = deque(maxlen=buffer_size)
+        self._active: Dict[int, Profile] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._next_id = 1
+
+    # -------------------------------------------------------------------------
+    # Settings
+    # -------------------------------------------------------------------------
+
+    def configure(
+        self,
+        path_pattern: Optional[str] = None,
+        sample_rate: float = 0.0,
+        use_header: bool = False,
+        interval_ms: float = 5.0,
+        duration_seconds: float = 300.0,
+    ) -> Dict[str, Any]:
+        """
+        Turn profiling on.
+
+        A request is profiled if its path matches path_pattern, if it wins
+        the sample_rate draw, or if it carries the X-Profile token. With
+        path_pattern and sample_rate both set, only matching requests are
+        sampled.
+
+        Args:
+            path_pattern: Regular expression searched in the request path
+            sample_rate: Fraction of requests to profile (0-1)
+            use_header: Generate a token for the X-Profile header
+            interval_ms: Sampling interval
+            duration_seconds: Profiling switches itself off after this
+
+        Raises:
+            ValueError: If path_pattern is not a valid regular expression
+        """
+        try:
+            pattern = re.compile(path_pattern) if path_pattern else None
+        except re.error as e:
+            raise ValueError(f"Invalid path pattern: {e}")
+
+        self.path_pattern = pattern
+        self.sample_rate = sample_rate
+        self.token = secrets.token_urlsafe(16) if use_header else None
+        self.interval = interval_ms / 1000
+        self.expires_at = time.time() + duration_seconds
+        self.enabled = True
+
+        print(f"[PROFILE] Enabled for {duration_seconds:.0f}s: path={path_pattern!r} rate={sample_rate} header={use_header}")
+        return self.settings()
+
+    def disable(self) -> Dict[str, Any]:
+        """Turn profiling off (recorded profiles are kept)."""
+        self.enabled = False
+        self.token = None
+        print("[PROFILE] Disabled")
+        return self.settings()
+
+    def settings(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "path_pattern": self.path_pattern.pattern if self.path_pattern else None,
+            "sample_rate": self.sample_rate,
+            "header": PROFILE_HEADER if self.token else None,
+            "token": self.token,
+            "interval_ms": self.interval * 1000,
+            "expires_in": max(0, round(self.expires_at - time.time())) if self.enabled and self.expires_at else None,
+            "active": len(self._active),
+            "stored": len(self.profiles),
+        }
+
+    def _select(self, path: str, headers: List) -> Optional[str]:
+        """Reason to profile a request, or None."""
+        if self.expires_at is not None and time.time() > self.expires_at:
+            self.disable()
+            return None
+
+        if self.token:
+            for name, value in headers:
+                if name == PROFILE_HEADER.encode() and secrets.compare_digest(value, self.token.encode()):
+                    return "header"
+
+        if self.path_pattern is not None and not self.path_pattern.search(path):
+            return None
+        if self.sample_rate > 0:
+            return "sampled" if random.random() < self.sample_rate else None
+        return "path" if self.path_pattern is not None else None
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    def begin(self, method: str, path: str, headers: List, task: "asyncio.Task[Any]") -> Optional[Profile]:
+        """Start sampling a request if it is selected; returns its profile."""
+        reason = self._select(path, headers)
+        if reason is None:
+            return None
+
+        with self._lock:
+            profile = Profile(self._next_id, method, path, reason, task)
+            self._next_id += 1
+            self._active[profile.id] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample_loop, name="profiler", daemon=True)
+                self._thread.start()
+        return profile
+
+    def finish(self, profile: Profile) -> None:
+        """Stop sampling a request and store its profile."""
+        with self._lock:
+            self._active.pop(profile.id, None)
+            self.profiles.append(profile)
+
+    def _sample_loop(self) -> None:
+        """Sample every active profile until none are left."""
+        while True:
+            with self._lock:
+                active = list(self._active.values())
+                if not active:
+                    self._thread = None
+                    return
+
+            frames = sys._current_frames()
+            for profile in active:
+                stack = _task_stack(profile._task, frames.get(profile._loop_thread))
+                if stack:
+                    profile.stacks[";".join(stack)] += 1
+                    profile.samples += 1
+
+            time.sleep(self.interval)
+
+    # -------------------------------------------------------------------------
+    # Profiles
+    # -------------------------------------------------------------------------
+
+    def get(self, profile_id: int) -> Optional[Profile]:
+        for profile in self.profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def collapsed_all(self) -> str:
+        """Every stored profile merged into one collapsed-stack file."""
+        merged: Counter = Counter()
+        for profile in list(self.profiles):
+            merged.update(profile.stacks)
+        return "".join(f"{stack} {count}\n" for stack, count in merged.most_common())
+
+    def clear(self) -> None:
+        self.profiles.clear()
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = "/".join(code.co_filename.replace("\\", "/").split("/")[-2:])
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _coroutine_frames(awaitable: Any, frames: List[FrameType]) -> None:
+    """Append the frames of a chain of awaiting coroutines/generators."""
+    while awaitable is not None and len(frames) < _MAX_DEPTH:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            return
+        frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+
+
+def _awaited_task(task: "asyncio.Task[Any]", innermost: FrameType) -> Optional["asyncio.Task[Any]"]:
+    """
+    The task that a waiting task is waiting on, if any.
+
+    Covers awaiting a task directly, asyncio.gather (its first pending
+    child) and asyncio.shield / wait_for (a pending task held in the
+    awaiting frame's locals, e.g. SingleFlight.do's shared build).
+    """
+    waiter = getattr(task, "_fut_waiter", None)
+    if waiter is None:
+        return None
+    if isinstance(waiter, asyncio.Task):
+        return waiter
+
+    children = getattr(waiter, "_children", None)
+    candidates = children if children is not None else list(innermost.f_locals.values())
+    for candidate in candidates:
+        if isinstance(candidate, asyncio.Task) and candidate is not task and not candidate.done():
+            return candidate
+    return None
+
+
+def _task_stack(task: "asyncio.Task[Any]", thread_frame: Optional[FrameType]) -> List[str]:
+    """
+    Current stack of a task, outermost first.
+
+    Follows the chain of awaited coroutines from the task's coroutine, and
+    on into the tasks it waits for. If the innermost coroutine is running,
+    the thread's synchronous frames above it are added.
+    """
+    frames: List[FrameType] = []
+    seen = set()
+    while task is not None and id(task) not in seen and len(frames) < _MAX_DEPTH:
+        seen.add(id(task))
+        _coroutine_frames(task.get_coro(), frames)
+        task = _awaited_task(task, frames[-1]) if frames else None
+
+    # Start at the profiling middleware (drop the server's frames above it)
+    for i, frame in enumerate(frames):
+        if frame.f_code is _ROOT_CODE:
+            frames = frames[i + 1:]
+            break
+
+    if not frames:
+        return []
+
+    # Running: the loop thread's stack passes through the innermost coroutine
+    innermost = frames[-1]
+    above: List[FrameType] = []
+    frame = thread_frame
+    while frame is not None and len(above) < _MAX_DEPTH:
+        if frame is innermost:
+            frames.extend(reversed(above))
+            break
+        above.append(frame)
+        frame = frame.f_back
+
+    return [_frame_label(f) for f in frames]
+
+
+profiler = Profiler()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling the requests selected by profiler."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not profiler.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        profile = profiler.begin(scope["method"], scope["path"], scope.get("headers", []), asyncio.current_task())
+        if profile is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            profile.duration = time.perf_counter() - started
+            profile.route = getattr(scope.get("route"), "path", None)
+            profiler.finish(profile)
+
+
+_ROOT_CODE = ProfilingMiddleware.__call__.__code__
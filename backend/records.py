@@ -0,0 +1,267 @@
+"""
+Row Records for ADUmedia Website
+
+Compact, read-only records for the article and edition rows the data layer
+loads and caches (database.py).
+
+A record is built once, when its row arrives from Supabase. The fields the
+public API derives from a row (title, slug, image URLs, formatted dates)
+are computed then, so a response is a straight copy out of the record
+(to_api()) rather than a fresh round of lookups and an R2_PUBLIC_URL read
+per article. Column values live in __slots__ instead of a per-row dict.
+
+Records answer get() and [] like the row dicts they replace, including
+leaving out columns the row was not fetched with, so code that reads rows
+(Typesense, sitemaps, the slug index, admin) works with either.
+"""
+
+import os
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from slugs import article_slug, article_title, assign_slugs
+
+
+R2_PUBLIC_URL = os.getenv("R2_PUBLIC_URL", "")
+
+# Every all_articles column a projection can select (database.ARTICLE_PROJECTIONS)
+ARTICLE_COLUMNS = (
+    "id",
+    "slug",
+    "headline_line_1",
+    "headline",
+    "original_title",
+    "headline_line_2",
+    "source_id",
+    "source_name",
+    "article_url",
+    "ai_summary",
+    "r2_image_path",
+    "image_key",
+    "r2_thumbnail_path",
+    "tags",
+    "selection_category",
+    "is_studio",
+    "headline_translations",
+    "headline_line_1_translations",
+    "headline_line_2_translations",
+    "ai_summary_translations",
+    "original_publish_date",
+    "fetch_date",
+    "created_at",
+    "status",
+    "project_id",
+    "editor_notes",
+)
+
+# editions columns kept in cached records (the rest of select("*") is dropped)
+EDITION_COLUMNS = (
+    "id",
+    "edition_date",
+    "edition_type",
+    "article_ids",
+    "articles_selected",
+    "edition_summary",
+    "created_at",
+)
+
+_ABSENT = object()
+
+
+def format_date(d: date) -> str:
+    """Format date as '30 January 2026'."""
+    return d.strftime("%-d %B %Y")
+
+
+def get_day_of_week(d: date) -> str:
+    """Get day of week name."""
+    return d.strftime("%A")
+
+
+def image_url(path: Optional[str]) -> Optional[str]:
+    """Public R2 URL for an image path, or None."""
+    return f"{R2_PUBLIC_URL}/{path}" if path and R2_PUBLIC_URL else None
+
+
+# =============================================================================
+# Records
+# =============================================================================
+
+class _Record:
+    """Read-only row: column values in slots, plus derived fields."""
+
+    __slots__ = ()
+
+    COLUMNS: frozenset = frozenset()
+
+    def __init__(self, row: Dict[str, Any]):
+        for column in self.COLUMNS:
+            value = row.get(column, _ABSENT)
+            if value is not _ABSENT:
+                object.__setattr__(self, column, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def get(self, column: str, default: Any = None) -> Any:
+        """Column value, or default if the row was loaded without it."""
+        if column in self.COLUMNS:
+            return getattr(self, column, default)
+        return default
+
+    def __getitem__(self, column: str) -> Any:
+        value = self.get(column, _ABSENT)
+        if value is _ABSENT:
+            raise KeyError(column)
+        return value
+
+    def __contains__(self, column: str) -> bool:
+        return self.get(column, _ABSENT) is not _ABSENT
+
+    def to_row(self) -> Dict[str, Any]:
+        """The loaded columns as a plain dict."""
+        return {c: getattr(self, c) for c in self.COLUMNS if hasattr(self, c)}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_row()!r})"
+
+
+class ArticleRecord(_Record):
+    """
+    An all_articles row with its API fields precomputed.
+
+    Attributes (besides the columns):
+        projection: Projection the row was fetched with
+        title: Title used for the API and slugs
+        resolved_slug: Stored slug, or one generated from the title
+        image_url: Full-size image URL (or None)
+        thumbnail_url: Thumbnail URL, falling back to the full-size image
+    """
+
+    __slots__ = ARTICLE_COLUMNS + ("projection", "title", "resolved_slug", "image_url", "thumbnail_url")
+
+    COLUMNS = frozenset(ARTICLE_COLUMNS)
+
+    def __init__(self, row: Dict[str, Any], projection: str):
+        super().__init__(row)
+        object.__setattr__(self, "id", str(row.get("id", "")))
+
+        full_size = image_url(row.get("r2_image_path") or row.get("image_key"))
+        thumbnail = row.get("r2_thumbnail_path")
+
+        derived = {
+            "projection": projection,
+            "title": article_title(row),
+            "resolved_slug": article_slug(row),
+            "image_url": full_size,
+            "thumbnail_url": image_url(thumbnail) if thumbnail else full_size,
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+    def to_api(self, use_thumbnail: bool = False, slug: Optional[str] = None) -> dict:
+        """
+        Article in API format.
+
+        Args:
+            use_thumbnail: If True, use the thumbnail; if False, the full-size image
+            slug: Slug to use instead of resolved_slug (e.g. unique within an edition)
+        """
+        result = {
+            "id": self.id,
+            "title": self.title,
+            "slug": slug or self.resolved_slug,
+            "source_id": getattr(self, "source_id", ""),
+            "source_name": getattr(self, "source_name", ""),
+            "url": getattr(self, "article_url", ""),
+            "ai_summary": getattr(self, "ai_summary", None) or "",
+            "image_url": self.thumbnail_url if use_thumbnail else self.image_url,
+            "tags": getattr(self, "tags", None) or [],
+            "category": getattr(self, "selection_category", ""),
+            "is_studio": getattr(self, "is_studio", False),
+            "headline_line_1": getattr(self, "headline_line_1", None) or "",
+            "headline_line_2": getattr(self, "headline_line_2", None) or "",
+            "headline_translations": getattr(self, "headline_translations", None) or {},
+            "headline_line_1_translations": getattr(self, "headline_line_1_translations", None) or {},
+            "headline_line_2_translations": getattr(self, "headline_line_2_translations", None) or {},
+            "ai_summary_translations": getattr(self, "ai_summary_translations", None) or {},
+            "published_date": getattr(self, "original_publish_date", ""),
+        }
+        return result
+
+
+class EditionRecord(_Record):
+    """
+    An editions row with its display dates precomputed.
+
+    Attributes (besides the columns):
+        date_formatted: e.g. "30 January 2026"
+        day_of_week: e.g. "Friday"
+    """
+
+    __slots__ = EDITION_COLUMNS + ("date_formatted", "day_of_week")
+
+    COLUMNS = frozenset(EDITION_COLUMNS)
+
+    def __init__(self, row: Dict[str, Any]):
+        super().__init__(row)
+        object.__setattr__(self, "id", str(row.get("id", "")))
+
+        edition_date = date.fromisoformat(row["edition_date"])
+        object.__setattr__(self, "date_formatted", format_date(edition_date))
+        object.__setattr__(self, "day_of_week", get_day_of_week(edition_date))
+
+    def to_api(self) -> dict:
+        """Edition summary in API format (no articles)."""
+        return {
+            "id": self.id,
+            "edition_type": getattr(self, "edition_type", "daily"),
+            "edition_date": self.edition_date,
+            "article_count": getattr(self, "articles_selected", 0),
+            "date_formatted": self.date_formatted,
+            "day_of_week": self.day_of_week,
+        }
+
+
+# =============================================================================
+# Conversion
+# =============================================================================
+
+def article_record(article: Any, projection: str) -> ArticleRecord:
+    """Record for an article row (records are returned as they are)."""
+    if isinstance(article, ArticleRecord):
+        return article
+    return ArticleRecord(article, projection)
+
+
+def article_records(rows: Iterable[Any], projection: str) -> List[ArticleRecord]:
+    """Records for article rows fetched with projection."""
+    return [article_record(row, projection) for row in rows]
+
+
+def edition_slugs(articles: List[ArticleRecord]) -> List[str]:
+    """
+    Slugs for one edition's article records, unique within the edition.
+
+    Same result as slugs.assign_slugs(), which only has to run when two
+    articles resolve to the same slug.
+    """
+    slugs = [article.resolved_slug for article in articles]
+    if len(set(slugs)) == len(slugs):
+        return slugs
+    return assign_slugs(articles)
+
+
+def edition_record(edition: Any) -> Optional[EditionRecord]:
+    """Record for an edition row (None and records are returned as they are)."""
+    if edition is None or isinstance(edition, EditionRecord):
+        return edition
+    return EditionRecord(edition)
+
+
+def edition_records(rows: Iterable[Any]) -> List[EditionRecord]:
+    """Records for edition rows."""
+    return [edition_record(row) for row in rows]
@@ -5,9 +5,11 @@ Admin API Routes for ADUmedia Website
 Protected endpoints for the admin dashboard.
 """
 
+import asyncio
 from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import PlainTextResponse
 from typesense_sync import full_reindex
 
 from auth import get_current_user, verify_password, create_access_token
@@ -21,15 +23,21 @@ from database import (
     delete_article,
     remove_article_from_edition,
     get_stats,
+    get_cache_stats,
+    supabase_breaker,
 )
+from http_cache import payload_cache, last_good_cache
 from models import (
     LoginRequest,
     LoginResponse,
     UserInfo,
     ArticleUpdate,
     EditionUpdate,
+    ProfilingRequest,
 )
-from routes.public import transform_article, transform_edition
+from profiling import profiler
+from static_files import static_site
+from routes.public import transform_article, transform_edition, flights, edition_snapshots
 
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -86,7 +94,7 @@ async def get_me(user: dict = Depends(get_current_user)):
 @router.get("/stats")
 async def get_dashboard_stats(user: dict = Depends(get_current_user)):
     """Get statistics for admin dashboard."""
-    stats = get_stats()
+    stats = await get_stats()
     
     # Transform recent editions
     stats["recent_editions"] = [
@@ -96,6 +104,83 @@ async def get_dashboard_stats(user: dict = Depends(get_current_user)):
     return stats
 
 
+@router.get("/cache")
+async def get_cache_status(user: dict = Depends(get_current_user)):
+    """Get in-process cache, request-coalescing, snapshot, circuit breaker and static file counters."""
+    return {
+        "caches": get_cache_stats() + [payload_cache.stats(), last_good_cache.stats()],
+        "singleflight": flights.stats(),
+        "snapshots": edition_snapshots.stats(),
+        "breakers": [supabase_breaker.stats()],
+        "static": static_site.stats(),
+    }
+
+
+# =============================================================================
+# Profiling
+# =============================================================================
+
+@router.get("/profiling")
+async def get_profiling(user: dict = Depends(get_current_user)):
+    """Get the request profiling settings."""
+    return profiler.settings()
+
+
+@router.put("/profiling")
+async def enable_profiling(request: ProfilingRequest, user: dict = Depends(get_current_user)):
+    """
+    Profile requests by path pattern, sampling rate and/or X-Profile header.
+
+    Returns the settings, including the X-Profile token if requested.
+    Profiling switches itself off after duration_seconds.
+    """
+    if not (request.path_pattern or request.sample_rate or request.use_header):
+        raise HTTPException(status_code=400, detail="Set path_pattern, sample_rate or use_header")
+
+    try:
+        return profiler.configure(**request.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.delete("/profiling")
+async def disable_profiling(user: dict = Depends(get_current_user)):
+    """Turn request profiling off (stored profiles are kept)."""
+    return profiler.disable()
+
+
+@router.get("/profiles")
+async def list_profiles(user: dict = Depends(get_current_user)):
+    """List stored profiles, newest first."""
+    return {"profiles": [p.summary() for p in reversed(profiler.profiles)]}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(profile_id: str, user: dict = Depends(get_current_user)):
+    """
+    Download a profile in collapsed-stack format (flamegraph.pl, speedscope).
+
+    Args:
+        profile_id: Profile ID, or "all" to merge every stored profile
+    """
+    if profile_id == "all":
+        body, filename = profiler.collapsed_all(), "profiles-all.folded"
+    else:
+        profile = profiler.get(int(profile_id)) if profile_id.isdigit() else None
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        body, filename = profile.collapsed(), f"profile-{profile.id}.folded"
+
+    return PlainTextResponse(body, headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
+
+@router.delete("/profiles")
+async def clear_profiles(user: dict = Depends(get_current_user)):
+    """Delete every stored profile."""
+    profiler.clear()
+    return {"status": "cleared"}
+
+
 # =============================================================================
 # Editions
 # =============================================================================
@@ -107,7 +192,7 @@ async def list_editions_admin(
     user: dict = Depends(get_current_user),
 ):
     """List editions for admin dashboard."""
-    editions = get_editions(limit=limit, offset=offset)
+    editions = await get_editions(limit=limit, offset=offset)
     
     return {
         "editions": [transform_edition(e) for e in editions],
@@ -123,13 +208,13 @@ async def get_edition_admin(
     """Get single edition with full details."""
     from database import get_articles_by_ids
     
-    edition = get_edition_by_id(edition_id)
+    edition = await get_edition_by_id(edition_id)
     
     if not edition:
         raise HTTPException(status_code=404, detail="Edition not found")
     
     article_ids = edition.get("article_ids", [])
-    articles = get_articles_by_ids(article_ids) if article_ids else []
+    articles = await get_articles_by_ids(article_ids) if article_ids else []
     
     return transform_edition(edition, articles)
 
@@ -141,7 +226,7 @@ async def update_edition_admin(
     user: dict = Depends(get_current_user),
 ):
     """Update an edition."""
-    edition = get_edition_by_id(edition_id)
+    edition = await get_edition_by_id(edition_id)
     
     if not edition:
         raise HTTPException(status_code=404, detail="Edition not found")
@@ -151,7 +236,7 @@ async def update_edition_admin(
     if not update_data:
         raise HTTPException(status_code=400, detail="No updates provided")
     
-    result = update_edition(edition_id, update_data)
+    result = await update_edition(edition_id, update_data)
     
     if not result:
         raise HTTPException(status_code=500, detail="Update failed")
@@ -166,7 +251,7 @@ async def remove_from_edition(
     user: dict = Depends(get_current_user),
 ):
     """Remove an article from an edition."""
-    success = remove_article_from_edition(edition_id, article_id)
+    success = await remove_article_from_edition(edition_id, article_id)
     
     if not success:
         raise HTTPException(
@@ -185,7 +270,8 @@ async def remove_from_edition(
 async def trigger_reindex(user: dict = Depends(get_current_user)):
     """Trigger a full Typesense re-index."""
     try:
-        result = full_reindex()
+        # Sync Supabase + Typesense clients: run off the event loop
+        result = await asyncio.to_thread(full_reindex)
         return {
             "message": "Re-index complete",
             "indexed": result["indexed"],
@@ -210,10 +296,10 @@ async def search_articles_admin(
     if not q:
         raise HTTPException(status_code=400, detail="Search query required")
     
-    articles = search_articles(q, limit=limit, offset=offset)
+    articles = await search_articles(q, limit=limit, offset=offset)
     
     return {
-        "articles": [transform_article(a) for a in articles],
+        "articles": [transform_article(a, projection="card") for a in articles],
         "query": q,
         "total": len(articles),
     }
@@ -225,13 +311,13 @@ async def get_article_admin(
     user: dict = Depends(get_current_user),
 ):
     """Get single article with full details."""
-    article = get_article_by_id(article_id)
+    article = await get_article_by_id(article_id, projection="admin")
     
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
     # Include extra fields for admin
-    result = transform_article(article)
+    result = transform_article(article, projection="admin")
     result.update({
         "status": article.get("status", ""),
         "fetch_date": article.get("fetch_date", ""),
@@ -249,7 +335,7 @@ async def update_article_admin(
     user: dict = Depends(get_current_user),
 ):
     """Update an article."""
-    article = get_article_by_id(article_id)
+    article = await get_article_by_id(article_id, projection="title")
     
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
@@ -259,7 +345,7 @@ async def update_article_admin(
     if not update_data:
         raise HTTPException(status_code=400, detail="No updates provided")
     
-    result = update_article(article_id, update_data)
+    result = await update_article(article_id, update_data)
     
     if not result:
         raise HTTPException(status_code=500, detail="Update failed")
@@ -273,12 +359,12 @@ async def delete_article_admin(
     user: dict = Depends(get_current_user),
 ):
     """Soft-delete an article."""
-    article = get_article_by_id(article_id)
+    article = await get_article_by_id(article_id, projection="title")
     
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
     
-    success = delete_article(article_id)
+    success = await delete_article(article_id)
     
     if not success:
         raise HTTPException(status_code=500, detail="Delete failed")
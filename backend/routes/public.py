@@ -5,149 +5,290 @@ Public API Routes for ADUmedia Website
 Unauthenticated endpoints for the public website.
 """
 
+import asyncio
 import os
-import re
-import unicodedata
 from datetime import date, datetime
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+from typing import Awaitable, Callable, Hashable, Iterator, List, Optional, Tuple, Union
+from fastapi import APIRouter, HTTPException, Query, Path, Request
+from fastapi.responses import Response, StreamingResponse
 from typesense_sync import get_search_config
+from slug_index import find_article
+from records import article_record, edition_record, edition_slugs
+from sitemap import get_months, get_month_entries, render_index, render_pages, render_month
+from cache import MISS
+from breaker import DependencyUnavailable
+from singleflight import SingleFlight
+from snapshots import SnapshotStore
+from http_cache import (
+    CachedPayload,
+    cache_stream,
+    CACHE_CONTROL_IMMUTABLE,
+    CACHE_CONTROL_SHORT,
+    CACHE_CONTROL_MEDIUM,
+    CACHE_CONTROL_SEO,
+    conditional_response,
+    edition_payload_tags,
+    get_last_good,
+    get_payload,
+    make_payload,
+    stale_headers,
+    store_payload,
+)
 
 from database import (
     get_editions,
+    get_edition_bundle,
     get_edition_by_date,
-    get_latest_edition,
-    get_articles_by_ids,
-    get_article_by_id,
     get_adjacent_edition_dates,
+    get_article_by_id,
+    on_edition_change,
 )
 
 
 router = APIRouter(prefix="/api", tags=["public"])
 
+# Languages offered by the frontend (lib/cookies.ts); English is the source
+SUPPORTED_LANGUAGES = ("en", "es", "fr", "pt-br", "ru")
+DEFAULT_LANGUAGE = "en"
 
-# =============================================================================
-# Helper Functions
-# =============================================================================
+# API field -> field holding its translations
+LOCALIZED_FIELDS = (
+    ("title", "headline_translations"),
+    ("headline_line_1", "headline_line_1_translations"),
+    ("headline_line_2", "headline_line_2_translations"),
+    ("ai_summary", "ai_summary_translations"),
+)
 
-def format_date(d: date) -> str:
-    """Format date as '30 January 2026'."""
-    return d.strftime("%-d %B %Y")
+LANG_QUERY = Query(
+    None,
+    max_length=10,
+    description="Resolve translations server-side (falls back to English)",
+)
 
+# Concurrent cache misses for the same payload share one build
+flights = SingleFlight("public")
 
-def get_day_of_week(d: date) -> str:
-    """Get day of week name."""
-    return d.strftime("%A")
 
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+async def coalesce(key: Hashable, build: Callable[[], Awaitable[Optional[CachedPayload]]]) -> Optional[CachedPayload]:
+    """
+    Build a payload once for all concurrent requests with the same key.
 
-def generate_slug(title: str, max_length: int = 80) -> str:
+    Errors raised by build reach every waiting request; a build that
+    exceeds the single-flight timeout raises DependencyUnavailable.
     """
-    Generate a URL-friendly slug from a title.
+    try:
+        return await flights.do(key, build)
+    except asyncio.TimeoutError:
+        raise DependencyUnavailable(f"Building {key} timed out")
 
-    Examples:
-        "Zaha Hadid Architects' New Tower in Beijing" -> "zaha-hadid-architects-new-tower-in-beijing"
-        "BIG Designs $2.5B Mixed-Use Complex" -> "big-designs-2-5b-mixed-use-complex"
 
-    Args:
-        title: Article title/headline
-        max_length: Maximum slug length
+def last_good_response(request: Request, key: Hashable, error: DependencyUnavailable) -> Response:
+    """
+    Serve the last good payload for key while Supabase is unavailable.
 
-    Returns:
-        URL-safe slug string
+    The response carries an X-Stale-Age header. Without a last good copy
+    the error is re-raised (a fast 503, see main.py).
     """
-    if not title:
-        return "untitled"
+    payload = get_last_good(key)
+    if payload is None:
+        raise error
 
-    # Normalize unicode characters (e.g., accented chars -> ascii)
-    slug = unicodedata.normalize("NFKD", title)
-    slug = slug.encode("ascii", "ignore").decode("ascii")
+    print(f"[API] Serving last good {key}: {error}")
+    return conditional_response(request, payload, headers=stale_headers(payload))
 
-    # Lowercase
-    slug = slug.lower()
 
-    # Replace common separators with hyphens
-    slug = re.sub(r"[''`]", "", slug)          # Remove apostrophes
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)    # Replace non-alphanumeric with hyphens
-    slug = re.sub(r"-+", "-", slug)             # Collapse multiple hyphens
-    slug = slug.strip("-")                       # Remove leading/trailing hyphens
+def resolve_language(lang: Optional[str]) -> Optional[str]:
+    """
+    Normalize a ?lang= value.
 
-    # Truncate at word boundary
-    if len(slug) > max_length:
-        slug = slug[:max_length].rsplit("-", 1)[0]
+    Returns None when no language was requested (all translations are
+    returned), and the default language for unsupported ones.
+    """
+    if lang is None:
+        return None
+    lang = lang.strip().lower()
+    return lang if lang in SUPPORTED_LANGUAGES else DEFAULT_LANGUAGE
 
-    return slug or "untitled"
 
+def localize_article(article: dict, lang: str) -> dict:
+    """
+    Replace translatable fields with one language, in place.
 
-def transform_article(article: dict, use_thumbnail: bool = False) -> dict:
+    The *_translations dicts are dropped; fields without a translation
+    keep their English text.
+    """
+    for field, translations_field in LOCALIZED_FIELDS:
+        translations = article.pop(translations_field, None)
+        if lang != DEFAULT_LANGUAGE and translations and translations.get(lang):
+            article[field] = translations[lang]
+    article["lang"] = lang
+    return article
+
+
+def transform_article(
+    article: dict,
+    use_thumbnail: bool = False,
+    projection: str = "detail",
+    lang: Optional[str] = None,
+) -> dict:
     """
     Transform database article to API format.
 
     Args:
-        article: Article dict from Supabase
+        article: Article record (or row dict) from the database layer
         use_thumbnail: If True, use thumbnail image; if False, use full-size
+        projection: Projection a row dict was fetched with (see database.ARTICLE_PROJECTIONS);
+            fields whose columns it lacks are left out
+        lang: If set, resolve translations to this language (see localize_article)
     """
-    r2_url = os.getenv("R2_PUBLIC_URL", "")
+    result = article_record(article, projection).to_api(use_thumbnail)
 
-    # Choose image path based on context
-    if use_thumbnail and article.get("r2_thumbnail_path"):
-        # Use thumbnail for list views (faster loading)
-        image_path = article.get("r2_thumbnail_path")
-    else:
-        # Use full-size for detail views or if no thumbnail available
-        image_path = article.get("r2_image_path") or article.get("image_key")
-
-    # Prefer headline over original_title if available
-    title = article.get("headline_line_1") or article.get("headline") or article.get("original_title", "")
-
-    return {
-        "id": str(article.get("id", "")),
-        "title": title,
-        "slug": generate_slug(title),
-        "source_id": article.get("source_id", ""),
-        "source_name": article.get("source_name", ""),
-        "url": article.get("article_url", ""),
-        "published_date": article.get("original_publish_date", ""),
-        "ai_summary": article.get("ai_summary", "") or "",
-        "image_url": f"{r2_url}/{image_path}" if image_path and r2_url else None,
-        "tags": article.get("tags") or [],
-        "category": article.get("selection_category", ""),
-        "is_studio": article.get("is_studio", False),
-        "headline_line_1": article.get("headline_line_1") or "",
-        "headline_line_2": article.get("headline_line_2") or "",
-        "headline_translations": article.get("headline_translations") or {},
-        "headline_line_1_translations": article.get("headline_line_1_translations") or {},
-        "headline_line_2_translations": article.get("headline_line_2_translations") or {},
-        "ai_summary_translations": article.get("ai_summary_translations") or {},
-    }
+    if lang:
+        localize_article(result, lang)
+
+    return result
 
 
-def transform_edition(edition: dict, articles: list = None, use_thumbnails: bool = False) -> dict:
+def transform_edition(
+    edition: dict,
+    articles: list = None,
+    use_thumbnails: bool = False,
+    lang: Optional[str] = None,
+) -> dict:
     """
     Transform database edition to API format.
 
     Args:
-        edition: Edition dict from Supabase
-        articles: Optional list of article dicts
+        edition: Edition record (or row dict) from the database layer
+        articles: Optional list of article records ("card" projection)
         use_thumbnails: If True, use thumbnails for article images
+        lang: If set, resolve article translations to this language
     """
-    edition_date = date.fromisoformat(edition["edition_date"])
-
-    result = {
-        "id": str(edition.get("id", "")),
-        "edition_type": edition.get("edition_type", "daily"),
-        "edition_date": edition.get("edition_date", ""),
-        "article_count": edition.get("articles_selected", 0),
-        "date_formatted": format_date(edition_date),
-        "day_of_week": get_day_of_week(edition_date),
-    }
+    result = edition_record(edition).to_api()
 
     if articles is not None:
-        result["articles"] = [transform_article(a, use_thumbnail=use_thumbnails) for a in articles]
+        records = [article_record(a, "card") for a in articles]
+        # Slugs unique within the edition (matters for articles without a stored slug)
+        result["articles"] = [
+            record.to_api(use_thumbnails, slug)
+            for record, slug in zip(records, edition_slugs(records))
+        ]
+        if lang:
+            for item in result["articles"]:
+                localize_article(item, lang)
         result["edition_summary"] = edition.get("edition_summary", "")
 
     return result
 
+
+def edition_bundle_response(bundle: dict, lang: Optional[str] = None) -> dict:
+    """
+    Build the digest API response from an edition bundle.
+
+    Uses thumbnails for list-style display.
+    """
+    result = transform_edition(bundle["edition"], bundle["articles"], use_thumbnails=True, lang=lang)
+    result["prev_edition_date"] = bundle["prev_edition_date"]
+    result["next_edition_date"] = bundle["next_edition_date"]
+    return result
+
+
+def edition_payload_key(target: Union[date, str], lang: Optional[str]) -> tuple:
+    """Payload cache key for a digest response."""
+    return ("edition", target if isinstance(target, str) else target.isoformat(), lang)
+
+
+async def get_edition_payload(
+    target: Union[date, str],
+    lang: Optional[str] = None,
+) -> Optional[CachedPayload]:
+    """
+    Get the serialized digest response for a date, "today" or "latest".
+
+    Past editions that already have a next edition are marked immutable;
+    everything else gets a short Cache-Control policy.
+
+    Args:
+        target: Edition date, "today" or "latest"
+        lang: Resolved language, or None for all translations
+
+    Returns:
+        Cached payload, or None if there is no matching edition
+    """
+    key = edition_payload_key(target, lang)
+
+    payload = get_payload(key)
+    if payload is not MISS:
+        return payload
+
+    return await coalesce(key, lambda: _build_edition_payload(key, target, lang))
+
+
+async def _build_edition_payload(
+    key: tuple,
+    target: Union[date, str],
+    lang: Optional[str],
+) -> Optional[CachedPayload]:
+    """Fetch an edition bundle and cache its digest response under key."""
+    bundle = await get_edition_bundle(target)
+    if not bundle:
+        return None
+
+    result = edition_bundle_response(bundle, lang)
+
+    is_final = isinstance(target, date) and result["next_edition_date"] is not None
+    cache_control = CACHE_CONTROL_IMMUTABLE if is_final else CACHE_CONTROL_SHORT
+
+    tags = edition_payload_tags(bundle["edition"], [str(a["id"]) for a in bundle["articles"]])
+    if isinstance(target, str):
+        tags.append("latest")
+
+    return store_payload(key, make_payload(result, cache_control), tags)
+
+
+async def _build_edition_snapshot(snapshot_key: tuple) -> Optional[CachedPayload]:
+    """Rebuild a today/latest payload, bypassing the payload cache."""
+    target, lang = snapshot_key
+    key = edition_payload_key(target, lang)
+    return await coalesce(key, lambda: _build_edition_payload(key, target, lang))
+
+
+# Last good /editions/today and /editions/latest payloads, keyed by (target, lang)
+edition_snapshots = SnapshotStore("editions", _build_edition_snapshot)
+
+# A published or edited edition is picked up right away, not at the next interval
+on_edition_change(lambda edition_id, edition_date: edition_snapshots.request_refresh())
+
+
+async def edition_snapshot_response(request: Request, target: str, lang: Optional[str]) -> Response:
+    """
+    Serve "today" or "latest" from its snapshot.
+
+    Without a usable snapshot (first request, or older than the maximum
+    staleness) the payload is fetched as usual and becomes the snapshot.
+    """
+    snapshot_key = (target, lang)
+
+    snapshot = edition_snapshots.get(snapshot_key)
+    if snapshot is None:
+        try:
+            payload = await get_edition_payload(target, lang)
+        except DependencyUnavailable as e:
+            return last_good_response(request, edition_payload_key(target, lang), e)
+        edition_snapshots.put(snapshot_key, payload)
+        age = 0.0
+    else:
+        payload, age = snapshot
+
+    if not payload:
+        raise HTTPException(status_code=404, detail="No editions found")
+
+    return conditional_response(request, payload, headers=edition_snapshots.age_headers(age))
+
 # =============================================================================
 # Search Index
 # =============================================================================
@@ -167,6 +308,7 @@ async def search_config():
 
 @router.get("/editions")
 async def list_editions(
+    request: Request,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     type: Optional[str] = Query(None, pattern="^(daily|weekend|weekly)$"),
@@ -182,83 +324,57 @@ async def list_editions(
     Returns:
         List of edition summaries (without articles)
     """
-    editions = get_editions(limit=limit + 1, offset=offset, edition_type=type)
+    key = ("editions", limit, offset, type)
 
-    has_more = len(editions) > limit
-    if has_more:
-        editions = editions[:limit]
+    async def build() -> CachedPayload:
+        editions = await get_editions(limit=limit + 1, offset=offset, edition_type=type)
 
-    return {
-        "editions": [transform_edition(e, use_thumbnails=True) for e in editions],
-        "total": len(editions),
-        "has_more": has_more,
-    }
+        has_more = len(editions) > limit
+        if has_more:
+            editions = editions[:limit]
+
+        return store_payload(key, make_payload({
+            "editions": [transform_edition(e, use_thumbnails=True) for e in editions],
+            "total": len(editions),
+            "has_more": has_more,
+        }, CACHE_CONTROL_MEDIUM), tags=["edition-list"])
+
+    payload = get_payload(key)
+    if payload is MISS:
+        try:
+            payload = await coalesce(key, build)
+        except DependencyUnavailable as e:
+            return last_good_response(request, key, e)
+
+    return conditional_response(request, payload)
 
 
 @router.get("/editions/today")
-async def get_today():
+async def get_today(request: Request, lang: Optional[str] = LANG_QUERY):
     """
     Get today's edition.
 
     Returns the latest edition if today has no edition.
-    Uses thumbnails for list-style display.
+    Uses thumbnails for list-style display. Served from a snapshot
+    (see edition_snapshot_response).
     """
-    # Try today first
-    edition = get_edition_by_date(date.today())
-
-    # Fall back to latest
-    if not edition:
-        edition = get_latest_edition()
-
-    if not edition:
-        raise HTTPException(status_code=404, detail="No editions found")
-
-    # Get articles - convert IDs to strings for consistent matching
-    raw_article_ids = edition.get("article_ids", [])
-    article_ids = [str(aid) for aid in raw_article_ids] if raw_article_ids else []
-
-    articles = get_articles_by_ids(article_ids) if article_ids else []
-
-    # Use thumbnails for today view (list of articles)
-    edition_date_obj = date.fromisoformat(edition["edition_date"])
-    adjacent = get_adjacent_edition_dates(edition_date_obj)
-
-    result = transform_edition(edition, articles, use_thumbnails=True)
-    result["prev_edition_date"] = adjacent["prev_edition_date"]
-    result["next_edition_date"] = adjacent["next_edition_date"]
-    return result
+    return await edition_snapshot_response(request, "today", resolve_language(lang))
 
 
 @router.get("/editions/latest")
-async def get_latest():
-    """Get the most recent edition. Uses thumbnails."""
-    edition = get_latest_edition()
-
-    if not edition:
-        raise HTTPException(status_code=404, detail="No editions found")
-
-    # Get articles - convert IDs to strings for consistent matching
-    raw_article_ids = edition.get("article_ids", [])
-    article_ids = [str(aid) for aid in raw_article_ids] if raw_article_ids else []
-    articles = get_articles_by_ids(article_ids) if article_ids else []
-
-    # Use thumbnails for list view
-    edition_date_obj = date.fromisoformat(edition["edition_date"])
-    adjacent = get_adjacent_edition_dates(edition_date_obj)
-
-    result = transform_edition(edition, articles, use_thumbnails=True)
-    result["prev_edition_date"] = adjacent["prev_edition_date"]
-    result["next_edition_date"] = adjacent["next_edition_date"]
-    return result
+async def get_latest(request: Request, lang: Optional[str] = LANG_QUERY):
+    """Get the most recent edition. Uses thumbnails. Served from a snapshot."""
+    return await edition_snapshot_response(request, "latest", resolve_language(lang))
 
 
 @router.get("/editions/{edition_date}")
-async def get_by_date(edition_date: str):
+async def get_by_date(edition_date: str, request: Request, lang: Optional[str] = LANG_QUERY):
     """
     Get edition for a specific date.
 
     Args:
         edition_date: Date in YYYY-MM-DD format
+        lang: Language to resolve translations to (optional)
 
     Uses thumbnails for list-style display.
     """
@@ -267,23 +383,16 @@ async def get_by_date(edition_date: str):
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-    edition = get_edition_by_date(d)
+    lang = resolve_language(lang)
+    try:
+        payload = await get_edition_payload(d, lang)
+    except DependencyUnavailable as e:
+        return last_good_response(request, edition_payload_key(d, lang), e)
 
-    if not edition:
+    if not payload:
         raise HTTPException(status_code=404, detail=f"No edition for {edition_date}")
 
-    # Get articles - convert IDs to strings for consistent matching
-    raw_article_ids = edition.get("article_ids", [])
-    article_ids = [str(aid) for aid in raw_article_ids] if raw_article_ids else []
-    articles = get_articles_by_ids(article_ids) if article_ids else []
-
-    # Use thumbnails for digest view
-    adjacent = get_adjacent_edition_dates(d)
-
-    result = transform_edition(edition, articles, use_thumbnails=True)
-    result["prev_edition_date"] = adjacent["prev_edition_date"]
-    result["next_edition_date"] = adjacent["next_edition_date"]
-    return result
+    return conditional_response(request, payload)
 
 
 # =============================================================================
@@ -291,77 +400,249 @@ async def get_by_date(edition_date: str):
 # =============================================================================
 
 @router.get("/articles/{article_id}")
-async def get_article(article_id: str):
+async def get_article(article_id: str, request: Request, lang: Optional[str] = LANG_QUERY):
     """
     Get single article by ID.
 
     Args:
         article_id: Article UUID
+        lang: Language to resolve translations to (optional)
 
     Returns full-size image (not thumbnail) for detail view.
     """
-    article = get_article_by_id(article_id)
+    lang = resolve_language(lang)
+    key = ("article", article_id, lang)
+
+    async def build() -> CachedPayload:
+        article = await get_article_by_id(article_id, projection="detail")
+
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+
+        # Use full-size image for article detail view
+        result = transform_article(article, use_thumbnail=False, projection="detail", lang=lang)
+        return store_payload(key, make_payload(result, CACHE_CONTROL_MEDIUM), tags=[f"article:{article_id}"])
+
+    payload = get_payload(key)
+    if payload is MISS:
+        try:
+            payload = await coalesce(key, build)
+        except DependencyUnavailable as e:
+            return last_good_response(request, key, e)
+
+    return conditional_response(request, payload)
+
+
+@router.get("/article/{edition_date}/{slug}")
+async def get_article_by_slug(
+    edition_date: str,
+    slug: str,
+    request: Request,
+    lang: Optional[str] = LANG_QUERY,
+):
+    """
+    Get an article by its public URL (/article/{date}/{slug}).
+
+    Returns the article with its position in the edition and the slugs of
+    its neighbours, instead of the whole digest.
+
+    Args:
+        edition_date: Edition date in YYYY-MM-DD format
+        slug: Article slug
+        lang: Language to resolve translations to (optional)
+    """
+    try:
+        d = date.fromisoformat(edition_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    lang = resolve_language(lang)
+    key = ("article-slug", d.isoformat(), slug, lang)
+
+    payload = get_payload(key)
+    if payload is MISS:
+        try:
+            payload = await coalesce(key, lambda: _build_article_slug_payload(key, d, slug, lang))
+        except DependencyUnavailable as e:
+            return last_good_response(request, key, e)
+
+    return conditional_response(request, payload)
+
+
+async def _build_article_slug_payload(
+    key: tuple,
+    d: date,
+    slug: str,
+    lang: Optional[str],
+) -> CachedPayload:
+    """Look up an article by edition date and slug and cache its response under key."""
+    result, tags = await article_slug_response(d, slug, lang)
+
+    is_final = result["next_edition_date"] is not None
+    cache_control = CACHE_CONTROL_IMMUTABLE if is_final else CACHE_CONTROL_SHORT
+
+    return store_payload(key, make_payload(result, cache_control), tags)
+
+
+async def article_slug_response(d: date, slug: str, lang: Optional[str]) -> Tuple[dict, List[str]]:
+    """
+    Build the /article/{date}/{slug} response.
+
+    Returns:
+        (response, cache tags)
 
-    if not article:
+    Raises:
+        HTTPException: 404 if the edition has no article with that slug
+    """
+    found = await find_article(d.isoformat(), slug)
+    if not found:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    # Use full-size image for article detail view
-    return transform_article(article, use_thumbnail=False)
+    position, entries = found
+    article_id = entries[position][1]
+
+    article, edition, adjacent = await asyncio.gather(
+        get_article_by_id(article_id, projection="detail"),
+        get_edition_by_date(d),
+        get_adjacent_edition_dates(d),
+    )
+    if not article or not edition:
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    def neighbour(i: int) -> Optional[dict]:
+        if 0 <= i < len(entries):
+            return {"id": entries[i][1], "slug": entries[i][0]}
+        return None
+
+    result = {
+        "article": transform_article(article, use_thumbnail=False, projection="detail", lang=lang),
+        "edition": transform_edition(edition),
+        "position": position,
+        "total": len(entries),
+        "prev_article": neighbour(position - 1),
+        "next_article": neighbour(position + 1),
+        "prev_edition_date": adjacent["prev_edition_date"],
+        "next_edition_date": adjacent["next_edition_date"],
+    }
+
+    return result, edition_payload_tags(edition, [aid for _, aid in entries])
 
 
 # =============================================================================
 # SEO
 # =============================================================================
 
+async def sitemap_index_stream() -> Iterator[bytes]:
+    """Render the sitemap index; the body is cached once fully consumed."""
+    base_url = os.getenv("SITE_URL", "https://adu.media")
+    months = await get_months()
+
+    return cache_stream(
+        ("sitemap", "index"), render_index(base_url, months), "application/xml", CACHE_CONTROL_SEO, ["sitemap-index"]
+    )
+
+
+async def sitemap_month_stream(month: str) -> Optional[Iterator[bytes]]:
+    """Render one month's sitemap (cached once consumed), or None if the month has no editions."""
+    base_url = os.getenv("SITE_URL", "https://adu.media")
+    entries = await get_month_entries(month)
+
+    if not entries:
+        return None
+
+    return cache_stream(
+        ("sitemap", month), render_month(base_url, entries), "application/xml", CACHE_CONTROL_SEO, [f"sitemap:{month}"]
+    )
+
+
 @router.get("/sitemap.xml", response_class=Response)
-async def sitemap():
-    """Generate sitemap.xml for search engines."""
+async def sitemap_index(request: Request):
+    """Sitemap index for search engines (static pages + one sitemap per month)."""
+    key = ("sitemap", "index")
+
+    payload = get_payload(key)
+    if payload is not MISS:
+        return conditional_response(request, payload)
+
+    try:
+        stream = await sitemap_index_stream()
+    except DependencyUnavailable as e:
+        return last_good_response(request, key, e)
+
+    return StreamingResponse(
+        stream,
+        media_type="application/xml",
+        headers={"Cache-Control": CACHE_CONTROL_SEO},
+    )
+
+
+@router.get("/sitemap/pages.xml", response_class=Response)
+async def sitemap_pages(request: Request):
+    """Sitemap of static pages."""
+    key = ("sitemap", "pages")
+
+    payload = get_payload(key)
+    if payload is not MISS:
+        return conditional_response(request, payload)
+
     base_url = os.getenv("SITE_URL", "https://adu.media")
 
-    editions = get_editions(limit=100)
-
-    urls = [
-        f'  <url><loc>{base_url}/</loc><changefreq>daily</changefreq><priority>1.0</priority></url>',
-        f'  <url><loc>{base_url}/archive</loc><changefreq>daily</changefreq><priority>0.8</priority></url>',
-        f'  <url><loc>{base_url}/about</loc><changefreq>monthly</changefreq><priority>0.5</priority></url>',
-    ]
-
-    for edition in editions:
-        edition_date = edition.get("edition_date", "")
-        urls.append(
-            f'  <url><loc>{base_url}/digest/{edition_date}</loc><changefreq>never</changefreq><priority>0.7</priority></url>'
-        )
-
-        # Include individual article URLs in sitemap
-        raw_article_ids = edition.get("article_ids", [])
-        article_ids = [str(aid) for aid in raw_article_ids] if raw_article_ids else []
-        if article_ids:
-            articles = get_articles_by_ids(article_ids)
-            for article in articles:
-                title = article.get("headline") or article.get("original_title", "")
-                slug = generate_slug(title)
-                article_id = str(article.get("id", ""))
-                urls.append(
-                    f'  <url><loc>{base_url}/article/{edition_date}/{slug}</loc><changefreq>never</changefreq><priority>0.6</priority></url>'
-                )
-
-    xml = f'''<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-{chr(10).join(urls)}
-</urlset>'''
-
-    return Response(content=xml, media_type="application/xml")
+    return StreamingResponse(
+        cache_stream(key, render_pages(base_url), "application/xml", CACHE_CONTROL_SEO),
+        media_type="application/xml",
+        headers={"Cache-Control": CACHE_CONTROL_SEO},
+    )
+
+
+@router.get("/sitemap/{month}.xml", response_class=Response)
+async def sitemap_month(
+    request: Request,
+    month: str = Path(..., pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+):
+    """
+    Sitemap of digest and article URLs for one month.
+
+    Args:
+        month: Month in YYYY-MM format
+    """
+    key = ("sitemap", month)
+
+    payload = get_payload(key)
+    if payload is not MISS:
+        return conditional_response(request, payload)
+
+    try:
+        stream = await sitemap_month_stream(month)
+    except DependencyUnavailable as e:
+        return last_good_response(request, key, e)
+
+    if stream is None:
+        raise HTTPException(status_code=404, detail=f"No editions in {month}")
+
+    return StreamingResponse(
+        stream,
+        media_type="application/xml",
+        headers={"Cache-Control": CACHE_CONTROL_SEO},
+    )
 
 
 @router.get("/robots.txt", response_class=Response)
-async def robots():
+async def robots(request: Request):
     """Generate robots.txt."""
-    base_url = os.getenv("SITE_URL", "https://adu.media")
+    payload = get_payload(("robots",))
+    if payload is MISS:
+        base_url = os.getenv("SITE_URL", "https://adu.media")
 
-    content = f"""User-agent: *
+        content = f"""User-agent: *
 Allow: /
 
 Sitemap: {base_url}/api/sitemap.xml
 """
 
-    return Response(content=content, media_type="text/plain")
\ No newline at end of file
+        payload = store_payload(("robots",), CachedPayload(
+            content.encode("utf-8"),
+            media_type="text/plain; charset=utf-8",
+            cache_control=CACHE_CONTROL_SEO,
+        ))
+
+    return conditional_response(request, payload)
\ No newline at end of file
@@ -5,27 +5,61 @@ Handles webhooks from Supabase database triggers.
 """
 
 import asyncio
+import time
+from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Header
-from typing import Optional
+from typing import Dict, Optional
 
 from auth import verify_webhook_secret
 from models import WebhookPayload
-from database import get_client
+from database import (
+    get_async_client,
+    get_articles_by_ids,
+    apply_edition_change,
+    invalidate_article,
+)
+from metrics import Counter, Histogram
+from slug_index import get_edition_slugs, index_edition
 from typesense_sync import index_single_article, delete_single_article
 
 
 router = APIRouter(prefix="/api/webhook", tags=["webhook"])
 
+WEBHOOKS = Counter("adu_webhooks_total", "Webhooks received by webhook and result", ("webhook", "result"))
+
+# Receipt until all work is done, including background processing
+WEBHOOK_PROCESSING_SECONDS = Histogram(
+    "adu_webhook_processing_seconds", "Webhook processing time from receipt", ("webhook",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+# Edition row created in Supabase until its publish processing is done
+WEBHOOK_LAG_SECONDS = Histogram(
+    "adu_webhook_lag_seconds", "Time from edition insert to processed publish webhook", ("webhook",),
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
-def _get_edition_date_for_article(article_id: str) -> str:
+# Strong references to fire-and-forget tasks (the loop only keeps weak ones)
+_background_tasks = set()
+
+
+def _spawn(coro) -> None:
+    """Run a coroutine in the background without blocking the response."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _get_edition_date_for_article(article_id: str) -> str:
     """Find the edition_date for an article by looking it up in the editions table."""
     try:
-        client = get_client()
-        result = client.table("editions") \
+        client = await get_async_client()
+        result = await client.table("editions") \
             .select("edition_date") \
             .contains("article_ids", [article_id]) \
             .order("edition_date", desc=True) \
@@ -38,22 +72,30 @@ def _get_edition_date_for_article(article_id: str) -> str:
     return ""
 
 
-def _sync_edition_articles(edition_date: str, article_ids: list):
+async def _edition_slugs(edition_date: str) -> Dict[str, str]:
+    """Article UUID -> slug for an edition, as its article URLs use them."""
+    if not edition_date:
+        return {}
+    try:
+        return {aid: slug for slug, aid in await get_edition_slugs(str(edition_date))}
+    except Exception as e:
+        print(f"[WEBHOOK] Could not get slugs for edition {edition_date}: {e}")
+        return {}
+
+
+async def _sync_edition_articles(edition_date: str, article_ids: list):
     """Fetch articles for an edition and index them into Typesense."""
     if not article_ids:
         return
     try:
-        client = get_client()
-        result = client.table("all_articles") \
-            .select("*") \
-            .in_("id", article_ids) \
-            .execute()
+        articles = await get_articles_by_ids(article_ids, projection="index")
+        slugs = await _edition_slugs(edition_date)
 
-        articles = result.data or []
         indexed = 0
         for article in articles:
             try:
-                index_single_article(article, edition_date)
+                # Typesense client is synchronous: keep it off the event loop
+                await asyncio.to_thread(index_single_article, article, edition_date, slugs.get(str(article.get("id"))))
                 indexed += 1
             except Exception as e:
                 print(f"[WEBHOOK] Failed to index article {article.get('id')}: {e}")
@@ -63,6 +105,56 @@ def _sync_edition_articles(edition_date: str, article_ids: list):
         print(f"[WEBHOOK] Error syncing edition {edition_date}: {e}")
 
 
+async def _index_edition_slugs(edition_date: str):
+    """Add a new edition to the article slug index (and store its slugs)."""
+    try:
+        await index_edition(edition_date)
+    except Exception as e:
+        print(f"[WEBHOOK] Error indexing slugs for edition {edition_date}: {e}")
+
+
+def _record_lag(webhook: str, created_at: Optional[str]) -> None:
+    """Record the lag since a row's created_at timestamp (if it parses)."""
+    try:
+        created = datetime.fromisoformat(created_at)
+    except (TypeError, ValueError):
+        return
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    WEBHOOK_LAG_SECONDS.observe(max(0.0, (datetime.now(timezone.utc) - created).total_seconds()), webhook)
+
+
+async def _process_new_edition(
+    edition_date: str,
+    article_ids: list,
+    received: float,
+    created_at: Optional[str] = None,
+):
+    """
+    Assign slugs, warm the caches for the new edition, then index the
+    articles (so Typesense gets the stored slugs).
+    """
+    from warmup import warm_up  # warmup imports the routes package
+
+    await _index_edition_slugs(edition_date)
+    await warm_up("publish", editions=1)
+    await _sync_edition_articles(edition_date, article_ids)
+
+    WEBHOOK_PROCESSING_SECONDS.observe(time.perf_counter() - received, "edition-published")
+    _record_lag("edition-published", created_at)
+
+
+async def _prerender_edition(edition_date: str):
+    """Rebuild an edition's prerendered pages (dropped by the change hooks)."""
+    from prerender import prerender_edition  # prerender imports the routes package
+
+    try:
+        pages = await prerender_edition(edition_date)
+        print(f"[WEBHOOK] Prerendered {pages} pages for edition {edition_date}")
+    except Exception as e:
+        print(f"[WEBHOOK] Error prerendering edition {edition_date}: {e}")
+
+
 # =============================================================================
 # Webhooks
 # =============================================================================
@@ -78,10 +170,18 @@ async def edition_published(
     Called by Supabase when a new edition is inserted.
     Automatically syncs the edition's articles into Typesense search index.
     """
+    received = time.perf_counter()
+
     if not verify_webhook_secret(x_webhook_secret or ""):
+        WEBHOOKS.inc("edition-published", "unauthorized")
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
+    # Any change to an edition row updates the cache and date index
+    if payload.table == "editions":
+        apply_edition_change(payload.type, payload.record, payload.old_record)
+
     if payload.type != "INSERT" or payload.table != "editions":
+        WEBHOOKS.inc("edition-published", "ignored")
         return {"status": "ignored", "reason": "Not an edition insert"}
 
     record = payload.record or {}
@@ -92,11 +192,12 @@ async def edition_published(
 
     print(f"[WEBHOOK] New {edition_type} edition published: {edition_date} ({article_count} articles)")
 
-    # Sync articles to Typesense in background (don't block the webhook response)
-    if edition_date and article_ids:
-        loop = asyncio.get_event_loop()
-        loop.run_in_executor(None, _sync_edition_articles, edition_date, article_ids)
-        print(f"[WEBHOOK] Typesense sync queued for {len(article_ids)} articles")
+    # Slugs + Typesense sync in background (don't block the webhook response)
+    if edition_date:
+        _spawn(_process_new_edition(edition_date, article_ids, received, record.get("created_at")))
+        print(f"[WEBHOOK] Slug, warm-up and Typesense sync queued for {len(article_ids)} articles")
+
+    WEBHOOKS.inc("edition-published", "processed")
 
     return {
         "status": "processed",
@@ -117,34 +218,47 @@ async def article_updated(
     Called by Supabase when an article is updated.
     Keeps Typesense in sync when articles are edited in the admin dashboard.
     """
+    received = time.perf_counter()
+
     if not verify_webhook_secret(x_webhook_secret or ""):
+        WEBHOOKS.inc("article-updated", "unauthorized")
         raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
     if payload.table != "all_articles":
+        WEBHOOKS.inc("article-updated", "ignored")
         return {"status": "ignored", "reason": "Not an article update"}
 
     record = payload.record or {}
-    article_id = str(record.get("id", ""))
+    article_id = str(record.get("id") or (payload.old_record or {}).get("id") or "")
     status = record.get("status", "")
 
+    invalidate_article(article_id)
+
     print(f"[WEBHOOK] Article updated: {article_id} -> {status}")
 
     # Re-index if published, remove from index if archived/filtered
     if status == "published" and article_id:
-        edition_date = _get_edition_date_for_article(article_id)
+        edition_date = await _get_edition_date_for_article(article_id)
+        slugs = await _edition_slugs(edition_date)
         try:
-            index_single_article(record, edition_date)
+            await asyncio.to_thread(index_single_article, record, edition_date, slugs.get(article_id))
             print(f"[WEBHOOK] Re-indexed article {article_id}")
         except Exception as e:
             print(f"[WEBHOOK] Failed to re-index article {article_id}: {e}")
 
+        if edition_date:
+            _spawn(_prerender_edition(edition_date))
+
     elif status in ("archived", "filtered_out") and article_id:
         try:
-            delete_single_article(article_id)
+            await asyncio.to_thread(delete_single_article, article_id)
             print(f"[WEBHOOK] Removed article {article_id} from index")
         except Exception as e:
             print(f"[WEBHOOK] Failed to remove article {article_id}: {e}")
 
+    WEBHOOKS.inc("article-updated", "processed")
+    WEBHOOK_PROCESSING_SECONDS.observe(time.perf_counter() - received, "article-updated")
+
     return {
         "status": "processed",
         "article_id": article_id,
@@ -0,0 +1,104 @@
+"""
+Request Coalescing for ADUmedia Website
+
+Single-flight calls: concurrent callers asking for the same key share one
+in-flight computation and its result (or exception), instead of each
+running the same Supabase queries.
+
+Used by the public routes on cache misses, so the burst of identical
+requests when an edition is published costs one build, not thousands.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+
+SINGLEFLIGHT_TIMEOUT_SECONDS = float(os.getenv("SINGLEFLIGHT_TIMEOUT_SECONDS", "15"))
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls with the same key into one.
+
+    The shared call runs as its own task: a caller that disconnects (and
+    is cancelled) does not cancel the work the other callers wait for.
+
+    Args:
+        name: Name used in log lines and stats
+        timeout: Seconds a shared call may run before every caller gets
+            asyncio.TimeoutError (None for no limit)
+    """
+
+    def __init__(self, name: str, timeout: Optional[float] = SINGLEFLIGHT_TIMEOUT_SECONDS):
+        self.name = name
+        self.timeout = timeout
+
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+        self.calls = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.timeouts = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() for key, or join the call already running for it.
+
+        Args:
+            key: Identifies the computation (e.g. the route's cache key)
+            fn: Coroutine function producing the result
+
+        Returns:
+            The shared result
+
+        Raises:
+            Whatever the shared call raised, including asyncio.TimeoutError
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(self._run(fn))
+            self._calls[key] = task
+            task.add_done_callback(lambda t, key=key: self._finish(key, t))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    async def _run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run a shared call with the timeout."""
+        try:
+            return await asyncio.wait_for(fn(), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            print(f"[FLIGHT] {self.name}: call timed out after {self.timeout}s")
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Forget a finished call (later callers start a new one)."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call/coalesce counters."""
+        return {
+            "name": self.name,
+            "in_flight": len(self._calls),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+        }
@@ -0,0 +1,203 @@
+"""
+Sitemap Generation for ADUmedia Website
+
+Builds a sitemap index plus one child sitemap per month of editions.
+Article titles are fetched in bulk per month, and each month's URL list
+(plus the rendered XML, in http_cache) is cached until an edition or
+article in it changes.
+
+Documents:
+    /api/sitemap.xml             - Sitemap index (pages + one entry per month)
+    /api/sitemap/pages.xml       - Static pages
+    /api/sitemap/YYYY-MM.xml     - Digest and article URLs for one month
+"""
+
+import os
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from cache import TTLCache, MISS
+from http_cache import payload_cache
+from database import (
+    get_edition_index,
+    load_edition_index,
+    get_editions_between,
+    get_article_titles,
+    on_edition_change,
+    on_article_change,
+)
+from slugs import assign_slugs
+
+
+SITEMAP_CACHE_TTL_SECONDS = float(os.getenv("SITEMAP_CACHE_TTL_SECONDS", "21600"))
+
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+STATIC_PAGES = [
+    ("/", "daily", "1.0"),
+    ("/archive", "daily", "0.8"),
+    ("/about", "monthly", "0.5"),
+]
+
+# Month "YYYY-MM" -> list of (edition_date, [article slugs])
+MonthEntries = List[Tuple[str, List[str]]]
+
+_month_cache = TTLCache("sitemap", max_entries=600, ttl_seconds=SITEMAP_CACHE_TTL_SECONDS)
+
+# Month -> last time a webhook changed something in it (for <lastmod>)
+_month_touched: Dict[str, float] = {}
+
+# Article UUID -> month whose sitemap lists it
+_article_month: Dict[str, str] = {}
+
+
+# =============================================================================
+# Invalidation
+# =============================================================================
+
+def _on_edition_change(edition_id: Optional[str], edition_date: Optional[str]) -> None:
+    """Drop the month containing a changed edition."""
+    if edition_date:
+        month = str(edition_date)[:7]
+        _month_cache.invalidate(month)
+        _month_touched[month] = time.time()
+        payload_cache.invalidate_tag(f"sitemap:{month}")
+    payload_cache.invalidate_tag("sitemap-index")
+
+
+def _on_article_change(article_id: str) -> None:
+    """Drop the month listing a changed article."""
+    month = _article_month.get(article_id)
+    if month:
+        _month_cache.invalidate(month)
+        _month_touched[month] = time.time()
+        payload_cache.invalidate_tag(f"sitemap:{month}")
+        payload_cache.invalidate_tag("sitemap-index")
+
+
+on_edition_change(_on_edition_change)
+on_article_change(_on_article_change)
+
+
+# =============================================================================
+# Data
+# =============================================================================
+
+def _month_bounds(month: str) -> Tuple[date, date]:
+    """First day of a "YYYY-MM" month and first day of the next month."""
+    year, mon = int(month[:4]), int(month[5:7])
+    start = date(year, mon, 1)
+    end = date(year + 1, 1, 1) if mon == 12 else date(year, mon + 1, 1)
+    return start, end
+
+
+async def get_months() -> List[str]:
+    """All months that have at least one edition, newest first."""
+    index = get_edition_index()
+    if not index.loaded:
+        await load_edition_index()
+    return sorted({d[:7] for d in index.dates()}, reverse=True)
+
+
+async def get_month_entries(month: str) -> MonthEntries:
+    """
+    Get digest dates and article slugs for one month (cached).
+
+    Args:
+        month: Month as "YYYY-MM"
+
+    Returns:
+        List of (edition_date, [article slugs]), oldest first
+    """
+    cached = _month_cache.get(month)
+    if cached is not MISS:
+        return cached
+
+    start, end = _month_bounds(month)
+    editions = await get_editions_between(start, end)
+
+    all_ids = [str(aid) for e in editions for aid in (e.get("article_ids") or [])]
+    titles = await get_article_titles(all_ids)
+
+    entries = []
+    for edition in editions:
+        ids = [str(aid) for aid in (edition.get("article_ids") or []) if str(aid) in titles]
+        entries.append((edition["edition_date"], assign_slugs([titles[aid] for aid in ids])))
+        for aid in ids:
+            _article_month[aid] = month
+
+    _month_cache.set(month, entries)
+    return entries
+
+
+def month_lastmod(month: str) -> str:
+    """
+    Last modification date for a month's sitemap.
+
+    The latest edition date in the month, or the last webhook change to
+    it if that is more recent.
+    """
+    index = get_edition_index()
+    edition_dates = [d for d in index.dates() if d.startswith(month)]
+    lastmod = max(edition_dates) if edition_dates else f"{month}-01"
+
+    touched = _month_touched.get(month)
+    if touched:
+        touched_date = datetime.fromtimestamp(touched, tz=timezone.utc).date().isoformat()
+        lastmod = max(lastmod, touched_date)
+
+    return lastmod
+
+
+# =============================================================================
+# Rendering (streamed)
+# =============================================================================
+
+def render_index(base_url: str, months: List[str]) -> Iterator[str]:
+    """Stream the sitemap index document."""
+    yield XML_HEADER
+    yield f'<sitemapindex xmlns="{SITEMAP_NS}">\n'
+    yield f"  <sitemap><loc>{escape(base_url)}/api/sitemap/pages.xml</loc></sitemap>\n"
+    for month in months:
+        yield (
+            f"  <sitemap><loc>{escape(base_url)}/api/sitemap/{month}.xml</loc>"
+            f"<lastmod>{month_lastmod(month)}</lastmod></sitemap>\n"
+        )
+    yield "</sitemapindex>\n"
+
+
+def render_pages(base_url: str) -> Iterator[str]:
+    """Stream the static pages sitemap."""
+    yield XML_HEADER
+    yield f'<urlset xmlns="{SITEMAP_NS}">\n'
+    for path, changefreq, priority in STATIC_PAGES:
+        yield (
+            f"  <url><loc>{escape(base_url)}{path}</loc>"
+            f"<changefreq>{changefreq}</changefreq><priority>{priority}</priority></url>\n"
+        )
+    yield "</urlset>\n"
+
+
+def render_month(base_url: str, entries: MonthEntries) -> Iterator[str]:
+    """Stream one month's sitemap (one chunk per edition)."""
+    base = escape(base_url)
+
+    yield XML_HEADER
+    yield f'<urlset xmlns="{SITEMAP_NS}">\n'
+    for edition_date, slugs in entries:
+        lines = [
+            f"  <url><loc>{base}/digest/{edition_date}</loc>"
+            f"<lastmod>{edition_date}</lastmod>"
+            f"<changefreq>never</changefreq><priority>0.7</priority></url>\n"
+        ]
+        for slug in slugs:
+            lines.append(
+                f"  <url><loc>{base}/article/{edition_date}/{slug}</loc>"
+                f"<lastmod>{edition_date}</lastmod>"
+                f"<changefreq>never</changefreq><priority>0.6</priority></url>\n"
+            )
+        yield "".join(lines)
+    yield "</urlset>\n"
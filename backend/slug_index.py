@@ -0,0 +1,192 @@
+"""
+Article Slug Index for ADUmedia Website
+
+Maps (edition_date, slug) to article IDs, so an article URL
+(/article/{date}/{slug}) resolves without loading and re-slugging the
+whole edition.
+
+Built once at startup and kept current through the database change
+hooks: a changed edition or article marks its date stale, and the date is
+re-indexed (one edition lookup + one titles query) on its next use.
+
+Slugs are assigned with slugs.assign_slugs(); ones not yet stored in
+all_articles.slug are saved as editions are indexed.
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from database import (
+    get_all_edition_article_ids,
+    get_edition_by_date,
+    get_article_titles,
+    set_article_slugs,
+    on_edition_change,
+    on_article_change,
+)
+from slugs import assign_slugs, unsaved_slugs
+
+
+# (slug, article UUID) in edition order
+SlugEntries = List[Tuple[str, str]]
+
+# Edition date -> (entries, slug -> position in entries)
+_by_date: Dict[str, Tuple[SlugEntries, Dict[str, int]]] = {}
+
+# Article UUID -> edition dates listing it
+_article_dates: Dict[str, Set[str]] = {}
+
+# Dates to re-index before their next lookup
+_stale: Set[str] = set()
+
+# Article UUID -> assigned slug not stored yet (from the startup load)
+_unsaved: Dict[str, str] = {}
+
+
+# =============================================================================
+# Invalidation
+# =============================================================================
+
+def _on_edition_change(edition_id: Optional[str], edition_date: Optional[str]) -> None:
+    """Re-index a changed edition on next lookup."""
+    if edition_date:
+        _stale.add(str(edition_date))
+
+
+def _on_article_change(article_id: str) -> None:
+    """Re-index the editions listing a changed article (its title may differ)."""
+    _stale.update(_article_dates.get(article_id, ()))
+
+
+on_edition_change(_on_edition_change)
+on_article_change(_on_article_change)
+
+
+# =============================================================================
+# Building
+# =============================================================================
+
+def _set_edition(edition_date: str, article_ids: List[str], titles: Dict[str, dict]) -> Dict[str, str]:
+    """
+    Replace the entries for one edition date.
+
+    Returns:
+        Article UUID -> slug for assigned slugs that are not stored yet
+    """
+    old_entries, _ = _by_date.pop(edition_date, ([], {}))
+    for _, aid in old_entries:
+        dates = _article_dates.get(aid)
+        if dates:
+            dates.discard(edition_date)
+            if not dates:
+                del _article_dates[aid]
+
+    articles = [titles[aid] for aid in article_ids if aid in titles]
+    slugs = assign_slugs(articles)
+    entries = [(slug, str(article["id"])) for slug, article in zip(slugs, articles)]
+
+    positions = {}
+    for i, (slug, aid) in enumerate(entries):
+        # Legacy duplicate stored slugs: the first article wins
+        positions.setdefault(slug, i)
+        _article_dates.setdefault(aid, set()).add(edition_date)
+
+    if entries:
+        _by_date[edition_date] = (entries, positions)
+    _stale.discard(edition_date)
+
+    return unsaved_slugs(articles, slugs)
+
+
+async def load_slug_index() -> int:
+    """
+    Build the index for every edition.
+
+    Returns:
+        Number of articles indexed
+    """
+    rows = await get_all_edition_article_ids()
+
+    editions = [
+        (str(row["edition_date"]), [str(aid) for aid in (row.get("article_ids") or [])])
+        for row in rows
+    ]
+    titles = await get_article_titles([aid for _, ids in editions for aid in ids])
+
+    _by_date.clear()
+    _article_dates.clear()
+    _stale.clear()
+    _unsaved.clear()
+    for edition_date, article_ids in editions:
+        for aid, slug in _set_edition(edition_date, article_ids, titles).items():
+            _unsaved.setdefault(aid, slug)
+
+    count = sum(len(entries) for entries, _ in _by_date.values())
+    print(f"[SLUGS] Slug index loaded: {count} articles in {len(_by_date)} editions")
+    return count
+
+
+async def index_edition(edition_date: str) -> None:
+    """(Re-)index one edition date from Supabase."""
+    edition = await get_edition_by_date(date.fromisoformat(edition_date))
+
+    article_ids = [str(aid) for aid in ((edition or {}).get("article_ids") or [])]
+    titles = await get_article_titles(article_ids)
+
+    unsaved = _set_edition(edition_date, article_ids, titles)
+    if unsaved:
+        stored = await set_article_slugs(unsaved)
+        print(f"[SLUGS] Stored {stored} slugs for edition {edition_date}")
+
+
+async def save_missing_slugs() -> int:
+    """
+    Store slugs assigned during the startup load (one-off backfill).
+
+    Returns:
+        Number of slugs stored
+    """
+    if not _unsaved:
+        return 0
+
+    pending = dict(_unsaved)
+    _unsaved.clear()
+
+    try:
+        stored = await set_article_slugs(pending)
+    except Exception as e:
+        print(f"[SLUGS] Storing missing slugs failed: {e}")
+        return 0
+
+    print(f"[SLUGS] Stored {stored}/{len(pending)} missing slugs")
+    return stored
+
+
+# =============================================================================
+# Lookup
+# =============================================================================
+
+async def get_edition_slugs(edition_date: str) -> SlugEntries:
+    """Get (slug, article UUID) for an edition, in edition order."""
+    if edition_date in _stale or edition_date not in _by_date:
+        await index_edition(edition_date)
+
+    entries, _ = _by_date.get(edition_date, ([], {}))
+    return entries
+
+
+async def find_article(edition_date: str, slug: str) -> Optional[Tuple[int, SlugEntries]]:
+    """
+    Find an article by edition date and slug.
+
+    Returns:
+        (position, edition entries), or None if no article matches
+    """
+    entries = await get_edition_slugs(edition_date)
+    if not entries:
+        return None
+
+    position = _by_date[edition_date][1].get(slug)
+    if position is None:
+        return None
+    return position, entries
@@ -0,0 +1,106 @@
+"""
+Article Slugs for ADUmedia Website
+
+The one slug implementation used by the public API, the slug index,
+sitemaps and Typesense, so all of them produce the same URL for an
+article.
+
+Slugs are stored in all_articles.slug once assigned (see
+sql/article_slugs.sql); generate_slug() is only the fallback for
+articles that do not have one yet, and is memoized.
+"""
+
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List
+
+
+SLUG_CACHE_SIZE = int(os.getenv("SLUG_CACHE_SIZE", "8192"))
+
+_APOSTROPHES = str.maketrans("", "", "'`")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=SLUG_CACHE_SIZE)
+def generate_slug(title: str, max_length: int = 80) -> str:
+    """
+    Generate a URL-friendly slug from a title.
+
+    Examples:
+        "Zaha Hadid Architects' New Tower in Beijing" -> "zaha-hadid-architects-new-tower-in-beijing"
+        "BIG Designs $2.5B Mixed-Use Complex" -> "big-designs-2-5b-mixed-use-complex"
+
+    Args:
+        title: Article title/headline
+        max_length: Maximum slug length
+
+    Returns:
+        URL-safe slug string
+    """
+    if not title:
+        return "untitled"
+
+    # Normalize unicode characters (e.g., accented chars -> ascii)
+    slug = unicodedata.normalize("NFKD", title)
+    slug = slug.encode("ascii", "ignore").decode("ascii")
+
+    slug = slug.lower().translate(_APOSTROPHES)
+    slug = _NON_ALNUM.sub("-", slug).strip("-")   # Runs of anything else -> one hyphen
+
+    # Truncate at word boundary
+    if len(slug) > max_length:
+        slug = slug[:max_length].rsplit("-", 1)[0]
+
+    return slug or "untitled"
+
+
+def article_title(article: dict) -> str:
+    """Title used for slugs: headline line 1, then headline, then original title."""
+    return article.get("headline_line_1") or article.get("headline") or article.get("original_title") or ""
+
+
+def article_slug(article: dict) -> str:
+    """Stored slug of an article, or one generated from its title."""
+    return article.get("slug") or generate_slug(article_title(article))
+
+
+def assign_slugs(articles: List[dict]) -> List[str]:
+    """
+    Get slugs for one edition's articles, unique within the edition.
+
+    Stored slugs are kept as they are. Articles without one get a
+    generated slug, suffixed -2, -3, ... if another article in the
+    edition already uses it.
+
+    Args:
+        articles: Article rows in edition order
+
+    Returns:
+        Slugs in the same order
+    """
+    taken = {a["slug"] for a in articles if a.get("slug")}
+
+    slugs = []
+    for article in articles:
+        slug = article.get("slug")
+        if not slug:
+            base = slug = generate_slug(article_title(article))
+            n = 2
+            while slug in taken:
+                slug = f"{base}-{n}"
+                n += 1
+            taken.add(slug)
+        slugs.append(slug)
+
+    return slugs
+
+
+def unsaved_slugs(articles: List[dict], slugs: List[str]) -> Dict[str, str]:
+    """Article UUID -> slug for articles whose slug is not stored yet."""
+    return {
+        str(article["id"]): slug
+        for article, slug in zip(articles, slugs)
+        if not article.get("slug")
+    }
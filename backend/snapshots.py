@@ -0,0 +1,152 @@
+"""
+Response Snapshots for ADUmedia Website
+
+Stale-while-revalidate serving for responses that change over time
+(/editions/today and /editions/latest).
+
+Each snapshot is the last good payload for a key. Requests are answered
+from it without touching Supabase; a background task rebuilds every
+snapshot on a short interval, and immediately when an edition changes.
+If rebuilding fails the last good payload keeps being served, up to a
+maximum staleness after which requests fall through to the database.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from http_cache import CachedPayload
+
+
+SNAPSHOT_REFRESH_SECONDS = float(os.getenv("SNAPSHOT_REFRESH_SECONDS", "30"))
+SNAPSHOT_MAX_STALENESS_SECONDS = float(os.getenv("SNAPSHOT_MAX_STALENESS_SECONDS", "600"))
+
+# Response header carrying the snapshot age in whole seconds
+SNAPSHOT_AGE_HEADER = "X-Snapshot-Age"
+
+
+class SnapshotStore:
+    """
+    Last-good payloads, refreshed in the background.
+
+    Args:
+        name: Name used in log lines and stats
+        build: Coroutine function key -> payload (None if there is nothing
+            to serve for the key, e.g. no editions yet)
+        refresh_seconds: Interval between background refreshes
+        max_staleness: Age in seconds after which a snapshot is not served
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[[Hashable], Awaitable[Optional[CachedPayload]]],
+        refresh_seconds: float = SNAPSHOT_REFRESH_SECONDS,
+        max_staleness: float = SNAPSHOT_MAX_STALENESS_SECONDS,
+    ):
+        self.name = name
+        self.build = build
+        self.refresh_seconds = refresh_seconds
+        self.max_staleness = max_staleness
+
+        # key -> (monotonic time built, payload)
+        self._snapshots: Dict[Hashable, Tuple[float, CachedPayload]] = {}
+        self._wake = asyncio.Event()
+
+        self.hits = 0
+        self.misses = 0
+        self.too_stale = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[CachedPayload, float]]:
+        """
+        Get the snapshot for key.
+
+        Returns:
+            (payload, age in seconds), or None if there is no snapshot or
+            it is older than max_staleness
+        """
+        entry = self._snapshots.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        built_at, payload = entry
+        age = time.monotonic() - built_at
+        if age > self.max_staleness:
+            self.too_stale += 1
+            return None
+
+        self.hits += 1
+        return payload, age
+
+    def put(self, key: Hashable, payload: Optional[CachedPayload]) -> None:
+        """Store a fresh payload for key (None drops the snapshot)."""
+        if payload is None:
+            self._snapshots.pop(key, None)
+            return
+
+        entry = self._snapshots.get(key)
+        if entry is not None and entry[1].etag == payload.etag:
+            # Unchanged: keep the old payload (its Last-Modified and compressed variants)
+            payload = entry[1]
+        self._snapshots[key] = (time.monotonic(), payload)
+
+    def request_refresh(self) -> None:
+        """Make the background task refresh now instead of at its next interval."""
+        self._wake.set()
+
+    async def refresh(self) -> int:
+        """
+        Rebuild every snapshot.
+
+        Snapshots whose rebuild fails are kept as they are.
+
+        Returns:
+            Number of snapshots rebuilt
+        """
+        refreshed = 0
+        for key in list(self._snapshots):
+            try:
+                self.put(key, await self.build(key))
+                refreshed += 1
+            except Exception as e:
+                self.refresh_errors += 1
+                print(f"[SNAPSHOT] {self.name}: refreshing {key} failed, serving last good: {e}")
+
+        self.refreshes += 1
+        return refreshed
+
+    async def refresher(self) -> None:
+        """Background task: refresh on an interval or when woken."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.refresh_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"[SNAPSHOT] {self.name}: refresh failed: {e}")
+
+    def age_headers(self, age: float) -> Dict[str, str]:
+        """Response headers describing a snapshot's age."""
+        return {SNAPSHOT_AGE_HEADER: str(int(age))}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/refresh counters and current size."""
+        now = time.monotonic()
+        return {
+            "name": self.name,
+            "size": len(self._snapshots),
+            "oldest_age": max((now - t for t, _ in self._snapshots.values()), default=None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "too_stale": self.too_stale,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -0,0 +1,19 @@
+-- =============================================================================
+-- all_articles.slug
+-- =============================================================================
+--
+-- Stores each article's URL slug (/article/{edition_date}/{slug}) so the
+-- public API, sitemaps and Typesense all read the same value, and a
+-- published URL does not change when a headline is edited.
+--
+-- The backend fills the column (backend/slugs.py):
+--     - for new editions, from the edition-published webhook
+--     - for existing articles, in the background after startup
+-- Only NULL slugs are ever written. Within an edition, a duplicate slug
+-- gets a -2, -3, ... suffix.
+--
+-- Apply in the Supabase SQL editor before re-running get_edition_bundle.sql
+-- (safe to re-run).
+
+alter table public.all_articles
+    add column if not exists slug text;
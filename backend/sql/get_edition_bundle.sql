@@ -0,0 +1,112 @@
+-- =============================================================================
+-- get_edition_bundle
+-- =============================================================================
+--
+-- Returns an edition, its articles (in article_ids order) and the adjacent
+-- edition dates as a single JSON document, so the API can build a digest
+-- response in one PostgREST round-trip.
+--
+-- Called from backend/database.py:get_edition_bundle() via
+--     POST /rest/v1/rpc/get_edition_bundle
+--
+-- Args:
+--     p_target  'latest', 'today' or an ISO date ('2026-01-30')
+--     p_today   Server's idea of today (used by 'today'; falls back to latest)
+--
+-- Returns NULL when no edition matches, otherwise:
+--     {
+--       "edition": {...editions row...},
+--       "articles": [{..."card" columns of all_articles...}, ...],
+--       "prev_edition_date": "2026-01-29" | null,
+--       "next_edition_date": "2026-01-31" | null
+--     }
+--
+-- Requires article_slugs.sql. Apply in the Supabase SQL editor (safe to re-run).
+
+create or replace function public.get_edition_bundle(
+    p_target text,
+    p_today date default current_date
+)
+returns jsonb
+language plpgsql
+stable
+as $$
+declare
+    v_edition public.editions%rowtype;
+begin
+    if p_target = 'latest' then
+        select * into v_edition
+        from public.editions
+        order by edition_date desc
+        limit 1;
+    elsif p_target = 'today' then
+        select * into v_edition
+        from public.editions
+        where edition_date = p_today
+        limit 1;
+
+        if not found then
+            select * into v_edition
+            from public.editions
+            order by edition_date desc
+            limit 1;
+        end if;
+    else
+        select * into v_edition
+        from public.editions
+        where edition_date = p_target::date
+        limit 1;
+    end if;
+
+    if not found then
+        return null;
+    end if;
+
+    return jsonb_build_object(
+        'edition', to_jsonb(v_edition),
+        'articles', coalesce((
+            select jsonb_agg(to_jsonb(card) - 'ord' order by card.ord)
+            from (
+                -- "card" projection (database.py: ARTICLE_PROJECTIONS)
+                select
+                    ids.ord,
+                    a.id,
+                    a.slug,
+                    a.headline_line_1,
+                    a.headline,
+                    a.original_title,
+                    a.headline_line_2,
+                    a.source_id,
+                    a.source_name,
+                    a.article_url,
+                    a.ai_summary,
+                    a.r2_image_path,
+                    a.image_key,
+                    a.r2_thumbnail_path,
+                    a.tags,
+                    a.selection_category,
+                    a.is_studio,
+                    a.headline_translations,
+                    a.headline_line_1_translations,
+                    a.headline_line_2_translations,
+                    a.ai_summary_translations,
+                    a.original_publish_date
+                from unnest(v_edition.article_ids) with ordinality as ids(article_id, ord)
+                join public.all_articles a on a.id::text = ids.article_id::text
+            ) card
+        ), '[]'::jsonb),
+        'prev_edition_date', (
+            select max(edition_date)
+            from public.editions
+            where edition_date < v_edition.edition_date
+        ),
+        'next_edition_date', (
+            select min(edition_date)
+            from public.editions
+            where edition_date > v_edition.edition_date
+        )
+    );
+end;
+$$;
+
+grant execute on function public.get_edition_bundle(text, date) to anon, authenticated;
@@ -0,0 +1,218 @@
+"""
+Static Frontend Serving for ADUmedia Website
+
+The built React app (frontend/dist) is loaded into memory at startup, one
+CachedPayload per file, so a request is a dict lookup plus
+http_cache.conditional_response(): no filesystem checks or disk reads,
+ETag/304 handling, and Brotli/gzip variants.
+
+Variants come from .br/.gz files next to the originals when the build has
+them (see precompress(), run in the Dockerfile), otherwise they are
+compressed on first use and kept.
+
+Cache-Control:
+    /assets/*     Vite's content-hashed bundles: a year, immutable
+    *.html        index.html / the SPA shell: short, so deploys show up
+    other files   favicon, manifest, images from frontend/public
+
+Files larger than STATIC_MAX_FILE_BYTES stay on disk (FileResponse) but
+are still in the route table.
+
+Usage:
+    # Write .br/.gz variants next to the build output (done in the Dockerfile)
+    python backend/static_files.py frontend/dist
+"""
+
+import gzip
+import mimetypes
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add parent to path when running standalone
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+from http_cache import CachedPayload, brotli, conditional_response
+
+
+STATIC_DIR = Path(os.getenv("STATIC_DIR", str(Path(__file__).parent.parent / "frontend" / "dist")))
+
+# Larger files are served from disk
+STATIC_MAX_FILE_BYTES = int(os.getenv("STATIC_MAX_FILE_BYTES", str(4 * 1024 * 1024)))
+
+CACHE_CONTROL_ASSETS = os.getenv("CACHE_CONTROL_ASSETS", "public, max-age=31536000, immutable")
+CACHE_CONTROL_HTML = os.getenv("CACHE_CONTROL_HTML", "public, max-age=60, must-revalidate")
+CACHE_CONTROL_STATIC = os.getenv("CACHE_CONTROL_STATIC", "public, max-age=3600")
+
+# Directory of Vite's content-hashed output (build.assetsDir)
+HASHED_ASSETS_DIR = "assets/"
+
+# Encoding -> file suffix of precompressed variants
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+_COMPRESSIBLE_TYPES = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+    "image/vnd.microsoft.icon",
+    "image/x-icon",
+}
+
+
+def is_compressible(media_type: str) -> bool:
+    """Whether compressing a media type pays off (images/fonts are already compressed)."""
+    return media_type.startswith("text/") or media_type in _COMPRESSIBLE_TYPES
+
+
+def cache_control_for(path: str) -> str:
+    """Cache-Control policy for a file path relative to the build directory."""
+    if path.startswith(HASHED_ASSETS_DIR):
+        return CACHE_CONTROL_ASSETS
+    if path.endswith(".html"):
+        return CACHE_CONTROL_HTML
+    return CACHE_CONTROL_STATIC
+
+
+def _media_type(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+
+def _is_variant(file: Path) -> bool:
+    """A .br/.gz file whose original is also in the build."""
+    return file.suffix in PRECOMPRESSED_SUFFIXES.values() and file.with_suffix("").is_file()
+
+
+class StaticSite:
+    """
+    Route table of the frontend build: relative path -> in-memory payload.
+
+    Args:
+        root: Build output directory
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.files: Dict[str, CachedPayload] = {}
+        self.large_files: Dict[str, Path] = {}
+        self.index: Optional[CachedPayload] = None
+
+    def load(self) -> "StaticSite":
+        """Read every file of the build into memory (no-op without a build)."""
+        files: Dict[str, CachedPayload] = {}
+        large_files: Dict[str, Path] = {}
+        precompressed = 0
+
+        if self.root.is_dir():
+            for file in sorted(self.root.rglob("*")):
+                if not file.is_file() or _is_variant(file):
+                    continue
+
+                path = file.relative_to(self.root).as_posix()
+                stat = file.stat()
+                if stat.st_size > STATIC_MAX_FILE_BYTES:
+                    large_files[path] = file
+                    continue
+
+                media_type = _media_type(path)
+                payload = CachedPayload(
+                    file.read_bytes(),
+                    media_type=media_type,
+                    cache_control=cache_control_for(path),
+                    compressible=is_compressible(media_type),
+                )
+                payload.last_modified = stat.st_mtime
+
+                for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+                    variant = file.with_name(file.name + suffix)
+                    if variant.is_file():
+                        payload.add_encoded(encoding, variant.read_bytes())
+                        precompressed += 1
+
+                files[path] = payload
+
+        self.files = files
+        self.large_files = large_files
+        self.index = files.get("index.html")
+
+        if files:
+            size = sum(len(p.body) for p in files.values())
+            print(f"[STATIC] Loaded {len(files)} files ({size / 1024:.0f} KB, {precompressed} precompressed variants)"
+                  f" from {self.root}")
+        return self
+
+    def response(self, request: Request, path: str) -> Response:
+        """
+        Serve a file of the build, or the SPA shell for client-side routes.
+
+        Unknown paths under /assets/ are 404s: an old page asking for a
+        bundle from a previous deploy must not get index.html as script.
+        """
+        payload = self.files.get(path)
+        if payload is not None:
+            return conditional_response(request, payload)
+
+        file = self.large_files.get(path)
+        if file is not None:
+            return FileResponse(file, headers={"Cache-Control": cache_control_for(path)})
+
+        if path.startswith(HASHED_ASSETS_DIR) or self.index is None:
+            return Response(status_code=404)
+
+        return conditional_response(request, self.index)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "root": str(self.root),
+            "files": len(self.files),
+            "bytes": sum(len(p.body) for p in self.files.values()),
+            "large_files": len(self.large_files),
+        }
+
+
+static_site = StaticSite(STATIC_DIR)
+
+
+# =============================================================================
+# Build-Time Precompression
+# =============================================================================
+
+def precompress(root: Path) -> int:
+    """
+    Write .br and .gz variants of compressible files under root.
+
+    Runs once per build, so uses the slowest settings (Brotli quality 11,
+    gzip level 9). Returns the number of variants written.
+    """
+    written = 0
+    for file in sorted(root.rglob("*")):
+        if not file.is_file() or _is_variant(file) or file.suffix in PRECOMPRESSED_SUFFIXES.values():
+            continue
+        if not is_compressible(_media_type(file.name)):
+            continue
+
+        body = file.read_bytes()
+        variants = {".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            variants[".br"] = brotli.compress(body, quality=11)
+
+        for suffix, data in variants.items():
+            # Only keep variants that are actually smaller
+            if len(data) < len(body):
+                file.with_name(file.name + suffix).write_bytes(data)
+                written += 1
+    return written
+
+
+# =============================================================================
+# CLI Entry Point
+# =============================================================================
+
+if __name__ == "__main__":
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else STATIC_DIR
+    print(f"[STATIC] Precompressed {precompress(root)} variants in {root}")
@@ -15,24 +15,28 @@ Environment Variables:
     TYPESENSE_HOST          - Typesense Cloud host (e.g., xyz.a1.typesense.net)
     TYPESENSE_API_KEY       - Admin API key (for indexing)
     TYPESENSE_SEARCH_KEY    - Search-only API key (exposed to frontend)
+    TYPESENSE_PORT          - Port (default 443)
+    TYPESENSE_PROTOCOL      - https or http (default https; http for local stand-ins)
     SUPABASE_URL            - Supabase project URL
     SUPABASE_KEY            - Supabase API key
     R2_PUBLIC_URL           - R2 public URL for image paths
 """
 
 import os
-import re
 import sys
-import unicodedata
+import time
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 # Add parent to path when running standalone
 sys.path.insert(0, str(Path(__file__).parent))
 
 import typesense
 
-from database import get_client
+from database import get_client, select_article_rows
+from metrics import Counter, Histogram
+from slugs import article_slug, article_title, assign_slugs
 
 
 # =============================================================================
@@ -41,6 +45,17 @@ from database import get_client
 
 COLLECTION_NAME = "articles"
 
+TYPESENSE_DOCUMENTS = Counter(
+    "adu_typesense_documents_total", "Documents written to Typesense by operation and result", ("operation", "result")
+)
+TYPESENSE_SECONDS = Histogram(
+    "adu_typesense_operation_seconds", "Typesense call duration by operation", ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+# Per-request timeout for Typesense calls (indexing only; search goes browser -> Typesense)
+TYPESENSE_TIMEOUT_SECONDS = float(os.getenv("TYPESENSE_TIMEOUT_SECONDS", "10"))
+
 # Fields that Typesense will index and make searchable
 COLLECTION_SCHEMA = {
     "name": COLLECTION_NAME,
@@ -107,49 +122,39 @@ def get_typesense_client() -> typesense.Client:
             "api_key": api_key,
             "nodes": [{
                 "host": host,
-                "port": "443",
-                "protocol": "https",
+                "port": os.getenv("TYPESENSE_PORT", "443"),
+                "protocol": os.getenv("TYPESENSE_PROTOCOL", "https"),
             }],
-            "connection_timeout_seconds": 10,
+            "connection_timeout_seconds": TYPESENSE_TIMEOUT_SECONDS,
         })
 
     return _ts_client
 
 
-# =============================================================================
-# Slug Generation (mirrors public.py)
-# =============================================================================
-
-def generate_slug(title: str, max_length: int = 80) -> str:
-    """Generate URL-friendly slug from title."""
-    if not title:
-        return "untitled"
-
-    slug = unicodedata.normalize("NFKD", title)
-    slug = slug.encode("ascii", "ignore").decode("ascii")
-    slug = slug.lower()
-    slug = re.sub(r"[''`]", "", slug)
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip("-")
-
-    if len(slug) > max_length:
-        slug = slug[:max_length].rsplit("-", 1)[0]
+def check_connection() -> None:
+    """
+    Make a request to Typesense so its connection is open before traffic.
 
-    return slug or "untitled"
+    Raises:
+        ValueError: If Typesense is not configured
+    """
+    get_typesense_client().collections[COLLECTION_NAME].retrieve()
 
 
 # =============================================================================
 # Data Transform
 # =============================================================================
 
-def article_to_typesense_doc(article: dict, edition_date: str = "") -> dict:
+def article_to_typesense_doc(article: dict, edition_date: str = "", slug: Optional[str] = None) -> dict:
     """
     Transform a Supabase article row into a Typesense document.
 
     Args:
         article: Raw article dict from Supabase all_articles table
         edition_date: Optional edition date string (YYYY-MM-DD)
+        slug: The article's slug within its edition (slugs.assign_slugs),
+            which differs from a generated one for unsaved duplicate
+            titles; defaults to the stored or generated slug
 
     Returns:
         Dict ready for Typesense indexing
@@ -164,8 +169,7 @@ def article_to_typesense_doc(article: dict, edition_date: str = "") -> dict:
     )
     image_url = f"{r2_url}/{image_path}" if image_path and r2_url else ""
 
-    # Title — prefer headline over original_title
-    title = article.get("headline_line_1") or article.get("headline") or article.get("original_title") or ""
+    title = article_title(article)
 
     # Tags — normalize: strip # prefix, lowercase
     raw_tags = article.get("tags") or []
@@ -196,7 +200,7 @@ def article_to_typesense_doc(article: dict, edition_date: str = "") -> dict:
         "is_studio": bool(article.get("is_studio", False)),
         "published_date": article.get("original_publish_date") or "",
         "fetch_timestamp": fetch_timestamp,
-        "slug": generate_slug(title),
+        "slug": slug or article_slug(article),
         "url": article.get("article_url") or "",
         "image_url": image_url,
         "category": article.get("selection_category") or "",
@@ -243,8 +247,13 @@ def fetch_all_published_articles() -> list:
     """
     Fetch all published articles from Supabase with their edition dates.
 
+    Slugs are assigned per edition as the slug index does (assign_slugs
+    over the edition's articles in edition order), so unsaved duplicate
+    titles get the same -2, -3 suffixes as their article URLs.
+
     Returns:
-        List of (article_dict, edition_date) tuples
+        List of (article_dict, edition_date, slug) tuples; slug is None for
+        articles in no edition
     """
     client = get_client()
 
@@ -269,21 +278,16 @@ def fetch_all_published_articles() -> list:
     offset = 0
 
     while True:
-        result = client.table("all_articles") \
-            .select("*") \
-            .eq("status", "published") \
-            .order("fetch_date", desc=True) \
-            .range(offset, offset + batch_size - 1) \
-            .execute()
-
-        batch = result.data or []
+        batch = select_article_rows(
+            "index",
+            lambda q: q.eq("status", "published")
+            .order("fetch_date", desc=True)
+            .range(offset, offset + batch_size - 1),
+        )
         if not batch:
             break
 
-        for article in batch:
-            aid = str(article.get("id", ""))
-            edition_date = article_edition_map.get(aid, "")
-            all_articles.append((article, edition_date))
+        all_articles.extend(batch)
 
         if len(batch) < batch_size:
             break
@@ -291,7 +295,31 @@ def fetch_all_published_articles() -> list:
         offset += batch_size
 
     print(f"[SYNC] Found {len(all_articles)} published articles")
-    return all_articles
+
+    # Step 3: Assign slugs edition by edition, over every listed article
+    # (unpublished ones still take their slug, as in the slug index)
+    rows = {str(article.get("id", "")): article for article in all_articles}
+    unpublished = [aid for aid in article_edition_map if aid not in rows]
+    for start in range(0, len(unpublished), batch_size):
+        chunk = unpublished[start:start + batch_size]
+        for article in select_article_rows("title", lambda q: q.in_("id", chunk)):
+            rows[str(article["id"])] = article
+
+    slugs = {}
+    for edition in (editions_result.data or []):
+        ed_date = edition.get("edition_date", "")
+        articles = [rows[str(aid)] for aid in (edition.get("article_ids") or []) if str(aid) in rows]
+        for article, slug in zip(articles, assign_slugs(articles)):
+            aid = str(article["id"])
+            if article_edition_map[aid] == ed_date:
+                slugs[aid] = slug
+
+    articles_with_dates = []
+    for article in all_articles:
+        aid = str(article.get("id", ""))
+        articles_with_dates.append((article, article_edition_map.get(aid, ""), slugs.get(aid)))
+
+    return articles_with_dates
 
 
 def full_reindex():
@@ -300,38 +328,47 @@ def full_reindex():
 
     This is the safest way to sync — ensures no stale documents.
     Takes ~10-30 seconds for a few thousand articles.
+
+    Articles are fetched before the collection is dropped, so a failed
+    fetch leaves the current index in place.
     """
     client = get_typesense_client()
 
-    # Recreate collection
-    ensure_collection(client, drop_existing=True)
-
     # Fetch all articles from Supabase
     articles_with_dates = fetch_all_published_articles()
 
     if not articles_with_dates:
-        print("[SYNC] No articles to index")
+        print("[SYNC] No articles to index; keeping the existing collection")
         return {"indexed": 0, "errors": 0}
 
+    # Recreate collection
+    ensure_collection(client, drop_existing=True)
+
     # Transform to Typesense documents
     documents = []
-    for article, edition_date in articles_with_dates:
+    for article, edition_date, slug in articles_with_dates:
         try:
-            doc = article_to_typesense_doc(article, edition_date)
+            doc = article_to_typesense_doc(article, edition_date, slug)
             documents.append(doc)
         except Exception as e:
             print(f"[SYNC] Error transforming article {article.get('id')}: {e}")
 
     # Bulk import
     print(f"[SYNC] Indexing {len(documents)} documents...")
-    results = client.collections[COLLECTION_NAME].documents.import_(
-        documents,
-        {"action": "upsert"},
-    )
+    started = time.perf_counter()
+    try:
+        results = client.collections[COLLECTION_NAME].documents.import_(
+            documents,
+            {"action": "upsert"},
+        )
+    finally:
+        TYPESENSE_SECONDS.observe(time.perf_counter() - started, "import")
 
     # Count successes and failures
     success_count = sum(1 for r in results if r.get("success", False))
     error_count = len(results) - success_count
+    TYPESENSE_DOCUMENTS.inc("import", "ok", amount=success_count)
+    TYPESENSE_DOCUMENTS.inc("import", "error", amount=error_count)
 
     if error_count > 0:
         # Print first few errors for debugging
@@ -343,7 +380,7 @@ def full_reindex():
     return {"indexed": success_count, "errors": error_count}
 
 
-def index_single_article(article: dict, edition_date: str = ""):
+def index_single_article(article: dict, edition_date: str = "", slug: Optional[str] = None):
     """
     Index or update a single article in Typesense.
 
@@ -352,29 +389,40 @@ def index_single_article(article: dict, edition_date: str = ""):
     Args:
         article: Raw article dict from Supabase
         edition_date: Edition date string
+        slug: The article's slug within the edition (see article_to_typesense_doc)
     """
     client = get_typesense_client()
-    doc = article_to_typesense_doc(article, edition_date)
+    doc = article_to_typesense_doc(article, edition_date, slug)
 
+    started = time.perf_counter()
     try:
         client.collections[COLLECTION_NAME].documents.upsert(doc)
+        TYPESENSE_DOCUMENTS.inc("upsert", "ok")
         print(f"[TYPESENSE] Indexed article: {doc['id']}")
     except Exception as e:
+        TYPESENSE_DOCUMENTS.inc("upsert", "error")
         print(f"[TYPESENSE] Error indexing {doc['id']}: {e}")
         raise
+    finally:
+        TYPESENSE_SECONDS.observe(time.perf_counter() - started, "upsert")
 
 
 def delete_single_article(article_id: str):
     """Remove a single article from the Typesense index."""
     client = get_typesense_client()
 
+    started = time.perf_counter()
     try:
         client.collections[COLLECTION_NAME].documents[article_id].delete()
+        TYPESENSE_DOCUMENTS.inc("delete", "ok")
         print(f"[TYPESENSE] Deleted article: {article_id}")
     except typesense.exceptions.ObjectNotFound:
         pass  # Already gone
     except Exception as e:
+        TYPESENSE_DOCUMENTS.inc("delete", "error")
         print(f"[TYPESENSE] Error deleting {article_id}: {e}")
+    finally:
+        TYPESENSE_SECONDS.observe(time.perf_counter() - started, "delete")
 
 
 def get_search_config() -> dict:
@@ -0,0 +1,222 @@
+"""
+Cache Warm-Up for ADUmedia Website
+
+Fills the in-process caches before visitors arrive, so the first
+requests after a deploy or a new edition do not pay the cold path:
+
+    1. Open connections to Supabase and Typesense
+    2. Load the edition date index and the article slug index (startup)
+    3. Build today/latest snapshots and the newest editions' payloads,
+       in every language
+    4. Prerender the home page in every language, the newest editions'
+       digest pages and the article pages of the newest edition
+       (prerender.py)
+    5. Render the sitemap index and the newest month's sitemap
+
+Runs from the FastAPI lifespan hook and again after each published
+edition. A failing step is logged and skipped. The app only reports ready
+once the edition index has loaded, though: without it every navigation
+lookup is a Supabase query, so the startup warm-up is retried until it
+loads.
+"""
+
+import asyncio
+import os
+import time
+from datetime import date
+from typing import Any, Awaitable, Dict, List, Optional
+
+from database import get_async_client, get_edition_index, load_edition_index, test_connection
+from slug_index import load_slug_index
+from sitemap import get_months
+from typesense_sync import check_connection as check_typesense_connection
+from prerender import get_home_page, prerender_edition
+from routes.public import (
+    SUPPORTED_LANGUAGES,
+    edition_snapshots,
+    get_edition_payload,
+    sitemap_index_stream,
+    sitemap_month_stream,
+)
+
+
+# Newest editions whose digest payloads are prebuilt
+WARMUP_EDITIONS = int(os.getenv("WARMUP_EDITIONS", "7"))
+
+# Upper bound for one warm-up run
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", "60"))
+
+# Delay between startup warm-ups while the edition index cannot be loaded
+WARMUP_RETRY_SECONDS = float(os.getenv("WARMUP_RETRY_SECONDS", "10"))
+
+# ?lang= variants to prebuild (None = no lang parameter)
+_LANGUAGES = (None,) + SUPPORTED_LANGUAGES
+
+_ready = False
+_status: Dict[str, Any] = {
+    "runs": 0,
+    "reason": None,
+    "finished_at": None,
+    "duration": None,
+    "failed_steps": [],
+}
+
+
+def is_ready() -> bool:
+    """True once a startup warm-up has finished with the edition index loaded."""
+    return _ready
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Readiness and details of the last warm-up run."""
+    return {"ready": _ready, **_status}
+
+
+# =============================================================================
+# Steps
+# =============================================================================
+
+async def _open_connections() -> None:
+    """Open the Supabase pool and the Typesense connection."""
+    await get_async_client()
+
+    results = await asyncio.gather(
+        test_connection(),
+        asyncio.to_thread(check_typesense_connection),
+        return_exceptions=True,
+    )
+    if results[0] is not True:
+        raise RuntimeError("Supabase not reachable")
+    if isinstance(results[1], ValueError):
+        print("[WARMUP] Typesense not configured, skipped")
+    elif isinstance(results[1], Exception):
+        raise results[1]
+
+
+async def _load_indexes() -> None:
+    """Load the edition date index, then the slug index."""
+    await load_edition_index()
+    await load_slug_index()
+
+
+async def _warm_edition(target: Any) -> None:
+    """Build the payloads for one edition target in every language."""
+    # The first build fetches the edition; the other languages reuse it
+    await get_edition_payload(target, None)
+    await asyncio.gather(*[get_edition_payload(target, lang) for lang in SUPPORTED_LANGUAGES])
+
+
+async def _warm_snapshots() -> None:
+    """Build the today/latest snapshots in every language."""
+    for target in ("today", "latest"):
+        await _warm_edition(target)
+        for lang in _LANGUAGES:
+            edition_snapshots.put((target, lang), await get_edition_payload(target, lang))
+
+
+async def _warm_editions(count: int) -> None:
+    """Build the payloads for the newest editions."""
+    dates = get_edition_index().dates()[-count:] if count > 0 else []
+    await asyncio.gather(*[_warm_edition(date.fromisoformat(d)) for d in dates])
+
+
+async def _warm_pages(count: int) -> None:
+    """Prerender the home page and the newest editions' pages (article pages for the newest only)."""
+    dates = get_edition_index().dates()[-count:] if count > 0 else []
+    await asyncio.gather(
+        *[get_home_page(lang) for lang in SUPPORTED_LANGUAGES],
+        *[prerender_edition(d, articles=d == dates[-1]) for d in dates],
+    )
+
+
+async def _warm_sitemaps() -> None:
+    """Render the sitemap index and the newest month."""
+    for _ in await sitemap_index_stream():
+        pass
+
+    months = await get_months()
+    if months:
+        stream = await sitemap_month_stream(months[0])
+        for _ in stream or ():
+            pass
+
+
+# =============================================================================
+# Warm-Up
+# =============================================================================
+
+async def _run_step(name: str, step: Awaitable[None], failed: List[str]) -> None:
+    """Run one step, logging (not raising) its failure."""
+    started = time.perf_counter()
+    try:
+        await step
+        print(f"[WARMUP] {name}: {(time.perf_counter() - started) * 1000:.0f}ms")
+    except Exception as e:
+        failed.append(name)
+        print(f"[WARMUP] {name} failed: {e}")
+
+
+async def _warm_up(reason: str, editions: int, failed: List[str]) -> None:
+    await _run_step("connections", _open_connections(), failed)
+    if reason == "startup":
+        await _run_step("indexes", _load_indexes(), failed)
+    await _run_step("snapshots", _warm_snapshots(), failed)
+    await _run_step("editions", _warm_editions(editions), failed)
+    await _run_step("pages", _warm_pages(editions), failed)
+    await _run_step("sitemaps", _warm_sitemaps(), failed)
+
+
+async def warm_up(reason: str = "startup", editions: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Warm the caches.
+
+    Args:
+        reason: "startup" (also loads the indexes, and marks the app ready
+            if the edition index loaded) or e.g. "publish"
+        editions: Number of newest editions to prebuild (default WARMUP_EDITIONS)
+
+    Returns:
+        Warm-up status (see get_warmup_status)
+    """
+    global _ready
+
+    started = time.perf_counter()
+    failed: List[str] = []
+
+    try:
+        await asyncio.wait_for(
+            _warm_up(reason, WARMUP_EDITIONS if editions is None else editions, failed),
+            WARMUP_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        failed.append("timeout")
+        print(f"[WARMUP] Gave up after {WARMUP_TIMEOUT_SECONDS:.0f}s")
+
+    duration = time.perf_counter() - started
+    _status.update({
+        "runs": _status["runs"] + 1,
+        "reason": reason,
+        "finished_at": time.time(),
+        "duration": round(duration, 3),
+        "failed_steps": failed,
+    })
+    if reason == "startup" and get_edition_index().loaded:
+        _ready = True
+
+    print(f"[WARMUP] {reason} warm-up done in {duration:.2f}s" + (f" (failed: {', '.join(failed)})" if failed else ""))
+    return get_warmup_status()
+
+
+async def warm_up_until_ready() -> None:
+    """
+    Run the startup warm-up until the app is ready.
+
+    Until then /api/ready reports 503 with the failed steps, so a deploy
+    never moves traffic to an instance without its edition index.
+    """
+    while True:
+        await warm_up("startup")
+        if _ready:
+            return
+        print(f"[WARMUP] Edition index not loaded; retrying in {WARMUP_RETRY_SECONDS:.0f}s")
+        await asyncio.sleep(WARMUP_RETRY_SECONDS)
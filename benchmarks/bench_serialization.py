@@ -0,0 +1,56 @@
+"""
+JSON Serialization Benchmark
+
+Compares the ways a digest response (20-article edition) can be encoded:
+
+    stdlib          FastAPI's previous default: jsonable_encoder + json.dumps
+    fast            FastJSONResponse rendering the dict (orjson)
+    payload hit     FastJSONResponse given already-serialized cached bytes
+
+Usage:
+    python benchmarks/bench_serialization.py [--number N]
+"""
+
+import argparse
+import os
+import timeit
+
+import fixtures  # noqa: F401  (sets up the backend import path)
+
+os.environ.setdefault("R2_PUBLIC_URL", "https://images.adu.media")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from json_response import FastJSONResponse, dumps, orjson
+from routes.public import edition_bundle_response
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="Iterations per case")
+    args = parser.parse_args()
+
+    content = edition_bundle_response(fixtures.make_bundle())
+    body = dumps(content)
+
+    cases = [
+        ("stdlib", lambda: JSONResponse(jsonable_encoder(content))),
+        ("fast", lambda: FastJSONResponse(content)),
+        ("payload hit", lambda: FastJSONResponse(body)),
+    ]
+
+    print(f"Edition: {len(content['articles'])} articles, {len(body):,} bytes JSON")
+    print(f"Encoder: {'orjson ' + orjson.__version__ if orjson else 'stdlib json (orjson not installed)'}")
+    print()
+    print(f"{'case':<14}{'us/response':>14}{'speedup':>10}")
+
+    baseline = None
+    for name, fn in cases:
+        best = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number * 1e6
+        baseline = baseline or best
+        print(f"{name:<14}{best:>14.1f}{baseline / best:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
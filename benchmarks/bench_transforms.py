@@ -0,0 +1,255 @@
+"""
+Transform and Indexing Benchmark
+
+Times the per-article functions behind every API response and every
+Typesense reindex, on a fixture edition of 20 articles with full
+translation dicts:
+
+    generate_slug               slug from a title (uncached and memoized)
+    format_date                 '30 January 2026' display dates
+    transform_article           article page (row dicts and cached records, with ?lang=)
+    transform_edition           digest (row dicts and cached records, with ?lang=)
+    article_to_typesense_doc    search documents (row dicts and records)
+
+Results are in microseconds per article (best of --repeat rounds). With
+--save they are stored as the baseline. Otherwise they are compared with
+the stored baseline, and the exit status is 1 if a case got slower by more
+than --threshold.
+
+A fixed pure-Python reference workload is timed in the same rounds, and
+cases are compared relative to it. A slower or busier machine (shared CI
+runners) then does not read as a regression. Use --absolute to compare
+raw times instead. Baselines are still best saved on the machine (or CI
+runner type) that runs the comparison.
+
+Usage:
+    python benchmarks/bench_transforms.py --save        (on the main branch)
+    python benchmarks/bench_transforms.py               (on a change; compare)
+    python benchmarks/bench_transforms.py --filter edition --output report.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fixtures
+
+os.environ.setdefault("R2_PUBLIC_URL", "https://images.adu.media")
+
+from database import ARTICLE_PROJECTIONS
+from records import article_record, format_date
+from routes.public import transform_article, transform_edition
+from slugs import article_title, generate_slug
+from typesense_sync import article_to_typesense_doc
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "transforms.json"
+
+# (name, function processing a whole edition, articles processed per call)
+Case = Tuple[str, Callable[[], Any], int]
+
+REFERENCE = "reference"
+
+
+def _reference_workload(_words=[f"word{i}" for i in range(40)]) -> None:
+    """Fixed dict/str work, the same mix as the transforms (not repo code)."""
+    for i in range(20):
+        row = {word: i for word in _words}
+        "-".join(sorted(row)).lower().replace("word", "w")
+
+
+def _project(row: Dict[str, Any], projection: str) -> Dict[str, Any]:
+    """Row as Supabase returns it for a projection's select()."""
+    return {column: row.get(column) for column in ARTICLE_PROJECTIONS[projection]}
+
+
+def build_cases() -> List[Case]:
+    edition_date = date(2026, 1, 30)
+    edition, rows = fixtures.make_edition(edition_date)
+    for row in rows:
+        row["slug"] = generate_slug(article_title(row))  # stored slugs, as in production
+        row["fetch_date"] = f"{edition_date.isoformat()}T08:00:00+00:00"
+
+    n = len(rows)
+    titles = [article_title(row) for row in rows]
+    dates = [edition_date - timedelta(days=i) for i in range(n)]
+    uncached_slug = generate_slug.__wrapped__
+
+    detail_rows = [_project(row, "detail") for row in rows]
+    card_rows = [_project(row, "card") for row in rows]
+    index_rows = [_project(row, "index") for row in rows]
+
+    # The data layer caches records, so most responses start from these
+    detail_records = [article_record(row, "detail") for row in detail_rows]
+    card_records = [article_record(row, "card") for row in card_rows]
+    index_records = [article_record(row, "index") for row in index_rows]
+
+    for title in titles:
+        generate_slug(title)
+
+    return [
+        (REFERENCE, _reference_workload, n),
+        ("generate_slug", lambda: [uncached_slug(t) for t in titles], n),
+        ("generate_slug memoized", lambda: [generate_slug(t) for t in titles], n),
+        ("format_date", lambda: [format_date(d) for d in dates], n),
+        ("transform_article row", lambda: [transform_article(r, projection="detail") for r in detail_rows], n),
+        ("transform_article row lang", lambda: [transform_article(r, projection="detail", lang="es") for r in detail_rows], n),
+        ("transform_article record", lambda: [transform_article(r, projection="detail") for r in detail_records], n),
+        ("transform_article record lang", lambda: [transform_article(r, projection="detail", lang="es") for r in detail_records], n),
+        ("transform_edition rows", lambda: transform_edition(edition, card_rows, use_thumbnails=True), n),
+        ("transform_edition records", lambda: transform_edition(edition, card_records, use_thumbnails=True), n),
+        ("transform_edition records lang", lambda: transform_edition(edition, card_records, use_thumbnails=True, lang="fr"), n),
+        ("article_to_typesense_doc row", lambda: [article_to_typesense_doc(r, edition["edition_date"]) for r in index_rows], n),
+        ("article_to_typesense_doc record", lambda: [article_to_typesense_doc(r, edition["edition_date"]) for r in index_records], n),
+    ]
+
+
+def measure(cases: List[Case], repeat: int, min_seconds: float) -> Dict[str, float]:
+    """
+    Best time per article in microseconds, per case.
+
+    Rounds are interleaved across cases, so a burst of load on the machine
+    slows one round of every case rather than every round of one case.
+    """
+    timers = []
+    for name, fn, articles in cases:
+        timer = timeit.Timer(fn)
+        number = 1
+        while timer.timeit(number) < min_seconds:
+            number *= 2
+        timers.append((name, timer, number, articles))
+
+    best = {name: float("inf") for name, _, _, _ in timers}
+    for _ in range(repeat):
+        for name, timer, number, articles in timers:
+            best[name] = min(best[name], timer.timeit(number) / number / articles * 1e6)
+    return {name: round(value, 3) for name, value in best.items()}
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, Any],
+    threshold: float,
+    speed: float = 1.0,
+) -> List[Dict[str, Any]]:
+    """
+    Per-case comparison rows: status is regression, faster, ok or new.
+
+    Args:
+        speed: Current reference time / baseline reference time; current
+            times are divided by it before comparing
+    """
+    rows = []
+    for name, current in results.items():
+        before = baseline["results"].get(name)
+        if before is None or name == REFERENCE:
+            if name != REFERENCE:
+                rows.append({"case": name, "baseline_us": None, "current_us": current, "change": None, "status": "new"})
+            continue
+
+        change = current / speed / before - 1
+        status = "regression" if change > threshold else "faster" if change < -threshold else "ok"
+        rows.append({
+            "case": name,
+            "baseline_us": before,
+            "current_us": current,
+            "change": round(change, 4),
+            "status": status,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Slowdown that counts as a regression")
+    parser.add_argument("--repeat", type=int, default=40, help="Timing rounds per case (best is kept)")
+    parser.add_argument("--min-time", type=float, default=0.01, help="Minimum seconds per timing round")
+    parser.add_argument("--absolute", action="store_true", help="Compare raw times (no reference scaling)")
+    parser.add_argument("--filter", help="Only run cases containing this text")
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    args = parser.parse_args()
+    if args.save and args.filter:
+        parser.error("--save records every case (the baseline shares one reference time); drop --filter")
+
+    cases = [c for c in build_cases() if c[0] == REFERENCE or not args.filter or args.filter in c[0]]
+
+    results = measure(cases, args.repeat, args.min_time)
+
+    baseline: Optional[Dict[str, Any]] = None
+    if args.baseline.exists() and not args.save:
+        baseline = json.loads(args.baseline.read_text())
+
+    report: Dict[str, Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "unit": "us/article",
+        "results": results,
+    }
+
+    regressions = []
+    if baseline is not None:
+        speed = 1.0
+        if not args.absolute and REFERENCE in baseline["results"]:
+            speed = results[REFERENCE] / baseline["results"][REFERENCE]
+        comparison = compare(results, baseline, args.threshold, speed)
+        regressions = [row for row in comparison if row["status"] == "regression"]
+        report["baseline"] = {
+            "file": str(args.baseline),
+            "created_at": baseline.get("created_at"),
+            "environment": baseline.get("environment"),
+        }
+        report["threshold"] = args.threshold
+        report["reference_ratio"] = round(speed, 4)
+        report["comparison"] = comparison
+
+        if baseline.get("environment") != report["environment"]:
+            print(f"Warning: baseline was recorded on {baseline.get('environment')}; numbers may not be comparable\n")
+        if speed != 1.0:
+            print(f"Reference workload took {speed:.2f}x its baseline time; changes are relative to that\n")
+
+        print(f"{'case':<34}{'baseline':>10}{'current':>10}{'change':>9}  status")
+        for row in comparison:
+            before = f"{row['baseline_us']:.2f}" if row["baseline_us"] is not None else "-"
+            change = f"{row['change']:+.1%}" if row["change"] is not None else "-"
+            print(f"{row['case']:<34}{before:>10}{row['current_us']:>10.2f}{change:>9}  {row['status']}")
+        print(f"\nus/article (reference {results[REFERENCE]:.2f}); regression = more than {args.threshold:.0%} slower than the baseline")
+    else:
+        print(f"{'case':<34}{'us/article':>12}")
+        for name, value in results.items():
+            print(f"{name:<34}{value:>12.2f}")
+
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+    elif baseline is None:
+        print(f"\nNo baseline at {args.baseline}; run with --save to create one")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(row['case'] for row in regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
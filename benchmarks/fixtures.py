@@ -0,0 +1,119 @@
+"""
+Benchmark Fixtures for ADUmedia Website
+
+Synthetic Supabase rows shaped like production data: a daily edition of
+20 articles, each with long AI summaries and translations into every
+site language.
+
+All data is derived from a fixed seed, so runs are comparable.
+"""
+
+import random
+import sys
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Backend modules are imported top-level (same as backend/main.py)
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+LANGUAGES = ["es", "fr", "pt-br", "ru"]
+
+ARTICLES_PER_EDITION = 20
+
+_WORDS = (
+    "architects studio tower museum pavilion housing timber concrete facade "
+    "courtyard library school bridge adaptive reuse residential cultural "
+    "landscape competition masterplan office campus renovation extension "
+    "brick steel glass terrace atrium gallery sustainable modular"
+).split()
+
+_CITIES = ["Beijing", "Copenhagen", "São Paulo", "Zürich", "Kraków", "Lagos", "Tokyo", "Montréal"]
+
+_SOURCES = [
+    ("archdaily", "ArchDaily"),
+    ("dezeen", "Dezeen"),
+    ("designboom", "designboom"),
+    ("divisare", "Divisare"),
+]
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize()
+
+
+def _translations(rng: random.Random, words: int) -> Dict[str, str]:
+    return {lang: _sentence(rng, words) for lang in LANGUAGES}
+
+
+def make_article(rng: random.Random, edition_date: date) -> Dict[str, Any]:
+    """One all_articles row with every column the public API reads."""
+    line_1 = f"{_sentence(rng, 4)} in {rng.choice(_CITIES)}"
+    line_2 = _sentence(rng, 6)
+    source_id, source_name = rng.choice(_SOURCES)
+    article_id = str(uuid.UUID(int=rng.getrandbits(128)))
+
+    return {
+        "id": article_id,
+        "original_title": f"{line_1}: {line_2}",
+        "headline": f"{line_1} {line_2}",
+        "headline_line_1": line_1,
+        "headline_line_2": line_2,
+        "source_id": source_id,
+        "source_name": source_name,
+        "article_url": f"https://www.{source_id}.com/{article_id}",
+        "original_publish_date": (edition_date - timedelta(days=1)).isoformat(),
+        "ai_summary": ". ".join(_sentence(rng, 14) for _ in range(5)) + ".",
+        "r2_image_path": f"images/{edition_date.isoformat()}/{article_id}.jpg",
+        "r2_thumbnail_path": f"thumbnails/{edition_date.isoformat()}/{article_id}.jpg",
+        "tags": [f"#{rng.choice(_WORDS)}" for _ in range(4)],
+        "selection_category": rng.choice(["project", "news", "competition"]),
+        "is_studio": rng.random() < 0.1,
+        "status": "published",
+        "headline_translations": _translations(rng, 10),
+        "headline_line_1_translations": _translations(rng, 5),
+        "headline_line_2_translations": _translations(rng, 6),
+        "ai_summary_translations": {
+            lang: ". ".join(_sentence(rng, 14) for _ in range(5)) + "."
+            for lang in LANGUAGES
+        },
+    }
+
+
+def make_edition(
+    edition_date: date = date(2026, 1, 30),
+    articles: int = ARTICLES_PER_EDITION,
+    seed: int = 0,
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Build an editions row and its article rows.
+
+    Returns:
+        (edition, articles) in the shape returned by Supabase
+    """
+    rng = random.Random(seed)
+    rows = [make_article(rng, edition_date) for _ in range(articles)]
+
+    edition = {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "edition_date": edition_date.isoformat(),
+        "edition_type": "daily",
+        "article_ids": [a["id"] for a in rows],
+        "articles_selected": len(rows),
+        "edition_summary": ". ".join(_sentence(rng, 16) for _ in range(3)) + ".",
+        "created_at": f"{edition_date.isoformat()}T21:00:00+00:00",
+    }
+    return edition, rows
+
+
+def make_bundle(edition_date: date = date(2026, 1, 30), seed: int = 0) -> Dict[str, Any]:
+    """An edition bundle as returned by database.get_edition_bundle()."""
+    edition, articles = make_edition(edition_date, seed=seed)
+    return {
+        "edition": edition,
+        "articles": articles,
+        "prev_edition_date": (edition_date - timedelta(days=1)).isoformat(),
+        "next_edition_date": None,
+    }
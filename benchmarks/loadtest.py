@@ -0,0 +1,489 @@
+"""
+Load Test for ADUmedia Website
+
+Starts the backend (uvicorn, as in production) against the local
+Supabase/Typesense stand-in (stand_in.py). It then replays a traffic mix
+and reports throughput and p50/p95/p99 latency per endpoint as JSON.
+
+Scenarios:
+    browse   Steady-state readers: today's digest, recent editions and
+             article pages, ?lang= variants, edition lists, health probes
+    crawl    Search engine crawl: sitemaps and archive pages spread over
+             every edition (mostly cache misses)
+    surge    The 22:00 publish. First baseline traffic. Then the next
+             edition is inserted and its webhook delivered mid-load, while
+             readers pile onto today/latest and the new articles. Editor
+             fixes (article-updated webhooks) arrive during the surge.
+
+Results are deterministic for a given --seed apart from timing. The JSON
+report also includes the stand-in's request counts, i.e. how many
+Supabase/Typesense calls the traffic caused.
+
+Usage:
+    python benchmarks/loadtest.py --scenario surge --duration 60 --concurrency 64
+    python benchmarks/loadtest.py --scenario browse --output browse.json
+    python benchmarks/loadtest.py --app-url http://127.0.0.1:8080 --stand-in-url http://127.0.0.1:54321
+        (reuse servers that are already running; the app must use the stand-in)
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fixtures
+
+import httpx
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+LANGUAGES = [None, None, None, "en", "es", "fr", "pt-br", "ru"]
+
+WEBHOOK_SECRET = "loadtest-webhook-secret"
+
+# Looks like a Supabase anon key (the client checks the format)
+DUMMY_SUPABASE_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.loadtest"
+
+
+# =============================================================================
+# Catalog
+# =============================================================================
+
+class Catalog:
+    """Edition dates and article (id, slug) pairs, from the stand-in."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.update(data)
+
+    def update(self, data: Dict[str, Any]) -> None:
+        self.dates: List[str] = [e["edition_date"] for e in data["editions"]]
+        self.articles: Dict[str, List[Tuple[str, Optional[str]]]] = {
+            e["edition_date"]: [tuple(a) for a in e["articles"]] for e in data["editions"]
+        }
+        self.months = sorted({d[:7] for d in self.dates})
+
+    def missing_slugs(self) -> int:
+        return sum(1 for arts in self.articles.values() for _, slug in arts if not slug)
+
+    def recent_date(self, rng: random.Random, days: int = 7) -> str:
+        """A recent edition date, newer ones more likely (Zipf-like)."""
+        recent = self.dates[-days:][::-1]
+        weights = [1 / (rank + 1) for rank in range(len(recent))]
+        return rng.choices(recent, weights)[0]
+
+    def archive_date(self, rng: random.Random) -> str:
+        return rng.choice(self.dates)
+
+
+# =============================================================================
+# Traffic Mixes
+# =============================================================================
+
+# A request: (endpoint label, method, path)
+RequestSpec = Tuple[str, str, str]
+Mix = List[Tuple[float, Callable[[random.Random, Catalog], RequestSpec]]]
+
+
+def _lang(rng: random.Random, path: str) -> str:
+    lang = rng.choice(LANGUAGES)
+    return f"{path}?lang={lang}" if lang else path
+
+
+def _article_page(rng: random.Random, catalog: Catalog, edition_date: str) -> RequestSpec:
+    article_id, slug = rng.choice(catalog.articles[edition_date])
+    if slug:
+        return "GET /api/article/{date}/{slug}", "GET", _lang(rng, f"/api/article/{edition_date}/{slug}")
+    return "GET /api/articles/{id}", "GET", _lang(rng, f"/api/articles/{article_id}")
+
+
+BROWSE: Mix = [
+    (25, lambda r, c: ("GET /api/editions/today", "GET", _lang(r, "/api/editions/today"))),
+    (5, lambda r, c: ("GET /api/editions/latest", "GET", _lang(r, "/api/editions/latest"))),
+    (20, lambda r, c: ("GET /api/editions/{date}", "GET", _lang(r, f"/api/editions/{c.recent_date(r)}"))),
+    (25, lambda r, c: _article_page(r, c, c.recent_date(r))),
+    (5, lambda r, c: ("GET /api/articles/{id}", "GET", _lang(r, f"/api/articles/{r.choice(c.articles[c.recent_date(r)])[0]}"))),
+    (10, lambda r, c: ("GET /api/editions", "GET", f"/api/editions?limit=20&offset={r.choice([0, 0, 0, 20, 40])}")),
+    (2, lambda r, c: ("GET /api/search/config", "GET", "/api/search/config")),
+    (3, lambda r, c: ("GET /api/health", "GET", "/api/health")),
+]
+
+CRAWL: Mix = [
+    (5, lambda r, c: ("GET /api/sitemap.xml", "GET", "/api/sitemap.xml")),
+    (10, lambda r, c: ("GET /api/sitemap/{month}.xml", "GET", f"/api/sitemap/{r.choice(c.months)}.xml")),
+    (40, lambda r, c: ("GET /api/editions/{date}", "GET", f"/api/editions/{c.archive_date(r)}")),
+    (40, lambda r, c: _article_page(r, c, c.archive_date(r))),
+    (5, lambda r, c: ("GET /api/robots.txt", "GET", "/api/robots.txt")),
+]
+
+# After the publish: everyone opens today's digest and its articles
+SURGE: Mix = [
+    (40, lambda r, c: ("GET /api/editions/today", "GET", _lang(r, "/api/editions/today"))),
+    (10, lambda r, c: ("GET /api/editions/latest", "GET", _lang(r, "/api/editions/latest"))),
+    (35, lambda r, c: _article_page(r, c, c.dates[-1])),
+    (5, lambda r, c: ("GET /api/editions/{date}", "GET", _lang(r, f"/api/editions/{c.recent_date(r)}"))),
+    (7, lambda r, c: ("GET /api/editions", "GET", "/api/editions?limit=20")),
+    (3, lambda r, c: ("GET /api/health", "GET", "/api/health")),
+]
+
+MIXES = {"browse": BROWSE, "crawl": CRAWL, "surge": SURGE}
+
+
+@dataclass
+class Phase:
+    name: str
+    seconds: float
+    concurrency: int
+    mix: Mix
+
+
+def build_phases(scenario: str, duration: float, concurrency: int) -> List[Phase]:
+    if scenario == "surge":
+        return [
+            Phase("before", duration * 0.25, max(1, concurrency // 4), BROWSE),
+            Phase("surge", duration * 0.5, concurrency, SURGE),
+            Phase("after", duration * 0.25, max(1, concurrency // 2), BROWSE),
+        ]
+    return [Phase(scenario, duration, concurrency, MIXES[scenario])]
+
+
+# =============================================================================
+# Recording
+# =============================================================================
+
+@dataclass
+class Recorder:
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    statuses: Dict[str, Counter] = field(default_factory=dict)
+
+    def record(self, endpoint: str, seconds: float, status: str) -> None:
+        self.latencies.setdefault(endpoint, []).append(seconds)
+        self.statuses.setdefault(endpoint, Counter())[status] += 1
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def _summarize(latencies: List[float], statuses: Counter, seconds: float) -> Dict[str, Any]:
+    values = sorted(latencies)
+    errors = sum(n for s, n in statuses.items() if not s.startswith(("2", "3")))
+    return {
+        "count": len(values),
+        "rps": round(len(values) / seconds, 1) if seconds else None,
+        "errors": errors,
+        "p50_ms": round(_percentile(values, 50) * 1000, 2) if values else None,
+        "p95_ms": round(_percentile(values, 95) * 1000, 2) if values else None,
+        "p99_ms": round(_percentile(values, 99) * 1000, 2) if values else None,
+        "max_ms": round(values[-1] * 1000, 2) if values else None,
+        "status": dict(sorted(statuses.items())),
+    }
+
+
+def report_section(recorder: Recorder, seconds: float) -> Dict[str, Any]:
+    everything: List[float] = []
+    statuses: Counter = Counter()
+    for endpoint, values in recorder.latencies.items():
+        everything.extend(values)
+        statuses.update(recorder.statuses[endpoint])
+
+    return {
+        "summary": _summarize(everything, statuses, seconds),
+        "endpoints": {
+            endpoint: _summarize(values, recorder.statuses[endpoint], seconds)
+            for endpoint, values in sorted(recorder.latencies.items())
+        },
+    }
+
+
+# =============================================================================
+# Load Generation
+# =============================================================================
+
+class LoadTest:
+    """Closed-loop workers replaying a scenario's phases against the app."""
+
+    def __init__(self, app_url: str, stand_in_url: str, scenario: str, duration: float, concurrency: int, seed: int):
+        self.app_url = app_url
+        self.stand_in_url = stand_in_url
+        self.scenario = scenario
+        self.phases = build_phases(scenario, duration, concurrency)
+        self.max_concurrency = max(p.concurrency for p in self.phases)
+        self.seed = seed
+
+        self.catalog: Optional[Catalog] = None
+        self.phase: Phase = self.phases[0]
+        self.recorder = Recorder()
+        self.events: List[Dict[str, Any]] = []
+        self._stopping = False
+
+    async def _worker(self, index: int, client: httpx.AsyncClient) -> None:
+        rng = random.Random(self.seed * 100_003 + index)
+        while not self._stopping:
+            phase = self.phase
+            if index >= phase.concurrency:
+                await asyncio.sleep(0.05)
+                continue
+
+            weights = [w for w, _ in phase.mix]
+            endpoint, method, path = rng.choices(phase.mix, weights)[0][1](rng, self.catalog)
+
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path)
+                await response.aclose()
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            self.recorder.record(endpoint, time.perf_counter() - started, status)
+
+    async def _refresh_catalog(self, stand_in: httpx.AsyncClient) -> None:
+        self.catalog.update((await stand_in.get("/_control/catalog")).json())
+
+    async def _publish(self, client: httpx.AsyncClient, stand_in: httpx.AsyncClient, at: float) -> Dict[str, Any]:
+        """Insert the next edition and deliver its webhook, like Supabase at 22:00."""
+        record = (await stand_in.post("/_control/publish")).json()
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/webhook/edition-published",
+            json={"type": "INSERT", "table": "editions", "record": record, "old_record": None},
+            headers={"x-webhook-secret": WEBHOOK_SECRET},
+        )
+        await self._refresh_catalog(stand_in)
+        return {
+            "event": "edition-published",
+            "at_s": round(time.perf_counter() - at, 2),
+            "edition_date": record["edition_date"],
+            "webhook_status": response.status_code,
+            "webhook_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    async def _edit_articles(
+        self, client: httpx.AsyncClient, stand_in: httpx.AsyncClient, at: float, count: int = 3
+    ) -> Dict[str, Any]:
+        """Deliver article-updated webhooks (full rows) for articles of the newest edition."""
+        newest = self.catalog.dates[-1]
+        statuses = []
+        started = time.perf_counter()
+        for article_id, _ in self.catalog.articles[newest][:count]:
+            record = (await stand_in.get("/rest/v1/all_articles", params={"id": f"eq.{article_id}"})).json()[0]
+            response = await client.post(
+                "/api/webhook/article-updated",
+                json={"type": "UPDATE", "table": "all_articles", "record": record, "old_record": None},
+                headers={"x-webhook-secret": WEBHOOK_SECRET},
+            )
+            statuses.append(response.status_code)
+        return {
+            "event": "article-updated",
+            "at_s": round(time.perf_counter() - at, 2),
+            "webhook_statuses": statuses,
+            "webhook_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        limits = httpx.Limits(max_connections=self.max_concurrency + 8, max_keepalive_connections=self.max_concurrency + 8)
+        async with httpx.AsyncClient(base_url=self.app_url, limits=limits, timeout=30) as client, \
+                httpx.AsyncClient(base_url=self.stand_in_url, timeout=30) as stand_in:
+            self.catalog = Catalog((await stand_in.get("/_control/catalog")).json())
+            stats_before = (await stand_in.get("/_control/stats")).json()
+
+            workers = [asyncio.create_task(self._worker(i, client)) for i in range(self.max_concurrency)]
+            started = time.perf_counter()
+            phase_reports = []
+
+            for phase in self.phases:
+                self.phase = phase
+                self.recorder = Recorder()
+                phase_started = time.perf_counter()
+
+                if phase.name == "surge":
+                    self.events.append(await self._publish(client, stand_in, started))
+                    await asyncio.sleep(phase.seconds / 2)
+                    await self._refresh_catalog(stand_in)  # slugs assigned by the webhook
+                    self.events.append(await self._edit_articles(client, stand_in, started))
+                    await asyncio.sleep(max(0.0, phase.seconds - (time.perf_counter() - phase_started)))
+                else:
+                    await asyncio.sleep(phase.seconds)
+
+                elapsed = time.perf_counter() - phase_started
+                phase_reports.append((phase, elapsed, self.recorder))
+
+            self._stopping = True
+            await asyncio.gather(*workers)
+            total_seconds = time.perf_counter() - started
+            stats_after = (await stand_in.get("/_control/stats")).json()
+
+        merged = Recorder()
+        for _, _, recorder in phase_reports:
+            for endpoint, values in recorder.latencies.items():
+                merged.latencies.setdefault(endpoint, []).extend(values)
+                merged.statuses.setdefault(endpoint, Counter()).update(recorder.statuses[endpoint])
+
+        return {
+            "scenario": self.scenario,
+            "duration_s": round(total_seconds, 2),
+            **report_section(merged, total_seconds),
+            "phases": [
+                {"name": phase.name, "seconds": round(elapsed, 2), "concurrency": phase.concurrency,
+                 **report_section(recorder, elapsed)}
+                for phase, elapsed, recorder in phase_reports
+            ] if len(phase_reports) > 1 else [],
+            "events": self.events,
+            "upstream_requests": {
+                key: stats_after.get(key, 0) - stats_before.get(key, 0)
+                for key in sorted(stats_after) if stats_after.get(key, 0) - stats_before.get(key, 0)
+            },
+        }
+
+
+# =============================================================================
+# Servers
+# =============================================================================
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for(url: str, timeout: float, process: Optional[subprocess.Popen] = None) -> None:
+    """Poll url until it answers 200."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Process for {url} exited with {process.returncode}")
+        try:
+            if httpx.get(url, timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"{url} not ready after {timeout:.0f}s")
+
+
+def _wait_for_slugs(stand_in_url: str, timeout: float = 60) -> None:
+    """Wait until the app's startup task has stored every article slug."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if Catalog(httpx.get(f"{stand_in_url}/_control/catalog", timeout=10).json()).missing_slugs() == 0:
+            return
+        time.sleep(0.5)
+    print("[LOADTEST] Some slugs still missing; those articles are requested by ID", file=sys.stderr)
+
+
+def start_servers(args: argparse.Namespace, log_dir: Path) -> Tuple[str, str, List[subprocess.Popen]]:
+    """Start the stand-in and the app unless URLs were given."""
+    processes = []
+
+    stand_in_url = args.stand_in_url
+    if not stand_in_url:
+        port = _free_port()
+        stand_in_url = f"http://127.0.0.1:{port}"
+        processes.append(subprocess.Popen(
+            [sys.executable, str(BENCHMARKS_DIR / "stand_in.py"), "--port", str(port),
+             "--editions", str(args.editions), "--articles", str(args.articles),
+             "--seed", str(args.seed), "--latency-ms", str(args.latency_ms)],
+            stdout=open(log_dir / "stand_in.log", "w"), stderr=subprocess.STDOUT,
+        ))
+        _wait_for(f"{stand_in_url}/health", 300, processes[-1])
+
+    app_url = args.app_url
+    if not app_url:
+        port = _free_port()
+        app_url = f"http://127.0.0.1:{port}"
+        env = {
+            **os.environ,
+            "SUPABASE_URL": stand_in_url,
+            "SUPABASE_KEY": DUMMY_SUPABASE_KEY,
+            "TYPESENSE_HOST": "127.0.0.1",
+            "TYPESENSE_PORT": stand_in_url.rsplit(":", 1)[1],
+            "TYPESENSE_PROTOCOL": "http",
+            "TYPESENSE_API_KEY": "loadtest",
+            "WEBHOOK_SECRET": WEBHOOK_SECRET,
+            "R2_PUBLIC_URL": "https://images.adu.media",
+        }
+        processes.append(subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--log-level", "warning", "--no-access-log"],
+            cwd=str(fixtures.BACKEND_DIR), env=env,
+            stdout=open(log_dir / "app.log", "w"), stderr=subprocess.STDOUT,
+        ))
+        _wait_for(f"{app_url}/api/ready", 300, processes[-1])
+        _wait_for_slugs(stand_in_url)
+
+    return app_url, stand_in_url, processes
+
+
+def _print_table(report: Dict[str, Any]) -> None:
+    """Human-readable summary on stderr (the JSON report goes to stdout/--output)."""
+    out = sys.stderr
+    s = report["summary"]
+    print(f"\n{report['scenario']}: {s['count']} requests in {report['duration_s']}s "
+          f"= {s['rps']} req/s, {s['errors']} errors", file=out)
+    print(f"{'endpoint':<36}{'count':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'errors':>8}", file=out)
+    for endpoint, e in report["endpoints"].items():
+        print(f"{endpoint:<36}{e['count']:>8}{e['p50_ms']:>9.1f}{e['p95_ms']:>9.1f}{e['p99_ms']:>9.1f}{e['errors']:>8}",
+              file=out)
+    for event in report["events"]:
+        print(f"event: {event}", file=out)
+    print(f"upstream requests: {report['upstream_requests']}", file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenario", choices=["browse", "crawl", "surge"], default="browse")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients (peak)")
+    parser.add_argument("--editions", type=int, default=365, help="Editions seeded in the stand-in")
+    parser.add_argument("--articles", type=int, default=fixtures.ARTICLES_PER_EDITION, help="Articles per edition")
+    parser.add_argument("--latency-ms", type=float, default=25.0, help="Stand-in round-trip latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--app-url", help="Use a running app instead of starting one")
+    parser.add_argument("--stand-in-url", help="Use a running stand-in instead of starting one")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    log_dir = Path(tempfile.mkdtemp(prefix="adu-loadtest-"))
+    app_url, stand_in_url, processes = start_servers(args, log_dir)
+    try:
+        test = LoadTest(app_url, stand_in_url, args.scenario, args.duration, args.concurrency, args.seed)
+        report = asyncio.run(test.run())
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait(timeout=10)
+
+    report["config"] = {
+        "duration": args.duration,
+        "concurrency": args.concurrency,
+        "editions": args.editions,
+        "articles_per_edition": args.articles,
+        "latency_ms": args.latency_ms,
+        "seed": args.seed,
+        "logs": str(log_dir),
+    }
+
+    _print_table(report)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
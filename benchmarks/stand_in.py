@@ -0,0 +1,360 @@
+"""
+Local Supabase/Typesense Stand-In for Load Tests
+
+One HTTP server playing both cloud services for the backend:
+
+    /rest/v1/{table}                 PostgREST subset used by database.py
+                                     (select, eq/neq/lt/lte/gt/gte/in/is/cs/ilike
+                                     filters, order, limit/offset, count=exact,
+                                     PATCH, DELETE)
+    /rest/v1/rpc/get_edition_bundle  The RPC in backend/sql/get_edition_bundle.sql
+    /collections/...                 Typesense collection and document endpoints
+
+plus control endpoints for the load test:
+
+    GET  /_control/catalog           Edition dates and (article id, slug) pairs
+    POST /_control/publish           Insert the next edition (returns its row)
+    GET  /_control/stats             Requests served per service/table
+
+The tables are seeded from benchmarks/fixtures.py at a configurable scale,
+and every request can be delayed to model the network round-trip to the
+cloud services.
+
+Usage:
+    python benchmarks/stand_in.py [--port 54321] [--editions 365] [--latency-ms 25]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fixtures  # noqa: F401  (sets up the backend import path)
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from database import article_columns
+from json_response import dumps
+
+
+# =============================================================================
+# Data
+# =============================================================================
+
+class Store:
+    """
+    In-memory editions / all_articles / projects tables.
+
+    Args:
+        editions: Number of daily editions, ending yesterday
+        articles: Articles per edition
+        seed: Base seed (edition i uses seed + i)
+    """
+
+    def __init__(self, editions: int, articles: int, seed: int = 0):
+        self.articles_per_edition = articles
+        self.seed = seed
+        self.tables: Dict[str, List[Dict[str, Any]]] = {"editions": [], "all_articles": [], "projects": []}
+        self.articles_by_id: Dict[str, Dict[str, Any]] = {}
+
+        first = date.today() - timedelta(days=editions)
+        for i in range(editions):
+            self.add_edition(first + timedelta(days=i))
+
+    def add_edition(self, edition_date: date) -> Dict[str, Any]:
+        index = len(self.tables["editions"])
+        edition, rows = fixtures.make_edition(edition_date, self.articles_per_edition, seed=self.seed + index)
+        for row in rows:
+            row.setdefault("slug", None)
+            row.setdefault("fetch_date", f"{edition_date.isoformat()}T06:00:00+00:00")
+            self.articles_by_id[row["id"]] = row
+        self.tables["all_articles"].extend(rows)
+        self.tables["editions"].append(edition)
+        return edition
+
+    def publish_next(self) -> Dict[str, Any]:
+        """Add the edition after the newest one (the evening publish)."""
+        latest = max(e["edition_date"] for e in self.tables["editions"])
+        return self.add_edition(date.fromisoformat(latest) + timedelta(days=1))
+
+    def edition_for(self, target: str, today: str) -> Optional[Dict[str, Any]]:
+        editions = self.tables["editions"]
+        if not editions:
+            return None
+        if target == "latest":
+            return max(editions, key=lambda e: e["edition_date"])
+        wanted = today if target == "today" else target
+        match = next((e for e in editions if e["edition_date"] == wanted), None)
+        if match is None and target == "today":
+            return max(editions, key=lambda e: e["edition_date"])
+        return match
+
+
+# =============================================================================
+# PostgREST Query Emulation
+# =============================================================================
+
+def _scalar(value: Any) -> str:
+    """Render a cell the way PostgREST compares it in filters."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return "" if value is None else str(value)
+
+
+def _split_list(text: str) -> List[str]:
+    return [v.strip().strip('"') for v in text.split(",") if v.strip()]
+
+
+def _filter(column: str, expression: str) -> Callable[[Dict[str, Any]], bool]:
+    op, _, arg = expression.partition(".")
+    negate = op == "not"
+    if negate:
+        op, _, arg = arg.partition(".")
+
+    if op == "eq":
+        test = lambda r: _scalar(r.get(column)) == arg
+    elif op == "neq":
+        test = lambda r: _scalar(r.get(column)) != arg
+    elif op in ("lt", "lte", "gt", "gte"):
+        compare = {"lt": str.__lt__, "lte": str.__le__, "gt": str.__gt__, "gte": str.__ge__}[op]
+        test = lambda r: r.get(column) is not None and compare(_scalar(r.get(column)), arg)
+    elif op == "in":
+        values = set(_split_list(arg.strip("()")))
+        test = lambda r: _scalar(r.get(column)) in values
+    elif op == "is":
+        wanted = {"null": None, "true": True, "false": False}[arg]
+        test = lambda r: r.get(column) is wanted
+    elif op == "cs":
+        values = _split_list(arg.strip("{}"))
+        test = lambda r: all(v in (r.get(column) or []) for v in values)
+    elif op in ("ilike", "like"):
+        pattern = re.escape(arg).replace("%", ".*").replace(r"\*", ".*")
+        regex = re.compile(f"^{pattern}$", re.IGNORECASE if op == "ilike" else 0)
+        test = lambda r: bool(regex.match(_scalar(r.get(column))))
+    else:
+        raise ValueError(f"Unsupported filter operator: {op}")
+
+    return (lambda r: not test(r)) if negate else test
+
+
+def _candidates(store: Store, table: str, params: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Rows to scan: use the id index for id=eq / id=in filters."""
+    if table == "all_articles":
+        for column, expression in params:
+            if column != "id":
+                continue
+            if expression.startswith("eq."):
+                row = store.articles_by_id.get(expression[3:])
+                return [row] if row else []
+            if expression.startswith("in."):
+                ids = _split_list(expression[3:].strip("()"))
+                return [store.articles_by_id[i] for i in ids if i in store.articles_by_id]
+    return store.tables[table]
+
+
+def _query(store: Store, table: str, request: Request) -> Tuple[List[Dict[str, Any]], int]:
+    """Apply a PostgREST query string. Returns (matching rows, total count)."""
+    params = list(request.query_params.multi_items())
+    reserved = {"select", "order", "limit", "offset", "columns", "on_conflict"}
+    filters = [_filter(c, e) for c, e in params if c not in reserved]
+
+    rows = [r for r in _candidates(store, table, params) if all(f(r) for f in filters)]
+
+    query = dict(params)
+    for clause in reversed((query.get("order") or "").split(",")):
+        if clause:
+            column, _, direction = clause.partition(".")
+            descending = direction.startswith("desc")
+            present = [r for r in rows if r.get(column) is not None]
+            missing = [r for r in rows if r.get(column) is None]
+            rows = sorted(present, key=lambda r: r[column], reverse=descending) + missing
+
+    total = len(rows)
+    offset = int(query.get("offset", 0))
+    limit = query.get("limit")
+    rows = rows[offset:offset + int(limit) if limit is not None else None]
+    return rows, total
+
+
+def _project(rows: List[Dict[str, Any]], select: Optional[str]) -> List[Dict[str, Any]]:
+    if not select or select == "*":
+        return [dict(r) for r in rows]
+    columns = [c.strip() for c in select.split(",")]
+    return [{c: r.get(c) for c in columns} for r in rows]
+
+
+# =============================================================================
+# Application
+# =============================================================================
+
+def create_app(store: Store, latency_ms: float = 0.0, jitter_ms: float = 0.0) -> Starlette:
+    """Build the stand-in ASGI app around a seeded store."""
+    stats: Counter = Counter()
+    documents: Dict[str, Dict[str, Any]] = {}
+    card_columns = [c.strip() for c in article_columns("card").split(",")]
+
+    def respond(content: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+        return Response(dumps(content), status_code=status, media_type="application/json", headers=headers)
+
+    async def delay() -> None:
+        if latency_ms or jitter_ms:
+            await asyncio.sleep(max(0.0, latency_ms + random.uniform(-jitter_ms, jitter_ms)) / 1000)
+
+    # --- PostgREST -----------------------------------------------------------
+
+    async def rest_table(request: Request) -> Response:
+        table = request.path_params["table"]
+        stats[f"postgrest {request.method} {table}"] += 1
+        await delay()
+
+        if table not in store.tables:
+            return respond({"code": "42P01", "message": f'relation "public.{table}" does not exist'}, 404)
+
+        try:
+            rows, total = _query(store, table, request)
+        except (ValueError, KeyError) as e:
+            return respond({"code": "PGRST100", "message": f"Failed to parse filter: {e}"}, 400)
+
+        if request.method == "PATCH":
+            updates = json.loads(await request.body())
+            for row in rows:
+                row.update(updates)
+        elif request.method == "DELETE":
+            doomed = {id(r) for r in rows}
+            store.tables[table] = [r for r in store.tables[table] if id(r) not in doomed]
+            if table == "all_articles":
+                for row in rows:
+                    store.articles_by_id.pop(row["id"], None)
+
+        headers = {}
+        if "count=exact" in request.headers.get("prefer", ""):
+            headers["Content-Range"] = f"0-{max(len(rows) - 1, 0)}/{total}"
+
+        return respond(_project(rows, request.query_params.get("select")), headers=headers)
+
+    async def rpc(request: Request) -> Response:
+        name = request.path_params["name"]
+        stats[f"postgrest RPC {name}"] += 1
+        await delay()
+
+        if name != "get_edition_bundle":
+            return respond({"code": "PGRST202", "message": f"Could not find the function public.{name}"}, 404)
+
+        params = json.loads(await request.body())
+        edition = store.edition_for(params["p_target"], params.get("p_today") or date.today().isoformat())
+        if edition is None:
+            return respond(None)
+
+        d = edition["edition_date"]
+        dates = [e["edition_date"] for e in store.tables["editions"]]
+        articles = [store.articles_by_id[i] for i in edition["article_ids"] if i in store.articles_by_id]
+        return respond({
+            "edition": edition,
+            "articles": [{c: a.get(c) for c in card_columns} for a in articles],
+            "prev_edition_date": max((x for x in dates if x < d), default=None),
+            "next_edition_date": min((x for x in dates if x > d), default=None),
+        })
+
+    # --- Typesense -------------------------------------------------------------
+
+    async def ts_collection(request: Request) -> Response:
+        stats[f"typesense {request.method} collection"] += 1
+        await delay()
+        name = request.path_params.get("name", "articles")
+        return respond({"name": name, "num_documents": len(documents), "fields": []})
+
+    async def ts_document(request: Request) -> Response:
+        stats[f"typesense {request.method} document"] += 1
+        await delay()
+
+        doc_id = request.path_params.get("doc_id")
+        if request.method == "GET":
+            doc = documents.get(doc_id)
+            return respond(doc) if doc else respond({"message": "Could not find a document with that id"}, 404)
+        if request.method == "DELETE":
+            doc = documents.pop(doc_id, None)
+            return respond(doc) if doc else respond({"message": "Could not find a document with that id"}, 404)
+
+        doc = json.loads(await request.body())
+        documents[str(doc["id"])] = doc
+        return respond(doc, 201)
+
+    async def ts_import(request: Request) -> Response:
+        stats["typesense POST import"] += 1
+        await delay()
+
+        lines = [line for line in (await request.body()).splitlines() if line.strip()]
+        for line in lines:
+            doc = json.loads(line)
+            documents[str(doc["id"])] = doc
+        return Response("\n".join('{"success":true}' for _ in lines), media_type="text/plain")
+
+    async def ts_health(request: Request) -> Response:
+        return respond({"ok": True})
+
+    # --- Control ---------------------------------------------------------------
+
+    async def catalog(request: Request) -> Response:
+        return respond({
+            "editions": [
+                {
+                    "edition_date": e["edition_date"],
+                    "articles": [
+                        [aid, store.articles_by_id[aid].get("slug")]
+                        for aid in e["article_ids"] if aid in store.articles_by_id
+                    ],
+                }
+                for e in sorted(store.tables["editions"], key=lambda e: e["edition_date"])
+            ],
+        })
+
+    async def publish(request: Request) -> Response:
+        return respond(store.publish_next())
+
+    async def get_stats(request: Request) -> Response:
+        return respond(dict(stats))
+
+    return Starlette(routes=[
+        Route("/rest/v1/rpc/{name}", rpc, methods=["POST"]),
+        Route("/rest/v1/{table}", rest_table, methods=["GET", "HEAD", "PATCH", "DELETE"]),
+        Route("/collections", ts_collection, methods=["POST"]),
+        Route("/collections/{name}", ts_collection, methods=["GET", "DELETE"]),
+        Route("/collections/{name}/documents/", ts_document, methods=["POST"]),
+        Route("/collections/{name}/documents/import", ts_import, methods=["POST"]),
+        Route("/collections/{name}/documents/{doc_id}", ts_document, methods=["GET", "DELETE"]),
+        Route("/health", ts_health),
+        Route("/_control/catalog", catalog),
+        Route("/_control/publish", publish, methods=["POST"]),
+        Route("/_control/stats", get_stats),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--editions", type=int, default=365, help="Daily editions to seed (ending yesterday)")
+    parser.add_argument("--articles", type=int, default=fixtures.ARTICLES_PER_EDITION, help="Articles per edition")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=25.0, help="Added to every request (cloud round-trip)")
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    store = Store(args.editions, args.articles, args.seed)
+    print(f"[STAND-IN] Seeded {len(store.tables['editions'])} editions, "
+          f"{len(store.tables['all_articles'])} articles; listening on {args.host}:{args.port}")
+
+    app = create_app(store, args.latency_ms, args.jitter_ms)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,18 @@
 // src/hooks/useEditions.ts
 /**
  * React Query hooks for fetching editions and articles.
+ *
+ * Editions are requested in the current language, so the API returns
+ * already-translated text and the cache holds one entry per language.
  */
 
-import { useQuery } from "@tanstack/react-query";
+import { useEffect } from "react";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { api } from "@/lib/api";
+import { getBootToday } from "@/lib/boot";
+import { useLanguage } from "@/lib/language";
 import {
+  type ArticleBySlug,
   type Digest,
   type EditionSummary,
   mapEditionDetailToDigest,
@@ -14,14 +21,22 @@ import {
 
 /**
  * Fetch today's (or latest) digest.
+ *
+ * Starts from the edition inlined into the home page, when there is one
+ * in the current language.
  */
 export function useTodayDigest() {
+  const { language } = useLanguage();
+  const boot = getBootToday(language);
+
   return useQuery<Digest>({
-    queryKey: ["edition", "today"],
+    queryKey: ["edition", "today", language],
     queryFn: async () => {
-      const data = await api.getToday();
+      const data = await api.getToday(language);
       return mapEditionDetailToDigest(data);
     },
+    initialData: boot ? () => mapEditionDetailToDigest(boot.data) : undefined,
+    initialDataUpdatedAt: boot?.updatedAt,
     staleTime: 5 * 60 * 1000, // 5 minutes
     refetchOnWindowFocus: true,
   });
@@ -31,10 +46,12 @@ export function useTodayDigest() {
  * Fetch a specific edition by date.
  */
 export function useEditionByDate(date: string) {
+  const { language } = useLanguage();
+
   return useQuery<Digest>({
-    queryKey: ["edition", date],
+    queryKey: ["edition", date, language],
     queryFn: async () => {
-      const data = await api.getEditionByDate(date);
+      const data = await api.getEditionByDate(date, language);
       return mapEditionDetailToDigest(data);
     },
     enabled: !!date,
@@ -42,6 +59,39 @@ export function useEditionByDate(date: string) {
   });
 }
 
+/**
+ * Fetch one article by date and slug.
+ *
+ * Prefetches the neighbouring articles so swiping between them is instant.
+ */
+export function useArticleBySlug(date: string, slug: string) {
+  const { language } = useLanguage();
+  const queryClient = useQueryClient();
+
+  const query = useQuery<ArticleBySlug>({
+    queryKey: ["article", date, slug, language],
+    queryFn: () => api.getArticleBySlug(date, slug, language),
+    enabled: !!date && !!slug,
+    staleTime: 10 * 60 * 1000,
+  });
+
+  const prevSlug = query.data?.prev_article?.slug;
+  const nextSlug = query.data?.next_article?.slug;
+
+  useEffect(() => {
+    for (const neighbour of [prevSlug, nextSlug]) {
+      if (!neighbour) continue;
+      queryClient.prefetchQuery({
+        queryKey: ["article", date, neighbour, language],
+        queryFn: () => api.getArticleBySlug(date, neighbour, language),
+        staleTime: 10 * 60 * 1000,
+      });
+    }
+  }, [queryClient, date, language, prevSlug, nextSlug]);
+
+  return query;
+}
+
 /**
  * Fetch archive list (edition summaries).
  */
@@ -3,7 +3,8 @@
  * API client for ADUmedia website
  */
 
-import type { EditionSummary, EditionDetail, ArticleDetail } from "./types";
+import type { EditionSummary, EditionDetail, ArticleDetail, ArticleBySlug } from "./types";
+import type { Language } from "./cookies";
 
 const API_BASE = import.meta.env.VITE_API_URL || "";
 
@@ -41,6 +42,10 @@ async function request<T>(
   return response.json();
 }
 
+// Query string asking the API to resolve translations server-side
+const langQuery = (lang?: Language): string =>
+  lang ? `?lang=${encodeURIComponent(lang)}` : "";
+
 // =============================================================================
 // Public API
 // =============================================================================
@@ -53,16 +58,23 @@ export const api = {
       has_more: boolean;
     }>(`/api/editions?limit=${limit}&offset=${offset}`),
 
-  // Get today's (or latest) edition
-  getToday: () => request<EditionDetail>("/api/editions/today"),
+  // Get today's (or latest) edition, localized if lang is given
+  getToday: (lang?: Language) =>
+    request<EditionDetail>(`/api/editions/today${langQuery(lang)}`),
+
+  // Get edition by date, localized if lang is given
+  getEditionByDate: (date: string, lang?: Language) =>
+    request<EditionDetail>(`/api/editions/${date}${langQuery(lang)}`),
 
-  // Get edition by date
-  getEditionByDate: (date: string) =>
-    request<EditionDetail>(`/api/editions/${date}`),
+  // Get an article by its public URL, with prev/next navigation
+  getArticleBySlug: (date: string, slug: string, lang?: Language) =>
+    request<ArticleBySlug>(
+      `/api/article/${date}/${encodeURIComponent(slug)}${langQuery(lang)}`
+    ),
 
-  // Get single article
-  getArticle: (id: string) =>
-    request<ArticleDetail & { editor_notes?: string }>(`/api/articles/${id}`),
+  // Get single article (all translations unless lang is given)
+  getArticle: (id: string, lang?: Language) =>
+    request<ArticleDetail & { editor_notes?: string }>(`/api/articles/${id}${langQuery(lang)}`),
 
   // =============================================================================
   // Admin API
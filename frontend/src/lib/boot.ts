@@ -0,0 +1,48 @@
+// src/lib/boot.ts
+/**
+ * Boot payload inlined into the home page by the backend (prerender.py)
+ *
+ * Holds today's edition as /api/editions/today returned it, so the home
+ * page renders without waiting for that request.
+ */
+
+import type { Language } from "./cookies";
+import type { EditionDetail } from "./types";
+
+const BOOT_ELEMENT_ID = "boot-data";
+
+interface BootPayload {
+  lang: Language;
+  today: EditionDetail;
+}
+
+let boot: BootPayload | null | undefined;
+
+// When the page was loaded; the payload is at least this fresh
+const bootedAt = Date.now();
+
+function readBootPayload(): BootPayload | null {
+  if (boot === undefined) {
+    boot = null;
+    const element = typeof document !== "undefined" ? document.getElementById(BOOT_ELEMENT_ID) : null;
+    if (element?.textContent) {
+      try {
+        boot = JSON.parse(element.textContent) as BootPayload;
+      } catch (error) {
+        console.error("[Boot] Invalid boot payload:", error);
+      }
+    }
+  }
+  return boot;
+}
+
+/**
+ * Today's edition from the boot payload, if it is in the given language.
+ */
+export function getBootToday(language: Language): { data: EditionDetail; updatedAt: number } | undefined {
+  const payload = readBootPayload();
+  if (!payload || payload.lang !== language) {
+    return undefined;
+  }
+  return { data: payload.today, updatedAt: bootedAt };
+}
@@ -3,12 +3,11 @@
  * Language context and hooks for ADUmedia website
  */
 
-import { createContext, useContext, useState, useEffect, ReactNode } from "react";
+import { createContext, useContext, useState, ReactNode } from "react";
 import {
   Language,
   getLanguagePreference,
   setLanguagePreference,
-  DEFAULT_LANGUAGE,
 } from "./cookies";
 
 interface LanguageContextType {
@@ -19,14 +18,13 @@ interface LanguageContextType {
 const LanguageContext = createContext<LanguageContextType | null>(null);
 
 export const LanguageProvider = ({ children }: { children: ReactNode }) => {
-  const [language, setLanguageState] = useState<Language>(DEFAULT_LANGUAGE);
-
-  // Load language preference on mount
-  useEffect(() => {
+  // Read the cookie before the first render, so the first queries (and
+  // the home page's boot payload) are in the saved language
+  const [language, setLanguageState] = useState<Language>(() => {
     const savedLanguage = getLanguagePreference();
     console.log(`[Language] Initial language loaded: ${savedLanguage}`);
-    setLanguageState(savedLanguage);
-  }, []);
+    return savedLanguage;
+  });
 
   // Update language and save to cookie
   const setLanguage = (lang: Language) => {
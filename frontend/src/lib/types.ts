@@ -46,6 +46,26 @@ export interface ArticleDetail {
   headline_line_1_translations?: Record<string, string>;
   headline_line_2_translations?: Record<string, string>;
   ai_summary_translations?: Record<string, string>;
+  lang?: string;              // Set when the API resolved translations (?lang=)
+}
+
+export interface ArticleNeighbour {
+  id: string;
+  slug: string;
+}
+
+/**
+ * Response of /api/article/{date}/{slug}: one article plus navigation context.
+ */
+export interface ArticleBySlug {
+  article: ArticleDetail;
+  edition: EditionSummary;
+  position: number;             // 0-based index within the edition
+  total: number;
+  prev_article: ArticleNeighbour | null;
+  next_article: ArticleNeighbour | null;
+  prev_edition_date: string | null;
+  next_edition_date: string | null;
 }
 
 // =============================================================================
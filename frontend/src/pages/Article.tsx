@@ -5,6 +5,7 @@
  *
  * Features:
  * - Smooth horizontal slide-in animation (matching original ArticleView)
+ * - Loads only this article (/api/article/:date/:slug); neighbours are prefetched
  * - Swipe left/right to navigate between articles in the same edition
  * - Direction-aware slide animations for swiping
  * - Keyboard arrow key support on desktop
@@ -12,17 +13,17 @@
  * - No scroll jump on initial load — scroll resets only after exit animation
  */
 
-import { useState, useEffect, useCallback, useRef } from "react";
+import { useState, useEffect, useCallback, useMemo, useRef } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import { motion, AnimatePresence, type PanInfo } from "framer-motion";
 import { ArrowLeft, ExternalLink, ChevronLeft, ChevronRight } from "lucide-react";
 import Footer from "@/components/Footer";
 import LoadingSpinner from "@/components/LoadingSpinner";
 import ErrorMessage from "@/components/ErrorMessage";
-import { useEditionByDate } from "@/hooks/useEditions";
+import { useArticleBySlug } from "@/hooks/useEditions";
 import { useLanguage, getTranslatedContent } from "@/lib/language";
 import { t, translateDay, translateDate } from "@/lib/translations";
-import type { Article as ArticleType } from "@/lib/types";
+import { mapArticleDetailToArticle, type ArticleNeighbour } from "@/lib/types";
 
 // Swipe threshold
 const SWIPE_THRESHOLD = 80;
@@ -62,23 +63,22 @@ const ArticlePage = () => {
   const [direction, setDirection] = useState(1); // 1 = from right on first load
   const scrollContainerRef = useRef<HTMLDivElement>(null);
 
-  // Load the edition to get article list for navigation
-  const { data: digest, isLoading: editionLoading } = useEditionByDate(date || "");
+  // Load the article with its position and neighbours in the edition
+  const { data, isLoading: articleLoading } = useArticleBySlug(date || "", slug || "");
 
-  // Find current article by matching slug
-  const currentIndex = digest?.articles.findIndex((a) => a.slug === slug) ?? -1;
-  const currentArticle = currentIndex >= 0 ? digest?.articles[currentIndex] : null;
-  const totalArticles = digest?.articles.length || 0;
+  const currentIndex = data ? data.position : -1;
+  const currentArticle = useMemo(
+    () => (data ? mapArticleDetailToArticle(data.article) : null),
+    [data]
+  );
+  const totalArticles = data?.total || 0;
 
-  const prevArticle = currentIndex > 0 ? digest?.articles[currentIndex - 1] : null;
-  const nextArticle =
-    currentIndex >= 0 && currentIndex < totalArticles - 1
-      ? digest?.articles[currentIndex + 1]
-      : null;
+  const prevArticle = data?.prev_article ?? null;
+  const nextArticle = data?.next_article ?? null;
 
   // Navigate to another article (swipe)
   const goToArticle = useCallback(
-    (article: ArticleType, dir: number) => {
+    (article: ArticleNeighbour, dir: number) => {
       isInitialLoad.current = false;
       setDirection(dir);
       navigate(`/article/${date}/${article.slug}`, { replace: true });
@@ -125,11 +125,10 @@ const ArticlePage = () => {
 
   // Back label - translated
   const getBackLabel = () => {
-    if (!digest) return t("back", language);
-    const parts = digest.date.split(" ");
-    const translatedDay = translateDay(digest.dayOfWeek, language);
-    const translatedDate = `${parts[0]} ${parts[1]}`;
-    return `${translatedDay}, ${translateDate(digest.date, language).split(" ").slice(0, 2).join(" ")}`;
+    if (!data) return t("back", language);
+    const { date_formatted, day_of_week } = data.edition;
+    const translatedDay = translateDay(day_of_week, language);
+    return `${translatedDay}, ${translateDate(date_formatted, language).split(" ").slice(0, 2).join(" ")}`;
   };
 
   // Reset scroll ONLY after exit animation completes (prevents diagonal jump)
@@ -138,7 +137,7 @@ const ArticlePage = () => {
   };
 
   // Loading state
-  if (editionLoading) {
+  if (articleLoading) {
     return (
       <div className="min-h-screen flex flex-col bg-background safe-area-top">
         <div className="flex-1 flex items-center justify-center">
@@ -339,9 +338,9 @@ const ArticlePage = () => {
                 <ChevronLeft className="w-4 h-4" />
                 {t("previous", language)}
               </button>
-            ) : digest?.prevEditionDate ? (
+            ) : data?.prev_edition_date ? (
               <button
-                onClick={() => navigate(`/digest/${digest.prevEditionDate}`)}
+                onClick={() => navigate(`/digest/${data.prev_edition_date}`)}
                 className="flex items-center gap-1 text-sm text-muted-foreground hover:text-foreground transition-colors"
               >
                 <ChevronLeft className="w-4 h-4" />
@@ -360,9 +359,9 @@ const ArticlePage = () => {
                 {t("next", language)}
                 <ChevronRight className="w-4 h-4" />
               </button>
-            ) : digest?.nextEditionDate ? (
+            ) : data?.next_edition_date ? (
               <button
-                onClick={() => navigate(`/digest/${digest.nextEditionDate}`)}
+                onClick={() => navigate(`/digest/${data.next_edition_date}`)}
                 className="flex items-center gap-1 text-sm text-muted-foreground hover:text-foreground transition-colors"
               >
                 {t("next_day", language)}